@@ -5,7 +5,7 @@ from .app.adapters.persistence.reg.store import load_csvs, parse_factors, Factor
 from .app.domain.rules.review.normalize import normalize_review, sha1_of_text, dedupe_reviews
 from .app.domain.rules.review.scoring import score_text_against_factor, compute_review_factor_scores, select_top_factors_from_question
 from .app.domain.rules.review.retrieval import retrieve_evidence_reviews
-from .app.usecases.dialogue.session import DialogueSession, BotTurn
+from .app.usecases.dialogue.session import DialogueSession, BotTurn, select_top_factors
 
 __all__ = [
     # reg_store
@@ -28,4 +28,5 @@ __all__ = [
     # dialogue
     "DialogueSession",
     "BotTurn",
+    "select_top_factors",
 ]
@@ -0,0 +1,176 @@
+"""REG catalog: 프로세스 공유 Factor/Question 색인 (CSV mtime 기반 hot reload)
+
+`load_csvs`는 호출마다 데이터 디렉토리를 여러 번 rglob하고, 리뷰 CSV까지 읽고,
+Factor/Question CSV를 다시 파싱한다. 세션 생성/질문 조회마다 이 비용을 내지 않도록
+데이터 디렉토리별로 한 번 읽어 파싱한 결과(`RegCatalog`)를 공유한다.
+
+- 조회할 때마다 사용 중인 CSV 2개와 그 디렉토리의 mtime만 stat으로 확인한다
+  (디렉토리 mtime: 같은 디렉토리에 새 버전 파일 `reg_factor_v5.csv` 등이 추가된 경우).
+- 바뀌었으면 새 `RegCatalog`를 통째로 만든 뒤 참조만 교체한다 — 이미 받아 간 카탈로그는
+  그대로 유지되므로 요청 처리 중에 factor/question 구성이 섞이지 않는다.
+- 리로드 중 CSV 읽기/파싱이 실패하면 이전 카탈로그를 계속 쓰고, RELOAD_RETRY_SECONDS 뒤에 다시 시도한다.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .question_graph import QuestionGraph
+from .store import Factor, Question, find_reg_files, parse_factors, parse_questions, read_reg_csvs
+
+logger = logging.getLogger(__name__)
+
+
+def _mtimes(paths: Tuple[Path, ...]) -> Tuple[Optional[int], ...]:
+    out = []
+    for p in paths:
+        try:
+            out.append(p.stat().st_mtime_ns)
+        except OSError:
+            out.append(None)
+    return tuple(out)
+
+
+@dataclass(frozen=True, eq=False)
+class RegCatalog:
+    """파싱된 Factor/Question과 색인 (읽기 전용으로 공유)"""
+    factors_fp: Path
+    questions_fp: Path
+    factors: Tuple[Factor, ...]
+    questions: Tuple[Question, ...]
+    factors_df: pd.DataFrame     # 원본 CSV (문자열 컬럼) - DataFrame 기반 헬퍼용, 수정 금지
+    questions_df: pd.DataFrame
+    factors_by_id: Dict[int, Factor] = field(default_factory=dict)
+    factors_by_key: Dict[Tuple[str, str], Factor] = field(default_factory=dict)  # (category, factor_key) - key는 카테고리 간 중복됨
+    factors_by_category: Dict[str, Tuple[Factor, ...]] = field(default_factory=dict)
+    questions_by_factor_id: Dict[int, Tuple[Question, ...]] = field(default_factory=dict)
+    questions_by_category: Dict[str, Tuple[Question, ...]] = field(default_factory=dict)
+    question_graphs: Dict[str, QuestionGraph] = field(default_factory=dict)  # 카테고리 → 컴파일된 질문 그래프
+    products_by_name: Dict[str, Tuple[str, str]] = field(default_factory=dict)  # 상품명 → (category, category_name), CSV 첫 행 기준
+    watched: Tuple[Path, ...] = ()                      # mtime 확인 대상 (CSV 2개 + 디렉토리)
+    mtimes: Tuple[Optional[int], ...] = ()
+
+    @classmethod
+    def load(cls, data_dir: Path) -> "RegCatalog":
+        """데이터 디렉토리에서 최신 버전 CSV를 찾아 읽고 파싱"""
+        factors_fp, questions_fp = find_reg_files(data_dir)
+        watched = tuple(dict.fromkeys((factors_fp, questions_fp, factors_fp.parent, questions_fp.parent)))
+        mtimes = _mtimes(watched)  # 읽기 전에 기록 (읽는 중 수정되면 다음 조회에서 다시 로드)
+        factors_df, questions_df = read_reg_csvs(factors_fp, questions_fp)
+        factors = tuple(parse_factors(factors_df))
+        questions = tuple(parse_questions(questions_df))
+
+        by_category: Dict[str, List[Factor]] = {}
+        for f in factors:
+            by_category.setdefault(f.category, []).append(f)
+        categories_of_id: Dict[int, List[str]] = {}
+        for f in factors:
+            categories_of_id.setdefault(f.factor_id, []).append(f.category)
+
+        q_by_factor: Dict[int, List[Question]] = {}
+        q_by_category: Dict[str, List[Question]] = {}
+        for q in questions:
+            q_by_factor.setdefault(q.factor_id, []).append(q)
+            for category in dict.fromkeys(categories_of_id.get(q.factor_id, ())):
+                q_by_category.setdefault(category, []).append(q)
+
+        products: Dict[str, Tuple[str, str]] = {}
+        if {"product_name", "category", "category_name"}.issubset(factors_df.columns):
+            for name, category, category_name in zip(
+                factors_df["product_name"], factors_df["category"], factors_df["category_name"]
+            ):
+                products.setdefault(name, (category, category_name))
+
+        return cls(
+            factors_fp=factors_fp,
+            questions_fp=questions_fp,
+            factors=factors,
+            questions=questions,
+            factors_df=factors_df,
+            questions_df=questions_df,
+            factors_by_id={f.factor_id: f for f in factors},
+            factors_by_key={(f.category, f.factor_key): f for f in factors},
+            factors_by_category={k: tuple(v) for k, v in by_category.items()},
+            questions_by_factor_id={k: tuple(v) for k, v in q_by_factor.items()},
+            questions_by_category={k: tuple(v) for k, v in q_by_category.items()},
+            question_graphs={k: QuestionGraph.compile(k, v) for k, v in q_by_category.items()},
+            products_by_name=products,
+            watched=watched,
+            mtimes=mtimes,
+        )
+
+    def is_stale(self) -> bool:
+        """CSV/디렉토리 mtime이 로드 시점과 다른지"""
+        return _mtimes(self.watched) != self.mtimes
+
+    def factors_for(self, category: str) -> List[Factor]:
+        """카테고리의 factor 리스트 (CSV 순서, 호출자가 수정해도 되는 새 리스트)"""
+        return list(self.factors_by_category.get(category, ()))
+
+    def factor(self, category: str, factor_key: str) -> Optional[Factor]:
+        return self.factors_by_key.get((category, factor_key))
+
+    def product(self, product_name: str) -> Optional[Tuple[str, str]]:
+        """상품명의 (category, category_name), 없으면 None"""
+        return self.products_by_name.get(product_name)
+
+    def questions_for(self, category: str) -> List[Question]:
+        """카테고리 factor에 속한 질문 리스트 (CSV 순서)"""
+        return list(self.questions_by_category.get(category, ()))
+
+    def question_graph(self, category: str) -> QuestionGraph:
+        """카테고리의 컴파일된 질문 그래프 (질문이 없으면 빈 그래프)"""
+        graph = self.question_graphs.get(category)
+        return graph if graph is not None else QuestionGraph.compile(category, ())
+
+
+RELOAD_RETRY_SECONDS = 30.0  # 리로드 실패 후 재시도 간격
+
+_catalogs: Dict[Path, RegCatalog] = {}
+_retry_after: Dict[Path, float] = {}  # 리로드 실패한 디렉토리 → 다음 시도 시각(monotonic)
+_lock = threading.Lock()
+
+
+def get_reg_catalog(data_dir: Union[str, Path]) -> RegCatalog:
+    """데이터 디렉토리의 REG 카탈로그 (프로세스 공유, CSV가 바뀌었으면 다시 로드)"""
+    key = Path(data_dir).resolve()
+    catalog = _catalogs.get(key)
+    if catalog is not None and (time.monotonic() < _retry_after.get(key, 0.0) or not catalog.is_stale()):
+        return catalog
+
+    with _lock:
+        # 다른 스레드가 먼저 다시 로드(또는 실패)했을 수 있음
+        current = _catalogs.get(key)
+        if current is not None and (
+            time.monotonic() < _retry_after.get(key, 0.0) or (current is not catalog and not current.is_stale())
+        ):
+            return current
+        try:
+            fresh = RegCatalog.load(key)
+        except Exception as e:
+            if current is None:
+                raise
+            _retry_after[key] = time.monotonic() + RELOAD_RETRY_SECONDS
+            logger.warning(f"[REG 카탈로그] 리로드 실패 - 이전 카탈로그 유지 ({RELOAD_RETRY_SECONDS:.0f}초 뒤 재시도): {e}")
+            return current
+        _catalogs[key] = fresh
+        _retry_after.pop(key, None)
+        logger.info(
+            f"[REG 카탈로그] {'리로드' if current is not None else '로드'}: "
+            f"{fresh.factors_fp.name}({len(fresh.factors)} factors), "
+            f"{fresh.questions_fp.name}({len(fresh.questions)} questions)"
+        )
+        return fresh
+
+
+def clear_reg_catalogs() -> None:
+    """카탈로그 캐시 비우기 (테스트/강제 리로드용)"""
+    with _lock:
+        _catalogs.clear()
+        _retry_after.clear()
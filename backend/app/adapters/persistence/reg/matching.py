@@ -1,27 +1,227 @@
-"""질문 -> Factor 매칭 로직"""
+"""질문 -> Factor 매칭 로직
+
+사용자 메시지를 factor에 매칭하는 로컬 유사도 색인 (네트워크 모델 없이 CPU만 사용).
+
+- factor 문서: display_name + anchor_terms + context_terms (context는 가중치 낮게)
+- 특징: 정규화 텍스트를 한글 자모로 분해(NFD)한 뒤 단어별 문자 n-gram → crc32 해시(고정 차원)
+  (자모 단위라 오타 한 글자/활용형 차이도 n-gram 대부분이 겹친다)
+- 가중치: TF-IDF (factor 문서 집합 기준 IDF) + L2 정규화 → 코사인 = 희소 내적
+- 색인은 특징(해시) 단위 압축 행렬(CSC와 같은 구조)이라 질의는 메시지 n-gram 수만큼의 슬라이스 합으로 끝난다
+- 해시가 프로세스와 무관하게 고정이라 미리 만들어 npz로 저장/로드할 수 있다
+"""
+from __future__ import annotations
+
+import json
 import logging
-from typing import List, Dict, Optional
+import math
+import unicodedata
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .store import Factor
+from ....domain.rules.review.normalize import normalize_text as normalize
 
 logger = logging.getLogger(__name__)
 
 
+NGRAM_SIZES = (2, 3, 4)      # 자모 단위 n-gram 길이
+N_FEATURES = 1 << 20         # 해시 특징 차원
+CONTEXT_TERM_WEIGHT = 0.3    # context term의 tf 가중치 (anchor = 1.0)
+DISPLAY_NAME_WEIGHT = 0.5    # display_name의 tf 가중치
+
+
+def char_ngrams(text: str) -> List[str]:
+    """정규화 → 한글 자모 분해 → 단어별(앞뒤 공백 패딩) 문자 n-gram"""
+    s = unicodedata.normalize("NFD", normalize(text))
+    grams: List[str] = []
+    for word in s.split():
+        w = f" {word} "
+        for n in NGRAM_SIZES:
+            grams.extend(w[i:i + n] for i in range(len(w) - n + 1))
+    return grams
+
+
+def hash_features(grams: Iterable[str]) -> np.ndarray:
+    """n-gram → 고정 해시 특징 번호 (crc32, 프로세스 간 동일)"""
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) & (N_FEATURES - 1) for g in grams), dtype=np.int64)
+
+
+def _factor_document(f: Factor) -> List[Tuple[str, float]]:
+    """factor → [(텍스트, tf 가중치)]"""
+    doc = [(t, 1.0) for t in f.anchor_terms if t]
+    doc += [(t, CONTEXT_TERM_WEIGHT) for t in f.context_terms if t]
+    if f.display_name:
+        doc.append((f.display_name, DISPLAY_NAME_WEIGHT))
+    return doc
+
+
+@dataclass
+class FactorSimilarityIndex:
+    """factor 문자 n-gram TF-IDF 색인
+
+    특징 feats[i]의 factor별 가중치는 `data[indptr[i]:indptr[i+1]]`,
+    해당 factor 위치는 `factor_idx[...]`에 저장된다.
+    """
+    factor_keys: List[str]
+    feats: np.ndarray       # int64, (n_feats,) 오름차순
+    idf: np.ndarray         # float64, (n_feats,)
+    indptr: np.ndarray      # int64, (n_feats + 1,)
+    factor_idx: np.ndarray  # int32, (nnz,)
+    data: np.ndarray        # float64, (nnz,) L2 정규화된 factor 벡터 값
+    unseen_idf: float       # 색인에 없는 특징의 IDF (질의 벡터 norm 계산용)
+
+    @classmethod
+    def build(cls, factors: Sequence[Factor]) -> "FactorSimilarityIndex":
+        """Factor 리스트에서 색인 생성"""
+        n = len(factors)
+        rows: List[np.ndarray] = []
+        cols: List[np.ndarray] = []
+        vals: List[np.ndarray] = []
+        for j, f in enumerate(factors):
+            for text, w in _factor_document(f):
+                h = hash_features(char_ngrams(text))
+                rows.append(h)
+                cols.append(np.full(len(h), j, dtype=np.int64))
+                vals.append(np.full(len(h), w, dtype=float))
+
+        h = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        c = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+        v = np.concatenate(vals) if vals else np.zeros(0, dtype=float)
+
+        # (특징, factor)별 tf 합산
+        pair = h * max(n, 1) + c
+        uniq, inv = np.unique(pair, return_inverse=True)
+        tf = np.bincount(inv, weights=v, minlength=len(uniq))
+        feat_of, factor_of = uniq // max(n, 1), (uniq % max(n, 1)).astype(np.int32)
+
+        feats, starts, df = np.unique(feat_of, return_index=True, return_counts=True)
+        idf = np.log((1.0 + n) / (1.0 + df)) + 1.0
+        weights = tf * np.repeat(idf, df)
+
+        # factor별 L2 정규화
+        norms = np.sqrt(np.bincount(factor_of, weights=weights ** 2, minlength=n))
+        weights = weights / np.where(norms[factor_of] > 0, norms[factor_of], 1.0)
+
+        indptr = np.zeros(len(feats) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(df)
+        index = cls(
+            factor_keys=[f.factor_key for f in factors],
+            feats=feats.astype(np.int64),
+            idf=idf,
+            indptr=indptr,
+            factor_idx=factor_of,
+            data=weights,
+            unseen_idf=math.log(1.0 + n) + 1.0,
+        )
+        logger.debug(f"[factor 유사도 색인] factors={n}, features={len(feats)}, nnz={len(weights)}")
+        return index
+
+    def similarities(self, text: str) -> np.ndarray:
+        """메시지와 각 factor의 코사인 유사도 (factor 순서)"""
+        scores = np.zeros(len(self.factor_keys), dtype=float)
+        h = hash_features(char_ngrams(text))
+        if len(h) == 0 or len(self.feats) == 0:
+            return scores
+
+        q_feats, q_tf = np.unique(h, return_counts=True)
+        pos = np.searchsorted(self.feats, q_feats)
+        pos_c = np.minimum(pos, len(self.feats) - 1)
+        known = self.feats[pos_c] == q_feats
+
+        q_w = q_tf * np.where(known, self.idf[pos_c], self.unseen_idf)
+        q_norm = float(np.sqrt((q_w ** 2).sum()))
+
+        # 질의에 있는 특징의 슬라이스만 모아 factor별로 합산 (희소 행렬 × 희소 벡터)
+        p = pos_c[known]
+        lo, hi = self.indptr[p], self.indptr[p + 1]
+        lengths = hi - lo
+        if lengths.sum() == 0:
+            return scores
+        idx = np.repeat(lo - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        contrib = self.data[idx] * np.repeat(q_w[known], lengths)
+        scores += np.bincount(self.factor_idx[idx], weights=contrib, minlength=len(self.factor_keys))
+        return scores / q_norm
+
+    def query(self, text: str, top_k: int = 3, threshold: float = 0.0) -> List[Tuple[str, float]]:
+        """메시지 → [(factor_key, 코사인)] 유사도 내림차순 (threshold 이상, 최대 top_k개)"""
+        sims = self.similarities(text)
+        order = np.argsort(-sims, kind="stable")[:top_k]
+        return [(self.factor_keys[j], float(sims[j])) for j in order if sims[j] > 0 and sims[j] >= threshold]
+
+    # ----------------------------- 저장/로드 -----------------------------
+
+    def save(self, path: Union[str, Path]) -> None:
+        """npz로 저장 (오프라인 빌드용)"""
+        meta = {"factor_keys": self.factor_keys, "unseen_idf": self.unseen_idf, "n_features": N_FEATURES, "ngram_sizes": list(NGRAM_SIZES)}
+        np.savez(
+            Path(path),
+            meta=np.array(json.dumps(meta, ensure_ascii=False)),
+            feats=self.feats, idf=self.idf, indptr=self.indptr,
+            factor_idx=self.factor_idx, data=self.data,
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "FactorSimilarityIndex":
+        """save()로 저장한 색인 로드 (특징 설정이 다르면 ValueError)"""
+        with np.load(Path(path)) as z:
+            meta = json.loads(str(z["meta"]))
+            if meta.get("n_features") != N_FEATURES or meta.get("ngram_sizes") != list(NGRAM_SIZES):
+                raise ValueError("factor 유사도 색인의 특징 설정이 현재 버전과 다릅니다")
+            return cls(
+                factor_keys=list(meta["factor_keys"]),
+                feats=z["feats"], idf=z["idf"], indptr=z["indptr"],
+                factor_idx=z["factor_idx"], data=z["data"],
+                unseen_idf=float(meta["unseen_idf"]),
+            )
+
+
+def _factor_signature(factors: Sequence[Factor]) -> tuple:
+    return tuple(
+        (f.factor_key, f.display_name, tuple(f.anchor_terms), tuple(f.context_terms))
+        for f in factors
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_index(signature: tuple) -> FactorSimilarityIndex:
+    factors = [
+        Factor(factor_id=0, factor_key=k, anchor_terms=list(a), context_terms=list(c), negation_terms=[], weight=1.0, display_name=d)
+        for k, d, a, c in signature
+    ]
+    return FactorSimilarityIndex.build(factors)
+
+
+def get_factor_similarity_index(factors: Sequence[Factor]) -> FactorSimilarityIndex:
+    """Factor 리스트(보통 카테고리 1개)에 대한 색인 (term 구성이 같으면 재사용)"""
+    return _build_index(_factor_signature(factors))
+
+
 def match_question_to_factors(
     question: str,
-    factor_store: Dict,
-    threshold: float = 0.7
+    factor_store: Union[Dict[str, Factor], Sequence[Factor]],
+    threshold: float = 0.1
 ) -> List[str]:
     """
     사용자 질문을 분석하여 관련 factor들을 찾음
-    
+
     Args:
         question: 사용자 질문
-        factor_store: Factor 데이터 저장소
-        threshold: 유사도 임계값
-        
+        factor_store: Factor 데이터 저장소 ({factor_key: Factor} 또는 Factor 리스트)
+        threshold: 코사인 유사도 임계값 (factor 문서가 term 목록이라 값이 작다 - 무관한 답변은 대부분 0.1 미만)
+
     Returns:
-        매칭된 factor ID 리스트
+        매칭된 factor_key 리스트 (유사도 내림차순)
     """
-    # TODO: 실제 매칭 로직 구현
-    # 현재는 placeholder
-    logger.info(f"질문 매칭: {question}")
-    return []
+    factors = list(factor_store.values()) if isinstance(factor_store, dict) else list(factor_store)
+    if not question or not factors:
+        return []
+
+    index = get_factor_similarity_index(factors)
+    matched = index.query(question, top_k=len(factors), threshold=threshold)
+    logger.info(f"질문 매칭: {question[:50]} → {[(k, round(s, 3)) for k, s in matched]}")
+    return [k for k, _ in matched]
@@ -0,0 +1,104 @@
+"""카테고리별 질문 그래프: factor → 질문 목록 색인 + next_factor_hint 간선 + 물어본 질문 비트셋
+
+다음 질문을 고를 때마다 전체 질문 목록(또는 questions DataFrame)을 훑지 않도록
+카테고리 질문을 한 번 컴파일해 둔다.
+
+- 질문 번호 i = 카테고리 질문의 CSV 순서, 세션의 "물어본 질문"은 int 비트셋(bit i)으로 관리
+- 같은 텍스트의 질문은 함께 물어본 것으로 친다 (텍스트 기준 중복 방지)
+- 질문 i의 next_factor_hint는 컴파일 시점에 대상 factor의 질문 번호 목록으로 풀어 둔다
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .store import Question
+
+
+def question_choices(q: Question) -> Optional[List[str]]:
+    """선택형 질문의 보기 목록 (그 외 None)"""
+    if q.choices and q.answer_type in ["single_choice", "multiple_choice"]:
+        return [c.strip() for c in q.choices.split("|") if c.strip()]
+    return None
+
+
+@dataclass(frozen=True, eq=False)
+class QuestionGraph:
+    """카테고리 1개의 컴파일된 질문 집합 (읽기 전용으로 공유)"""
+    category: str
+    questions: Tuple[Question, ...]                                       # 질문 번호 = CSV 순서
+    by_factor_id: Dict[int, Tuple[int, ...]] = field(default_factory=dict)     # factor_id → 질문 번호(CSV 순)
+    by_factor_key: Dict[str, Tuple[int, ...]] = field(default_factory=dict)    # 질문의 factor_key → 질문 번호(CSV 순)
+    by_priority: Dict[int, Tuple[int, ...]] = field(default_factory=dict)      # factor_id → 질문 번호(question_id 순)
+    id_index: Dict[str, int] = field(default_factory=dict)                     # str(question_id) → 질문 번호
+    text_masks: Dict[str, int] = field(default_factory=dict)                   # question_text → 같은 텍스트 질문 비트
+    hint_targets: Tuple[Tuple[int, ...], ...] = ()                             # 질문 번호 → hint factor의 질문 번호
+
+    @classmethod
+    def compile(cls, category: str, questions: Sequence[Question]) -> "QuestionGraph":
+        """카테고리 질문 리스트(CSV 순서)를 컴파일"""
+        questions = tuple(questions)
+        by_factor_id: Dict[int, List[int]] = {}
+        by_factor_key: Dict[str, List[int]] = {}
+        id_index: Dict[str, int] = {}
+        text_masks: Dict[str, int] = {}
+        for i, q in enumerate(questions):
+            by_factor_id.setdefault(q.factor_id, []).append(i)
+            by_factor_key.setdefault(q.factor_key, []).append(i)
+            id_index.setdefault(str(q.question_id), i)
+            text_masks[q.question_text] = text_masks.get(q.question_text, 0) | (1 << i)
+
+        by_key = {k: tuple(v) for k, v in by_factor_key.items()}
+        return cls(
+            category=category,
+            questions=questions,
+            by_factor_id={k: tuple(v) for k, v in by_factor_id.items()},
+            by_factor_key=by_key,
+            by_priority={
+                k: tuple(sorted(v, key=lambda i: questions[i].question_id))
+                for k, v in by_factor_id.items()
+            },
+            id_index=id_index,
+            text_masks=text_masks,
+            hint_targets=tuple(by_key.get(q.next_factor_hint, ()) if q.next_factor_hint else () for q in questions),
+        )
+
+    # ----------------------------- asked 비트셋 -----------------------------
+
+    def mark_asked(self, asked: int, question_id: Optional[object] = None, question_text: Optional[str] = None) -> int:
+        """물어본 질문 반영 (question_id 일치 질문 + 같은 텍스트 질문 전부)"""
+        if question_id is not None and str(question_id) in self.id_index:
+            asked |= 1 << self.id_index[str(question_id)]
+        if question_text:
+            asked |= self.text_masks.get(question_text, 0)
+        return asked
+
+    def first_unasked(self, indices: Iterable[int], asked: int) -> Optional[int]:
+        """indices 순서대로 아직 묻지 않은 첫 질문 번호"""
+        for i in indices:
+            if not (asked >> i) & 1:
+                return i
+        return None
+
+    # ----------------------------- 다음 질문 -----------------------------
+
+    def next_for_factor(self, factor_id: int, asked: int) -> Optional[int]:
+        """factor의 아직 묻지 않은 첫 질문 (CSV 순서)"""
+        return self.first_unasked(self.by_factor_id.get(factor_id, ()), asked)
+
+    def next_for_factor_key(self, factor_key: str, asked: int) -> Optional[int]:
+        """질문 factor_key 기준 아직 묻지 않은 첫 질문 (CSV 순서)"""
+        return self.first_unasked(self.by_factor_key.get(factor_key, ()), asked)
+
+    def next_by_hint(self, question_index: int, asked: int) -> Optional[int]:
+        """질문의 next_factor_hint가 가리키는 factor의 아직 묻지 않은 첫 질문"""
+        return self.first_unasked(self.hint_targets[question_index], asked)
+
+    def best_for_factors(self, factor_ids: Sequence[int], asked: int) -> Optional[int]:
+        """여러 factor의 미질문 중 question_id가 가장 작은 질문 (동률이면 앞선 factor, CSV 순)"""
+        best: Optional[int] = None
+        for fid in factor_ids:
+            i = self.first_unasked(self.by_priority.get(fid, ()), asked)
+            if i is not None and (best is None or self.questions[i].question_id < self.questions[best].question_id):
+                best = i
+        return best
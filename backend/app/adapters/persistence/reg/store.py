@@ -38,97 +38,98 @@ class Question:
     next_factor_hint: str
 
 
-def load_csvs(data_dir: Path) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """REG CSV 파일들 로드 (버전 자동 감지)"""
-    
-    def find_file(root: Path, name: str) -> Path:
+REVIEW_CSV_CANDIDATES = [
+    "reviews_sample.csv",
+    "reviews_final.csv",
+    "review_sample.csv",
+    "reviews.csv",
+    "reviews_data.csv",
+]
+
+
+def _find_any(root: Path, candidates: List[str]) -> Path:
+    for name in candidates:
         matches = list(root.rglob(name))
-        if not matches:
-            raise FileNotFoundError(f"Required file not found under {root}: {name}")
-        return matches[0]
-
-    def find_any(root: Path, candidates: List[str]) -> Path:
-        for name in candidates:
-            matches = list(root.rglob(name))
-            if matches:
-                return matches[0]
-        raise FileNotFoundError(f"None of candidate files found under {root}: {candidates}")
-    
-    def find_latest_versioned_file(root: Path, base_pattern: str) -> Path:
-        """
-        버전 번호가 포함된 파일 중 최신 버전을 찾음
-        예: reg_factor_v4.csv, reg_factor_v3.csv -> reg_factor_v4.csv 선택
-        """
-        # 패턴에서 확장자 분리
-        if base_pattern.endswith('.csv'):
-            base_name = base_pattern[:-4]  # .csv 제거
-            extension = '.csv'
-        else:
-            base_name = base_pattern
-            extension = ''
-        
-        # 버전 없는 파일과 버전 있는 파일 모두 찾기
-        pattern = f"{base_name}*.csv" if extension else f"{base_name}*"
-        all_matches = list(root.rglob(pattern))
-        
-        if not all_matches:
-            raise FileNotFoundError(f"No files found matching pattern: {pattern}")
-        
-        # 버전 정보 추출 및 정렬
-        versioned_files = []
-        base_file = None
-        
-        # 버전 패턴: _v숫자 형태
-        version_pattern = re.compile(rf'{re.escape(base_name)}_v(\d+)\.csv$')
-        
-        for file_path in all_matches:
-            filename = file_path.name
-            
-            # 정확히 base_pattern과 일치하는 파일 (버전 없음)
-            if filename == base_pattern:
-                base_file = file_path
-                continue
-            
-            # 버전 번호 추출
-            match = version_pattern.search(filename)
-            if match:
-                version_num = int(match.group(1))
-                versioned_files.append((version_num, file_path))
-        
-        # 버전 있는 파일이 있으면 가장 높은 버전 선택
-        if versioned_files:
-            versioned_files.sort(key=lambda x: x[0], reverse=True)
-            latest = versioned_files[0][1]
-            print(f"📌 Loading latest version: {latest.name}")
-            return latest
-        
-        # 버전 없는 기본 파일이 있으면 그것 사용
-        if base_file:
-            print(f"📌 Loading base file: {base_file.name}")
-            return base_file
-        
-        # 아무것도 없으면 에러
-        raise FileNotFoundError(f"No valid files found for pattern: {base_pattern}")
+        if matches:
+            return matches[0]
+    raise FileNotFoundError(f"None of candidate files found under {root}: {candidates}")
+
+
+def _find_latest_versioned_file(root: Path, base_pattern: str) -> Path:
+    """
+    버전 번호가 포함된 파일 중 최신 버전을 찾음
+    예: reg_factor_v4.csv, reg_factor_v3.csv -> reg_factor_v4.csv 선택
+    """
+    # 패턴에서 확장자 분리
+    if base_pattern.endswith('.csv'):
+        base_name = base_pattern[:-4]  # .csv 제거
+        extension = '.csv'
+    else:
+        base_name = base_pattern
+        extension = ''
+
+    # 버전 없는 파일과 버전 있는 파일 모두 찾기
+    pattern = f"{base_name}*.csv" if extension else f"{base_name}*"
+    all_matches = list(root.rglob(pattern))
+
+    if not all_matches:
+        raise FileNotFoundError(f"No files found matching pattern: {pattern}")
+
+    # 버전 정보 추출 및 정렬
+    versioned_files = []
+    base_file = None
+
+    # 버전 패턴: _v숫자 형태
+    version_pattern = re.compile(rf'{re.escape(base_name)}_v(\d+)\.csv$')
+
+    for file_path in all_matches:
+        filename = file_path.name
+
+        # 정확히 base_pattern과 일치하는 파일 (버전 없음)
+        if filename == base_pattern:
+            base_file = file_path
+            continue
 
-    # ✅ 리뷰 파일 (기존 로직 유지)
-    reviews_fp = find_any(
-        data_dir,
-        [
-            "reviews_sample.csv",
-            "reviews_final.csv",
-            "review_sample.csv",
-            "reviews.csv",
-            "reviews_data.csv",
-        ],
-    )
-    
-    # ✅ Factor와 Question은 버전 체크하여 최신 파일 로드
-    factors_fp = find_latest_versioned_file(data_dir, "reg_factor.csv")
-    questions_fp = find_latest_versioned_file(data_dir, "reg_question.csv")
+        # 버전 번호 추출
+        match = version_pattern.search(filename)
+        if match:
+            version_num = int(match.group(1))
+            versioned_files.append((version_num, file_path))
 
-    reviews = pd.read_csv(reviews_fp)     # dtype 고정하지 않음(유연)
+    # 버전 있는 파일이 있으면 가장 높은 버전 선택
+    if versioned_files:
+        versioned_files.sort(key=lambda x: x[0], reverse=True)
+        latest = versioned_files[0][1]
+        print(f"📌 Loading latest version: {latest.name}")
+        return latest
+
+    # 버전 없는 기본 파일이 있으면 그것 사용
+    if base_file:
+        print(f"📌 Loading base file: {base_file.name}")
+        return base_file
+
+    # 아무것도 없으면 에러
+    raise FileNotFoundError(f"No valid files found for pattern: {base_pattern}")
+
+
+def find_reg_files(data_dir: Path) -> Tuple[Path, Path]:
+    """최신 버전 Factor/Question CSV 경로 (factors_fp, questions_fp)"""
+    factors_fp = _find_latest_versioned_file(data_dir, "reg_factor.csv")
+    questions_fp = _find_latest_versioned_file(data_dir, "reg_question.csv")
+    return factors_fp, questions_fp
+
+
+def read_reg_csvs(factors_fp: Path, questions_fp: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Factor/Question CSV 읽기 (모든 컬럼 문자열)"""
     factors = pd.read_csv(factors_fp, dtype=str).fillna("")
     questions = pd.read_csv(questions_fp, dtype=str).fillna("")
+    return factors, questions
+
+
+def load_reviews_csv(data_dir: Path) -> pd.DataFrame:
+    """리뷰 CSV 로드 (review_id, rating, text 필수)"""
+    reviews_fp = _find_any(data_dir, REVIEW_CSV_CANDIDATES)
+    reviews = pd.read_csv(reviews_fp)     # dtype 고정하지 않음(유연)
 
     # ✅ created_at은 선택 컬럼으로 유연화
     required = {"review_id", "rating", "text"}
@@ -141,7 +142,20 @@ def load_csvs(data_dir: Path) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
 
     # 표준화: review_id는 문자열로
     reviews["review_id"] = reviews["review_id"].astype(str)
+    return reviews
+
+
+def load_csvs(data_dir: Path) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """REG CSV 파일들 로드 (버전 자동 감지)
 
+    Factor/Question만 필요하면 `catalog.get_reg_catalog` (프로세스 공유, 파싱 완료본)를 사용
+    """
+    # ✅ 리뷰 파일 (기존 로직 유지)
+    reviews = load_reviews_csv(data_dir)
+
+    # ✅ Factor와 Question은 버전 체크하여 최신 파일 로드
+    factors_fp, questions_fp = find_reg_files(data_dir)
+    factors, questions = read_reg_csvs(factors_fp, questions_fp)
     return reviews, factors, questions
 
 
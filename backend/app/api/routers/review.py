@@ -2,24 +2,39 @@
 
 리뷰 수집 및 분석 API
 """
+import asyncio
 import logging
 import random
+import time
+import uuid
 from typing import Optional
 from pathlib import Path
-import pandas as pd
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 
 from ...services.review_service import ReviewService
+from ...services.analysis_jobs import FINISHED_STATUSES, AnalysisJob, AnalysisJobsBusy, get_analysis_job_manager
+from ...services.product_analysis import (
+    ProductAnalysis,
+    build_product_analysis,
+    get_product_analysis_cache,
+    product_snapshot_key,
+)
 from ...core.settings import settings
 from ...infra.observability.metrics import (
     dialogue_turns_total, 
     track_errors, 
     user_journey_stage_total,
-    dialogue_completions_total
+    dialogue_completions_total,
+    analysis_jobs_total,
 )
-from ...adapters.persistence.reg.store import load_csvs, parse_factors
+from ...adapters.persistence.reg.catalog import get_reg_catalog
+from ...infra.concurrency.executors import run_cpu, run_io
+from ...infra.persistence.session_backend import get_session_backend
+from ...adapters.persistence.reg.question_graph import QuestionGraph
+from ...adapters.persistence.reg.store import Question
 from ...usecases.dialogue.session import DialogueSession
+from ...domain.rules.review.sentence_index import ReviewAnnotation, SentenceIndex
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +44,9 @@ router = APIRouter(prefix="/api/v2/reviews", tags=["reviews"])
 # Service 인스턴스
 _review_service: Optional[ReviewService] = None
 
-# 세션 캐시 (메모리)
-_session_cache: dict = {}  # {session_id: {scored_df, factors, category, product_name}}
+# 세션 저장소: settings.SESSION_BACKEND (memory / sqlite / redis) - get_session_backend()
+# 세션에는 대화 상태와 상품 분석(ProductAnalysis, 세션 간 공유) 참조만 저장
+# {session_id: {analysis, category, product_name, dialogue_history, question_history, current_question, ...}}
 
 # 공통 상수 import
 from ...usecases.dialogue.constants import CATEGORY_FALLBACK_QUESTIONS, DEFAULT_FALLBACK_QUESTIONS
@@ -106,6 +122,149 @@ class RateResponseResponse(BaseModel):
 
 # === Helper Functions ===
 
+async def _get_product_analysis(
+    service: ReviewService,
+    product_name: str,
+    category: str,
+    category_name: str,
+    expected_key: Optional[str] = None,
+) -> ProductAnalysis:
+    """상품 분석 (같은 리뷰 스냅샷 × factor 정의면 공유 캐시, 없으면 정규화/스코어링 → cpu 실행기)
+    
+    Args:
+        expected_key: 세션이 참조하던 분석 키 - 이 워커 캐시에 있으면 리뷰 파일을 다시 읽지 않음
+    
+    파일 기반 로더면 스냅샷 키를 파일 (경로, mtime, 크기)로 계산하므로, 캐시 적중 시 리뷰 파일을 읽지 않는다.
+    """
+    cache = get_product_analysis_cache()
+    if expected_key:
+        analysis = cache.get(expected_key)
+        if analysis is not None:
+            return analysis
+    
+    # 📊 사용자 여정: 리뷰 수집 단계 진입
+    user_journey_stage_total.labels(
+        stage="review_collection",
+        action="enter",
+        category=category
+    ).inc()
+    
+    # mtime/크기는 읽기 전에 확인 (읽는 중 파일이 바뀌면 다음 요청에서 새 키로 다시 분석)
+    loader = service._get_review_loader()
+    source = await run_io(loader.source_signature, category) if loader else None
+    review_df = None
+    if source is None:
+        review_df = await run_io(_load_review_data, category, service)
+    
+    factors = get_reg_catalog(get_data_dir()).factors_for(category)
+    if not factors:
+        raise HTTPException(
+            status_code=404,
+            detail=f"'{category_name}' 카테고리의 Factor를 찾을 수 없습니다"
+        )
+    
+    vendor = "smartstore"
+    if source is not None:
+        key = product_snapshot_key(product_name, factors, vendor, source=source)
+    else:
+        key = await run_cpu(product_snapshot_key, product_name, factors, vendor, raw_df=review_df)
+    if expected_key and key != expected_key:
+        logger.warning(f"세션의 상품 분석({expected_key[:12]})과 현재 리뷰/factor 스냅샷({key[:12]})이 다름 - 최신 분석 사용")
+    return await run_cpu(
+        cache.get_or_build,
+        key,
+        lambda: build_product_analysis(
+            service, key, product_name, category, category_name,
+            review_df if review_df is not None else _load_review_data(category, service),
+            factors, vendor=vendor,
+        ),
+    )
+
+
+async def _load_session(session_id: str, service: ReviewService) -> dict:
+    """세션 상태 로드 + 상품 분석 연결 (공유 백엔드에서 온 세션은 분석 참조로 복원)
+    
+    Raises:
+        HTTPException: 세션 없음(404) / 손상(500)
+    """
+    session_data = await _load_session_state(session_id)
+    if session_data is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+    
+    if session_data.get("analysis") is None:
+        ref = session_data.pop("analysis_ref", None)
+        if not ref:
+            raise HTTPException(status_code=500, detail="세션 데이터가 손상되었습니다")
+        session_data["analysis"] = await _get_product_analysis(
+            service, ref["product_name"], ref["category"], ref["category_name"], expected_key=ref["key"]
+        )
+    return session_data
+
+
+async def _load_session_state(session_id: str) -> Optional[dict]:
+    """세션 상태만 로드 (상품 분석 연결 없음, 공유 백엔드 세션은 analysis_ref 그대로)"""
+    backend = get_session_backend()
+    return await run_io(backend.load, session_id) if backend.blocking_io else backend.load(session_id)
+
+
+async def _save_session(session_id: str, session_data: dict) -> None:
+    """세션 상태 저장 (공유 백엔드/스냅샷은 직렬화 + I/O → io 실행기)"""
+    backend = get_session_backend()
+    if backend.blocking_io:
+        await run_io(backend.save, session_id, session_data)
+    else:
+        backend.save(session_id, session_data)
+
+
+def _analysis_result_key(job_id: str) -> str:
+    """공유 세션 백엔드에서 분석 작업 전체 결과를 따로 저장하는 키"""
+    return f"analysis-job-{job_id}"
+
+
+async def _record_analysis_job(session_id: str, job: AnalysisJob) -> None:
+    """분석 작업 상태를 세션에 기록 (다른 워커/재시작 후 상태 조회용) - 세션이 더 새 작업을 가리키면 무시
+    
+    세션에는 작업 요약(`AnalysisJob.record()`)만 남긴다. 공유 백엔드면 완료된 전체 결과를
+    별도 키에 한 번 저장해 다른 워커도 내려줄 수 있게 한다 (메모리 백엔드는 이 워커의 작업 저장소가 담당).
+    """
+    session_data = await _load_session_state(session_id)
+    if session_data is None or (session_data.get("analysis_job") or {}).get("job_id") != job.job_id:
+        return
+    backend = get_session_backend()
+    if job.status == "done" and backend.is_shared:
+        # 세션이 done을 가리키기 전에 결과부터 저장 (조회하는 워커가 결과 없는 done을 보지 않도록)
+        await _save_session(_analysis_result_key(job.job_id), {"analysis": job.analysis})
+    session_data["analysis_job"] = job.record()
+    await _save_session(session_id, session_data)
+
+
+async def _load_analysis_record(session_id: str) -> Optional[dict]:
+    """다른 워커의 분석 작업 상태 (세션의 작업 요약 + 공유 백엔드의 전체 결과), 없으면 None"""
+    session_data = await _load_session_state(session_id)
+    record = (session_data or {}).get("analysis_job")
+    if record is None:
+        return None
+    status = record["status"]
+    response = {
+        "job_id": record["job_id"],
+        "session_id": session_id,
+        "status": status,
+        "analysis": {"top_factors": record["top_factors"]} if record.get("top_factors") else None,
+        "error": record.get("error"),
+        "created_at": record["created_at"],
+        "updated_at": record["updated_at"],
+    }
+    if status == "done":
+        result = await _load_session_state(_analysis_result_key(record["job_id"]))
+        if result is None:
+            return {**response, "status": "failed", "error": "분석 결과가 만료되었습니다"}
+        response["analysis"] = result["analysis"]
+    elif time.time() - record["updated_at"] > settings.ANALYSIS_JOB_STALE_SECONDS and status not in FINISHED_STATUSES:
+        # 작업을 실행하던 워커가 끝난 상태를 기록하지 못하고 종료됨
+        return {**response, "status": "failed", "error": "분석 작업이 중단되었습니다"}
+    return response
+
+
 def _check_convergence(session_data: dict, min_turns: int = 3) -> bool:
     """수렴 조건 체크
     
@@ -125,103 +284,95 @@ def _check_convergence(session_data: dict, min_turns: int = 3) -> bool:
     return is_converged
 
 
+def _asked_questions_mask(session_data: dict, graph: QuestionGraph) -> int:
+    """세션의 물어본 질문 비트셋 (question_history에서 새로 추가된 항목만 반영)
+    
+    질문 번호는 카탈로그의 질문 그래프 기준이라, 카탈로그가 다시 로드되어 그래프가 바뀌면 처음부터 다시 계산
+    """
+    history = session_data.get("question_history", [])
+    state = session_data.get("asked_questions_state")  # (graph, 반영한 history 수, 비트셋)
+    if state is None or state[0] is not graph or state[1] > len(history):
+        state = (graph, 0, 0)
+    _, done, asked = state
+    for q in history[done:]:
+        asked = graph.mark_asked(asked, question_id=q.get("question_id") or None, question_text=q.get("question_text") or None)
+    session_data["asked_questions_state"] = (graph, len(history), asked)
+    return asked
+
+
+def _build_question_dict(question: Question, factor_key: str) -> dict:
+    """Question에서 질문 딕셔너리 생성"""
+    return {
+        "question_id": str(question.question_id),
+        "question_text": question.question_text,
+        "answer_type": question.answer_type,
+        "choices": question.choices.split('|') if question.choices else [],
+        "next_factor_hint": question.next_factor_hint,
+        "factor_key": factor_key
+    }
+
+
 def _get_current_factor_next_question(
-    questions_df,
+    graph: QuestionGraph,
     current_factor_key: str,
     current_factor_id: int,
-    asked_ids: set,
-    asked_texts: set
+    asked: int
 ) -> Optional[dict]:
     """현재 factor의 다음 질문 찾기
     
     Args:
-        questions_df: 질문 DataFrame
+        graph: 카테고리 질문 그래프
         current_factor_key: 현재 factor key
         current_factor_id: 현재 factor ID
-        asked_ids: 이미 물어본 질문 ID 집합
-        asked_texts: 이미 물어본 질문 텍스트 집합
+        asked: 이미 물어본 질문 비트셋
         
     Returns:
         dict: 다음 질문 정보 또는 None
     """
-    # factor_id로 정확히 매칭되는 질문만 찾기
-    all_questions = questions_df[questions_df['factor_id'] == current_factor_id]
-    logger.info(f"Factor '{current_factor_key}' (factor_id={current_factor_id}) 전체 질문: {len(all_questions)}개")
-    
-    # 아직 묻지 않은 질문 필터링
-    related_questions = all_questions[
-        (~all_questions['question_id'].isin(asked_ids)) &
-        (~all_questions['question_text'].isin(asked_texts))
-    ]
+    # factor_id로 정확히 매칭되는 질문 중 아직 묻지 않은 첫 질문
+    i = graph.next_for_factor(current_factor_id, asked)
+    logger.info(f"Factor '{current_factor_key}' (factor_id={current_factor_id}) 전체 질문: {len(graph.by_factor_id.get(current_factor_id, ()))}개")
     
-    logger.info(f"아직 묻지 않은 질문: {len(related_questions)}개")
-    
-    if len(related_questions) > 0:
-        next_q = related_questions.iloc[0]
-        question = {
-            "question_id": next_q['question_id'],
-            "question_text": next_q['question_text'],
-            "answer_type": next_q['answer_type'],
-            "choices": next_q['choices'].split('|') if next_q.get('choices') else [],
-            "next_factor_hint": next_q.get('next_factor_hint', ''),
-            "factor_key": current_factor_key
-        }
-        logger.info(f"현재 factor '{current_factor_key}'의 다음 질문: question_id={next_q['question_id']}")
-        return question
+    if i is not None:
+        question = graph.questions[i]
+        logger.info(f"현재 factor '{current_factor_key}'의 다음 질문: question_id={question.question_id}")
+        return _build_question_dict(question, current_factor_key)
     
     return None
 
 
-def _filter_unasked_questions(questions_df, asked_ids: set, asked_texts: set):
-    """아직 묻지 않은 질문 필터링"""
-    return questions_df[
-        (~questions_df['question_id'].isin(asked_ids)) &
-        (~questions_df['question_text'].isin(asked_texts))
-    ]
-
-def _build_question_dict(question_row, factor_key: str) -> dict:
-    """질문 행에서 질문 딕셔너리 생성"""
-    return {
-        "question_id": question_row['question_id'],
-        "question_text": question_row['question_text'],
-        "answer_type": question_row['answer_type'],
-        "choices": question_row['choices'].split('|') if question_row.get('choices') else [],
-        "next_factor_hint": question_row.get('next_factor_hint', ''),
-        "factor_key": factor_key
-    }
-
 def _get_next_factor_question(
-    questions_df,
+    graph: QuestionGraph,
+    prev_question: dict,
     next_factor_key: str,
-    asked_ids: set,
-    asked_texts: set
+    asked: int
 ) -> Optional[dict]:
     """next_factor_hint로 다음 factor의 질문 찾기
     
     Args:
-        questions_df: 질문 DataFrame
+        graph: 카테고리 질문 그래프
+        prev_question: 방금 답변한 질문 정보
         next_factor_key: 다음 factor key
-        asked_ids: 이미 물어본 질문 ID 집합
-        asked_texts: 이미 물어본 질문 텍스트 집합
+        asked: 이미 물어본 질문 비트셋
         
     Returns:
         dict: 다음 질문 정보 또는 None
     """
-    next_factor_questions = questions_df[questions_df['factor_key'] == next_factor_key]
-    
-    if len(next_factor_questions) == 0:
+    if next_factor_key not in graph.by_factor_key:
         logger.info(f"CSV에서 next_factor_key '{next_factor_key}'를 찾을 수 없음")
         return None
     
-    next_unasked = _filter_unasked_questions(next_factor_questions, asked_ids, asked_texts)
-    next_factor_id = int(next_factor_questions.iloc[0]['factor_id'])
-    logger.info(f"다음 factor '{next_factor_key}' (factor_id={next_factor_id}) 질문: {len(next_factor_questions)}개, 미질문: {len(next_unasked)}개")
+    # 방금 답변한 질문이 그래프에 있으면 컴파일된 hint 간선을 그대로 따라감
+    prev_i = graph.id_index.get(str(prev_question.get("question_id")))
+    if prev_i is not None and graph.questions[prev_i].next_factor_hint == next_factor_key:
+        i = graph.next_by_hint(prev_i, asked)
+    else:
+        i = graph.next_for_factor_key(next_factor_key, asked)
     
-    if len(next_unasked) > 0:
-        next_q = next_unasked.iloc[0]
-        question = _build_question_dict(next_q, next_factor_key)
-        logger.info(f"다음 factor '{next_factor_key}'로 이동: question_id={next_q['question_id']}")
-        return question
+    if i is not None:
+        question = graph.questions[i]
+        logger.info(f"다음 factor '{next_factor_key}'로 이동: question_id={question.question_id}")
+        return _build_question_dict(question, next_factor_key)
     
     logger.info(f"다음 factor '{next_factor_key}'의 질문도 모두 소진됨")
     return None
@@ -265,25 +416,23 @@ def _get_fallback_question(session_data: dict, current_factor_key: str) -> Optio
     return None
 
 
-def _find_next_question(session_data: dict, questions_df, current_factor_key: str, current_factor: any) -> Optional[dict]:
+def _find_next_question(session_data: dict, graph: QuestionGraph, current_factor_key: str, current_factor: any) -> Optional[dict]:
     """다음 질문 찾기 (전체 로직)
     
     Args:
         session_data: 세션 데이터
-        questions_df: 질문 DataFrame
+        graph: 카테고리 질문 그래프
         current_factor_key: 현재 factor key
         current_factor: 현재 factor 객체
         
     Returns:
         dict: 다음 질문 정보 또는 None
     """
-    asked_ids = {q["question_id"] for q in session_data["question_history"] if q.get("question_id")}
-    asked_texts = {q["question_text"] for q in session_data["question_history"] if q.get("question_text")}
+    asked = _asked_questions_mask(session_data, graph)
     
     # 1. 현재 factor의 다음 질문 확인
     next_question = _get_current_factor_next_question(
-        questions_df, current_factor_key, current_factor.factor_id,
-        asked_ids, asked_texts
+        graph, current_factor_key, current_factor.factor_id, asked
     )
     
     if next_question:
@@ -298,8 +447,7 @@ def _find_next_question(session_data: dict, questions_df, current_factor_key: st
     
     if next_factor_key:
         next_question = _get_next_factor_question(
-            questions_df, next_factor_key,
-            asked_ids, asked_texts
+            graph, prev_question, next_factor_key, asked
         )
         
         if next_question:
@@ -314,49 +462,61 @@ def _find_next_question(session_data: dict, questions_df, current_factor_key: st
 # Helper Functions for get_factor_reviews
 # ============================================================================
 
-def _extract_matched_sentences(text: str, anchor_terms: list, max_length: int = 100) -> tuple[list, list]:
-    """anchor_term이 포함된 문장 추출
+def _extract_matched_sentences(annotation: ReviewAnnotation, anchor_terms: list, max_length: int = 100) -> tuple[list, list, list]:
+    """anchor_term이 포함된 문장 추출 (SentenceIndex 주석 사용)
     
     Args:
-        text: 리뷰 텍스트
+        annotation: 리뷰 문장/term 주석
         anchor_terms: 매칭할 키워드 리스트
         max_length: 문장 최대 길이
         
     Returns:
-        (matched_sentences, matched_terms) 튜플
+        (matched_sentences, matched_terms, highlights) 튜플
+        - highlights: 문장별 [{"term", "start", "end"}] (반환 문장 기준 위치)
     """
-    sentences = text.split('.')
     matched_sentences = []
     matched_terms = []
+    highlights = []
     
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if not sentence or len(sentence) < 10:
+    for sent in annotation.sentences:
+        sentence = sent.text
+        if len(sentence) < 10:
             continue
-            
-        for term in anchor_terms:
-            if term in sentence:
-                # 키워드 앞뒤 적당히 자르기
-                if len(sentence) > max_length:
-                    term_pos = sentence.find(term)
-                    start = max(0, term_pos - 30)
-                    end = min(len(sentence), term_pos + len(term) + 50)
-                    sentence = '...' + sentence[start:end] + '...'
-                
-                matched_sentences.append(sentence)
-                if term not in matched_terms:
-                    matched_terms.append(term)
-                break
-    
-    return matched_sentences, matched_terms
-
-
-def _build_review_samples(matched_df, target_factor, limit: int = 5) -> list:
+        
+        term = sent.first_hit(anchor_terms)
+        if term is None:
+            continue
+        
+        # 키워드 앞뒤 적당히 자르기
+        shift, lo, hi = 0, 0, len(sentence)
+        if len(sentence) > max_length:
+            offsets = sent.terms.get(term) or [0]
+            lo = max(0, offsets[0] - 30)
+            hi = min(len(sentence), offsets[0] + len(term) + 50)
+            sentence = '...' + sentence[lo:hi] + '...'
+            shift = 3 - lo
+        
+        marks = [
+            {"term": t, "start": off + shift, "end": off + len(t) + shift}
+            for t in anchor_terms
+            for off in sent.terms.get(t, ())
+            if lo <= off and off + len(t) <= hi
+        ]
+        matched_sentences.append(sentence)
+        highlights.append(sorted(marks, key=lambda m: m["start"]))
+        if term not in matched_terms:
+            matched_terms.append(term)
+    
+    return matched_sentences, matched_terms, highlights
+
+
+def _build_review_samples(matched_df, target_factor, sentence_index: SentenceIndex, limit: int = 5) -> list:
     """매칭된 리뷰에서 샘플 추출 (중복 제거)
     
     Args:
         matched_df: 매칭된 리뷰 DataFrame
         target_factor: Factor 객체
+        sentence_index: 리뷰 문장/term 주석 캐시
         limit: 최대 리뷰 개수
         
     Returns:
@@ -365,7 +525,7 @@ def _build_review_samples(matched_df, target_factor, limit: int = 5) -> list:
     reviews = []
     seen_texts = set()
     
-    for _, row in matched_df.iterrows():
+    for idx, row in matched_df.iterrows():
         text = row['text']
         
         # 중복 체크
@@ -373,8 +533,8 @@ def _build_review_samples(matched_df, target_factor, limit: int = 5) -> list:
             continue
         
         # 키워드 매칭 문장 추출
-        matched_sentences, matched_terms = _extract_matched_sentences(
-            text, 
+        matched_sentences, matched_terms, highlights = _extract_matched_sentences(
+            sentence_index.annotation(idx),
             target_factor.anchor_terms
         )
         
@@ -385,7 +545,8 @@ def _build_review_samples(matched_df, target_factor, limit: int = 5) -> list:
         reviews.append({
             "rating": int(row.get('rating', 0)),
             "sentences": matched_sentences[:3],  # 최대 3문장
-            "matched_terms": matched_terms
+            "matched_terms": matched_terms,
+            "highlights": highlights[:3]  # 문장별 키워드 위치 (프론트 하이라이트용)
         })
         
         seen_texts.add(text)
@@ -396,28 +557,25 @@ def _build_review_samples(matched_df, target_factor, limit: int = 5) -> list:
     return reviews
 
 
-def _load_factor_questions(factor_key: str) -> list:
+def _load_factor_questions(factor_key: str, category: str) -> list:
     """Factor에 해당하는 질문 로드
     
     Args:
         factor_key: Factor key
+        category: 세션 카테고리 (factor_key는 카테고리 간 중복됨)
         
     Returns:
         질문 리스트
     """
-    _, _, questions_df = load_csvs(get_data_dir())
-    
-    related_questions = questions_df[
-        questions_df['factor_key'] == factor_key
-    ].to_dict('records')
+    graph = get_reg_catalog(get_data_dir()).question_graph(category)
     
     return [{
-        "question_id": q['question_id'],
-        "question_text": q['question_text'],
-        "answer_type": q['answer_type'],
-        "choices": q['choices'].split('|') if q.get('choices') else [],
-        "next_factor_hint": q.get('next_factor_hint', '')
-    } for q in related_questions]
+        "question_id": str(q.question_id),
+        "question_text": q.question_text,
+        "answer_type": q.answer_type,
+        "choices": q.choices.split('|') if q.choices else [],
+        "next_factor_hint": q.next_factor_hint
+    } for q in (graph.questions[i] for i in graph.by_factor_key.get(factor_key, ()))]
 
 
 def _calculate_term_stats(reviews: list, anchor_terms: dict) -> dict:
@@ -445,23 +603,16 @@ def _add_to_dialogue_history(session_data: dict, user_message: str, assistant_me
     session_data["dialogue_history"].append({"role": "user", "message": user_message})
     session_data["dialogue_history"].append({"role": "assistant", "message": assistant_message})
 
-def _update_dialogue_with_factor_selection(session_id: str, target_factor, reviews: list, anchor_terms: dict, questions: list):
+def _update_dialogue_with_factor_selection(session_data: dict, target_factor, reviews: list, anchor_terms: dict, questions: list):
     """Factor 선택 시 대화 히스토리 업데이트
     
     Args:
-        session_id: 세션 ID
+        session_data: 세션 데이터
         target_factor: Factor 객체
         reviews: 리뷰 샘플 리스트
         anchor_terms: anchor_term 카운트 딕셔너리
         questions: 질문 리스트
     """
-    global _session_cache
-    
-    if session_id not in _session_cache:
-        return
-    
-    session_data = _session_cache[session_id]
-    
     # 매칭된 용어 통계 및 요약 메시지 생성
     term_stats = _calculate_term_stats(reviews, anchor_terms)
     review_summary = _create_review_summary_message(target_factor.display_name, term_stats)
@@ -477,12 +628,55 @@ def _update_dialogue_with_factor_selection(session_id: str, target_factor, revie
     logger.info(f"대화 히스토리 업데이트: {target_factor.display_name} 선택")
 
 
+def _collect_factor_reviews(session_data: dict, target_factor, limit: int) -> tuple:
+    """Factor 매칭 리뷰 수, anchor_term별 카운트, 리뷰 샘플 (get_factor_reviews의 계산 부분)
+    
+    Args:
+        session_data: 세션 데이터 (analysis: 공유 상품 분석)
+        target_factor: Factor 객체
+        limit: 리뷰 샘플 개수
+        
+    Returns:
+        (total_count, anchor_terms, reviews) 튜플
+    """
+    factor_key = target_factor.factor_key
+    analysis: ProductAnalysis = session_data["analysis"]
+    scored_df = analysis.scored_df
+    
+    # 3. 매칭된 리뷰 필터링 (점수는 분석의 점수 행렬에만 있음)
+    score_matrix = analysis.score_matrix
+    factor_idx = score_matrix.factor_index(factor_key)
+    if factor_idx is None:
+        raise HTTPException(status_code=404, detail=f"Factor '{factor_key}'의 점수를 찾을 수 없습니다")
+    
+    factor_postings = analysis.evidence_postings.get(factor_key)
+    if factor_postings is not None:
+        # 분석 시점에 만든 순위 목록 (점수 > 0, 내림차순) 그대로 사용
+        matched_df = scored_df.iloc[factor_postings.ranked_rows]
+    else:
+        # 점수 행렬의 열에서 바로 (점수 > 0, 내림차순) 행 위치를 얻음
+        matched_df = scored_df.iloc[score_matrix.ranked_rows(factor_idx)]
+    logger.info(f"매칭된 리뷰: {len(matched_df)}건")
+    
+    # 4. anchor_term별 카운트
+    anchor_terms = {}
+    for term in target_factor.anchor_terms:
+        count = matched_df['text'].str.contains(term, case=False, na=False).sum()
+        if count > 0:
+            anchor_terms[term] = int(count)
+    
+    # 5. 리뷰 샘플 생성 (helper 함수 사용, 문장 주석은 상품 분석에 캐시 - 같은 상품 세션끼리 공유)
+    reviews = _build_review_samples(matched_df, target_factor, analysis.sentence_index, limit)
+    
+    return len(matched_df), anchor_terms, reviews
+
+
 # ============================================================================
 # Helper Functions for analyze_product
 # ============================================================================
 
 def _load_product_info(product_name: str) -> tuple:
-    """Factor CSV에서 상품 정보 로드
+    """공유 REG 카탈로그(Factor CSV)에서 상품 정보 조회
     
     Args:
         product_name: 상품명
@@ -493,43 +687,34 @@ def _load_product_info(product_name: str) -> tuple:
     Raises:
         HTTPException: 파일 없음 또는 상품 없음
     """
-    factor_csv_path = get_data_dir() / "factor" / "reg_factor_v4.csv"
-    if not factor_csv_path.exists():
+    try:
+        catalog = get_reg_catalog(get_data_dir())
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Factor CSV 파일을 찾을 수 없습니다")
     
-    df = pd.read_csv(factor_csv_path)
-    
-    product_rows = df[df['product_name'] == product_name]
-    if product_rows.empty:
+    product = catalog.product(product_name)
+    if product is None:
         raise HTTPException(status_code=404, detail=f"'{product_name}' 상품을 찾을 수 없습니다")
     
-    return product_rows.iloc[0]['category'], product_rows.iloc[0]['category_name']
+    return product
 
 
 def _load_review_data(category: str, service: ReviewService):
-    """리뷰 파일 로드 및 정규화
+    """리뷰 파일 로드 (정규화는 상품 분석 캐시 미스일 때만)
     
     Args:
         category: 카테고리
         service: ReviewService 인스턴스
         
     Returns:
-        정규화된 리뷰 DataFrame
+        원본 리뷰 DataFrame
         
     Raises:
         HTTPException: 리뷰 파일 없음
     """
 
-    # 📊 사용자 여정: 리뷰 수집 단계 진입
-    user_journey_stage_total.labels(
-        stage="review_collection",
-        action="enter",
-        category=category
-    ).inc()
-
     loader = service._get_review_loader()
     review_df = None
-    vendor = "smartstore"
     
     if loader:
         review_df = loader.load_by_category(category=category, latest=True)
@@ -542,29 +727,9 @@ def _load_review_data(category: str, service: ReviewService):
             detail=f"카테고리 '{category}'의 리뷰 파일을 찾을 수 없습니다"
         )
     
-    return service.normalize_reviews(review_df, vendor=vendor)
+    return review_df
 
 
-def _extract_suggested_factors(top_factors: list, factors: list) -> list:
-    """Top factors에서 API 응답용 suggested factors 추출
-    
-    Args:
-        top_factors: [(factor_key, score), ...] 리스트
-        factors: Factor 객체 리스트
-        
-    Returns:
-        Suggested factors 리스트 (dict)
-    """
-    factor_map = {f.factor_key: f for f in factors}
-    return [
-        {
-            "factor_id": factor_map[factor_key].factor_id,
-            "factor_key": factor_key,
-            "display_name": factor_map[factor_key].display_name
-        }
-        for factor_key, score in top_factors
-    ]
-
 def _create_initial_dialogue(product_name: str, review_count: int, suggested_factors: list) -> list:
     """초기 대화 내역 생성
     
@@ -590,55 +755,34 @@ def _create_initial_dialogue(product_name: str, review_count: int, suggested_fac
         }
     ]
 
-def _cache_session(session_id: str, session_cache_data: dict) -> None:
-    """세션 데이터를 메모리 캐시에 저장
-    
-    Args:
-        session_id: 세션 ID
-        session_cache_data: 캐싱할 세션 데이터
-    """
-    global _session_cache
-    _session_cache[session_id] = session_cache_data
-    logger.info(f"상품 분석 완료: {session_cache_data['product_name']} - 세션 캐싱 완료")
-
-def _create_session_data(session_id: str, product_name: str, category: str, category_name: str, 
-                         normalized_df, analysis: dict, factors: list) -> dict:
-    """세션 데이터 생성 및 캐싱
+async def _create_session_data(session_id: str, analysis: ProductAnalysis) -> dict:
+    """세션 데이터 생성 및 저장 (대화 상태 + 공유 상품 분석 참조)
     
     Args:
         session_id: 세션 ID
-        product_name: 상품명
-        category: 카테고리
-        category_name: 카테고리 표시명
-        normalized_df: 정규화된 리뷰 DataFrame
-        analysis: 분석 결과
-        factors: Factor 리스트
+        analysis: 상품 분석 (같은 상품 스냅샷의 세션끼리 공유, 수정 금지)
         
     Returns:
         API 응답용 딕셔너리
     """
-    suggested_factors = _extract_suggested_factors(analysis["top_factors"], factors)
-    initial_dialogue = _create_initial_dialogue(product_name, len(normalized_df), suggested_factors)
-    
-    session_cache_data = {
-        "scored_df": analysis["scored_reviews_df"],
-        "normalized_df": normalized_df,
-        "factors": factors,
-        "top_factors": analysis["top_factors"],
-        "category": category,
-        "product_name": product_name,
-        "dialogue_history": initial_dialogue
-    }
+    suggested_factors = [dict(f) for f in analysis.suggested_factors]
+    initial_dialogue = _create_initial_dialogue(analysis.product_name, analysis.review_count, suggested_factors)
     
-    _cache_session(session_id, session_cache_data)
+    await _save_session(session_id, {
+        "analysis": analysis,
+        "category": analysis.category,
+        "product_name": analysis.product_name,
+        "dialogue_history": initial_dialogue
+    })
+    logger.info(f"상품 분석 완료: {analysis.product_name} - 세션 생성: {session_id}")
     
     return {
         "session_id": session_id,
         "suggested_factors": suggested_factors,
-        "product_name": product_name,
-        "total_count": len(normalized_df),
-        "category": category,
-        "category_name": category_name
+        "product_name": analysis.product_name,
+        "total_count": analysis.review_count,
+        "category": analysis.category,
+        "category_name": analysis.category_name
     }
 
 
@@ -657,8 +801,9 @@ async def collect_reviews(
     logger.info(f"리뷰 수집 요청: product={request.product_id}, vendor={request.vendor}")
     
     try:
-        # Service 레이어 호출
-        result = review_service.collect_reviews(
+        # Service 레이어 호출 (수집은 블로킹 I/O → io 실행기)
+        result = await run_io(
+            review_service.collect_reviews,
             product_id=request.product_id,
             vendor=request.vendor,
             max_reviews=request.max_reviews
@@ -690,24 +835,23 @@ async def analyze_reviews(
     logger.info(f"리뷰 분석 요청: product={request.product_id}, category={request.category}")
     
     try:
-        # 1. 리뷰 수집
-        collect_result = review_service.collect_reviews(
+        # 1. 리뷰 수집 (블로킹 I/O → io 실행기)
+        collect_result = await run_io(
+            review_service.collect_reviews,
             product_id=request.product_id,
             vendor="smartstore"
         )
         reviews_df = collect_result["reviews_df"]
         
-        # 2. 정규화
-        normalized_df = review_service.normalize_reviews(reviews_df, vendor="smartstore")
+        # 2. 정규화 (pandas 계산 → cpu 실행기)
+        normalized_df = await run_cpu(review_service.normalize_reviews, reviews_df, vendor="smartstore")
         
         # 3. Factors 로드
-        data_dir = get_data_dir()
-        _, factors_df, _ = load_csvs(data_dir)
-        all_factors = parse_factors(factors_df)
-        factors = [f for f in all_factors if f.category == request.category]
+        factors = get_reg_catalog(get_data_dir()).factors_for(request.category)
         
         # 4. 분석
-        analysis = review_service.analyze_reviews(
+        analysis = await run_cpu(
+            review_service.analyze_reviews,
             reviews_df=normalized_df,
             factors=factors,
             top_k=request.top_k
@@ -794,32 +938,12 @@ async def analyze_product(
     try:
         logger.info(f"상품 분석 요청: {product_name}")
         
-        # 1. 상품 정보 로드 (helper 함수)
-        category, category_name = _load_product_info(product_name)
-        
-        # 2. 리뷰 데이터 로드 및 정규화 (helper 함수)
-        normalized_df = _load_review_data(category, service)
-        
-        # 3. Factor 로드 (해당 카테고리만)
-        _, factors_df, _ = load_csvs(get_data_dir())
-        all_factors = parse_factors(factors_df)
-        factors = [f for f in all_factors if f.category == category]
+        # 1. 상품 정보 조회 (helper 함수, 카탈로그 리로드 시 CSV I/O → io 실행기)
+        category, category_name = await run_io(_load_product_info, product_name)
         
-        if not factors:
-            raise HTTPException(
-                status_code=404,
-                detail=f"'{category_name}' 카테고리의 Factor를 찾을 수 없습니다"
-            )
-        
-        # 4. 리뷰 분석
-        analysis = service.analyze_reviews(
-            reviews_df=normalized_df,
-            factors=factors,
-            top_k=5,
-            save_results=False,
-            category=category,
-            product_id=product_name
-        )
+        # 2~4. 리뷰 로드 → 정규화/스코어링 (helper 함수)
+        #      같은 리뷰 스냅샷 × factor 정의면 다른 세션이 만든 분석을 그대로 공유
+        analysis = await _get_product_analysis(service, product_name, category, category_name)
         
         # 📊 사용자 여정: 상품 선택 (진입 & 완료) → 리뷰 수집 완료 → 대화 시작 진입
         user_journey_stage_total.labels(
@@ -843,12 +967,9 @@ async def analyze_product(
             category=category
         ).inc()
         
-        # 5. 세션 데이터 생성 및 캐싱 (helper 함수)
-        session_id = f"session-{category}-{hash(product_name) % 100000}"
-        return _create_session_data(
-            session_id, product_name, category, category_name,
-            normalized_df, analysis, factors
-        )
+        # 5. 세션 데이터 생성 및 캐싱 (사용자마다 새 세션 - 같은 상품 사용자끼리 대화 상태를 덮어쓰지 않음)
+        session_id = f"session-{category}-{uuid.uuid4().hex[:12]}"
+        return await _create_session_data(session_id, analysis)
         
     except HTTPException:
         raise
@@ -885,54 +1006,33 @@ async def get_factor_reviews(
     try:
         logger.info(f"Factor 리뷰 조회: session_id={session_id}, factor_key={factor_key}, limit={limit}")
         
-        # 1. 세션 데이터 검증
-        global _session_cache
-        if session_id not in _session_cache:
-            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
-        
-        session_data = _session_cache[session_id]
-        scored_df = session_data.get("scored_df")
-        factors = session_data.get("factors")
-        
-        if scored_df is None or factors is None:
-            raise HTTPException(status_code=500, detail="세션 데이터가 손상되었습니다")
+        # 1. 세션 데이터 로드 (다른 워커가 만든 세션이면 상품 분석 참조로 복원)
+        session_data = await _load_session(session_id, service)
+        analysis: ProductAnalysis = session_data["analysis"]
         
         # 2. Factor 찾기
-        target_factor = next((f for f in factors if f.factor_key == factor_key), None)
+        target_factor = analysis.factor(factor_key)
         if not target_factor:
             raise HTTPException(status_code=404, detail=f"Factor '{factor_key}'를 찾을 수 없습니다")
         
-        # 3. 매칭된 리뷰 필터링
-        score_col = f"score_{factor_key}"
-        if score_col not in scored_df.columns:
-            raise HTTPException(status_code=404, detail=f"Score 컬럼 '{score_col}'을 찾을 수 없습니다")
-        
-        matched_df = scored_df[scored_df[score_col] > 0].copy()
-        matched_df = matched_df.sort_values(score_col, ascending=False)
-        logger.info(f"매칭된 리뷰: {len(matched_df)}건")
-        
-        # 4. anchor_term별 카운트
-        anchor_terms = {}
-        for term in target_factor.anchor_terms:
-            count = matched_df['text'].str.contains(term, case=False, na=False).sum()
-            if count > 0:
-                anchor_terms[term] = int(count)
-        
-        # 5. 리뷰 샘플 생성 (helper 함수 사용)
-        reviews = _build_review_samples(matched_df, target_factor, limit)
+        # 3~5. 매칭 리뷰/anchor_term 카운트/리뷰 샘플 (pandas 계산 → cpu 실행기)
+        total_count, anchor_terms, reviews = await run_cpu(
+            _collect_factor_reviews, session_data, target_factor, limit
+        )
         
         # 6. 질문 로드 (helper 함수 사용)
-        questions = _load_factor_questions(factor_key)
+        questions = _load_factor_questions(factor_key, session_data.get("category", target_factor.category))
         
         logger.info(f"리뷰 조회 완료: {len(reviews)}건, 질문 {len(questions)}개")
         
         # 7. 대화 히스토리 업데이트 (helper 함수 사용)
-        _update_dialogue_with_factor_selection(session_id, target_factor, reviews, anchor_terms, questions)
+        _update_dialogue_with_factor_selection(session_data, target_factor, reviews, anchor_terms, questions)
+        await _save_session(session_id, session_data)
         
         return {
             "factor_key": factor_key,
             "display_name": target_factor.display_name,
-            "total_count": len(matched_df),
+            "total_count": total_count,
             "anchor_terms": anchor_terms,
             "reviews": reviews,
             "questions": questions
@@ -971,19 +1071,17 @@ async def answer_question(
                 "next_factor_hint": str
             },
             "is_converged": bool,  # 수렴 조건 달성 여부
-            "analysis": {...}  # is_converged=true일 때만 제공
+            "analysis": {...},  # is_converged=true이고 요청 안에서 분석했을 때만 제공
+            "analysis_job": {"job_id", "status", "poll_url"}  # ANALYSIS_JOB_ENABLED: 분석은 백그라운드 작업 → poll_url로 조회
         }
     """
     try:
         print(f"[DEBUG] 질문 답변 처리: session_id={session_id}, answer={request.answer}, question_id={request.question_id}, factor_key={request.factor_key}")
         logger.info(f"질문 답변 처리: session_id={session_id}, answer={request.answer}, question_id={request.question_id}, factor_key={request.factor_key}")
         
-        # 1. 세션 캐시에서 데이터 가져오기
-        global _session_cache
-        if session_id not in _session_cache:
-            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
-        
-        session_data = _session_cache[session_id]
+        # 1. 세션 데이터 로드 (다른 워커가 만든 세션이면 상품 분석 참조로 복원)
+        session_data = await _load_session(session_id, service)
+        analysis: ProductAnalysis = session_data["analysis"]
         
         # 2. 질문 히스토리 추가 (세션에 저장)
         if "question_history" not in session_data:
@@ -1026,24 +1124,25 @@ async def answer_question(
         
         # 4. 수렴되지 않았으면 다음 질문 로드
         if not is_converged:
-            _, _, questions_df = load_csvs(get_data_dir())
+            graph = get_reg_catalog(get_data_dir()).question_graph(session_data.get("category", ""))
             
             # factor_key 결정
-            current_factor_key = request.factor_key or (session_data.get("factors", [])[0].factor_key if session_data.get("factors") else None)
+            current_factor_key = request.factor_key or (analysis.factors[0].factor_key if analysis.factors else None)
             if not current_factor_key:
                 raise HTTPException(status_code=400, detail="factor_key를 찾을 수 없습니다")
             
             # 세션의 factor 중에서 현재 factor_key에 해당하는 factor 찾기
-            current_factor = next((f for f in session_data.get("factors", []) if f.factor_key == current_factor_key), None)
+            current_factor = analysis.factor(current_factor_key)
             if not current_factor:
                 raise HTTPException(status_code=400, detail=f"세션에 factor_key '{current_factor_key}'가 없습니다")
             
             # 다음 질문 찾기 (helper 함수 사용)
-            next_question = _find_next_question(session_data, questions_df, current_factor_key, current_factor)
+            next_question = _find_next_question(session_data, graph, current_factor_key, current_factor)
             
             if next_question:
                 # 세션에 현재 질문 저장
                 session_data["current_question"] = next_question
+                await _save_session(session_id, session_data)
                 
                 logger.info(f"다음 질문: {next_question.get('question_id', 'fallback')}")
                 
@@ -1063,31 +1162,25 @@ async def answer_question(
         if is_converged:
             logger.info(f"수렴 조건 달성 - LLM 분석 시작")
             
-            # DialogueSession 생성 (dialogue_history 전달)
-            normalized_df = session_data.get("normalized_df")
-            if normalized_df is None:
-                # 기존 세션 호환성: scored_df 사용 (fallback)
-                logger.warning("normalized_df가 세션에 없음 - scored_df 사용 (기존 세션 호환)")
-                normalized_df = session_data.get("scored_df")
-            
-            dialogue_session = DialogueSession(
-                category=session_data.get("category"),
+            # DialogueSession 복원: 공유 상품 분석의 스코어링 결과/주석/순위 목록 재사용 (재스코어링 없음)
+            dialogue_session = DialogueSession.from_analysis(
+                category=analysis.category,
                 data_dir=get_data_dir(),
-                reviews_df=normalized_df,  # 원본 normalized_df 전달 (LLM 분석용)
-                product_name=session_data.get("product_name", "이 제품")
+                scored_df=analysis.scored_df,
+                factors=list(analysis.factors),
+                score_matrix=analysis.score_matrix,
+                reviews_df=analysis.normalized_df,
+                product_name=analysis.product_name,
+                sentence_index=analysis.sentence_index,
+                evidence_postings=analysis.evidence_postings,
             )
             
             # 세션의 dialogue_history 복원 (초기 안내 + 키워드 선택 + 질문-답변 모두 포함)
             dialogue_session.dialogue_history = session_data.get("dialogue_history", [])
             
             dialogue_session.turn_count = len(session_data.get("question_history", []))
-            # (세션에 저장된 top_factors 사용)
-            top_factors = session_data.get("top_factors", [])[:3]  # (factor_key, score) 튜플 리스트
-            
-            # LLM 분석 생성
-            llm_context = dialogue_session._generate_analysis(top_factors)
-            
-            logger.info(f"LLM 분석 완료 - llm_summary 길이: {len(llm_context.get('llm_summary', ''))}")
+            # (상품 분석의 top_factors 사용)
+            top_factors = list(analysis.top_factors[:3])  # (factor_key, score) 튜플 리스트
             
             # 📊 사용자 여정: 대화 완료
             user_journey_stage_total.labels(
@@ -1099,6 +1192,50 @@ async def answer_question(
             # 📊 대화 세션 완료 메트릭
             dialogue_completions_total.labels(category=category).inc()
             
+            # 백그라운드 분석 작업: 작업 ID만 바로 반환, 결과는 GET /analysis/{session_id}로 조회
+            job = None
+            if settings.ANALYSIS_JOB_ENABLED:
+                jobs = get_analysis_job_manager()
+                try:
+                    job = jobs.create(session_id)
+                except AnalysisJobsBusy:
+                    logger.warning(f"분석 작업 대기열이 가득 참 - 요청 안에서 분석: {session_id}")
+                    analysis_jobs_total.labels(status="inline").inc()
+            
+            if job is not None:
+                # 작업 ID를 먼저 저장한 뒤 시작 (작업의 상태 기록이 이 저장에 덮이지 않도록)
+                session_data["analysis_job"] = job.record()
+                try:
+                    await _save_session(session_id, session_data)
+                except BaseException:
+                    jobs.discard(job, error="세션 저장 실패")
+                    raise
+                jobs.start(
+                    job,
+                    prepare=lambda: dialogue_session.prepare_analysis(top_factors),
+                    summarize=lambda context, evidence: dialogue_session.summarize_analysis(context, top_factors, evidence),
+                    on_update=lambda j: _record_analysis_job(session_id, j),
+                )
+                logger.info(f"분석 작업 시작: {job.job_id}")
+                
+                return {
+                    "next_question": None,
+                    "is_converged": True,
+                    "turn_count": turn_count,
+                    "analysis": None,
+                    "analysis_job": {
+                        "job_id": job.job_id,
+                        "status": job.status,
+                        "poll_url": f"{router.prefix}/analysis/{session_id}",
+                    },
+                }
+            
+            # LLM 분석 생성 (evidence 추출 + 동기 LLM 호출 → io 실행기)
+            llm_context = await run_io(dialogue_session._generate_analysis, top_factors)
+            
+            logger.info(f"LLM 분석 완료 - llm_summary 길이: {len(llm_context.get('llm_summary', ''))}")
+            await _save_session(session_id, session_data)
+            
             return {
                 "next_question": None,
                 "is_converged": True,
@@ -1113,6 +1250,44 @@ async def answer_question(
         raise HTTPException(status_code=500, detail=f"질문 답변 처리 중 오류가 발생했습니다: {str(e)}")
 
 
+@router.get("/analysis/{session_id}")
+@track_errors(error_type='api_error', component='get_analysis')
+async def get_analysis(session_id: str, wait: float = 0, since: Optional[str] = None):
+    """백그라운드 분석 작업 상태/결과 조회 (long-poll)
+    
+    Args:
+        session_id: 세션 ID
+        wait: 상태가 바뀌거나 작업이 끝날 때까지 기다릴 최대 초 (0 = 즉시 반환, 최대 ANALYSIS_JOB_MAX_WAIT_SECONDS)
+        since: 클라이언트가 마지막으로 본 status (다르면 즉시 반환, 생략 시 현재 상태에서 바뀔 때까지)
+        
+    Returns:
+        {
+            "job_id": str,
+            "status": "queued" | "retrieving" | "summarizing" | "done" | "failed",
+            "analysis": {...},  # summarizing: 상위 요인/evidence (다른 워커 작업이면 상위 요인만), done: answer-question 분석 결과와 동일
+            "error": str | None
+        }
+    """
+    wait = min(max(wait, 0.0), settings.ANALYSIS_JOB_MAX_WAIT_SECONDS)
+    job = get_analysis_job_manager().get(session_id)
+    if job is not None:
+        if since is None or since == job.status:
+            await job.wait_change(wait)
+        return job.to_dict()
+    
+    # 이 워커에 없는 작업 (다른 워커/재시작 전): 세션에 기록된 마지막 상태를 주기적으로 다시 읽음
+    # (오래 갱신되지 않은 미완료 작업은 실행하던 워커가 죽은 것으로 보고 failed)
+    deadline = time.monotonic() + wait
+    while True:
+        record = await _load_analysis_record(session_id)
+        if record is None:
+            raise HTTPException(status_code=404, detail="분석 작업을 찾을 수 없습니다")
+        since = since or record["status"]
+        if record["status"] in FINISHED_STATUSES or record["status"] != since or time.monotonic() >= deadline:
+            return record
+        await asyncio.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
+
+
 @router.post("/rate-response", response_model=RateResponseResponse)
 def rate_llm_response(
     request: RateResponseRequest
@@ -74,6 +74,7 @@ class Settings(BaseSettings):
     DIALOGUE_MIN_ANALYSIS_TURNS: int = 3      # 최소 분석 턴 수
     DIALOGUE_FOCUS_TURNS_THRESHOLD: int = 2   # 턴 1-2는 top2, 턴 3+는 top1 집중
     DIALOGUE_TOP_FACTORS_LIMIT: int = 3       # 상위 요인 제한
+    DIALOGUE_FUZZY_MATCH_THRESHOLD: float = 0.1  # 메시지-factor 문자 n-gram 코사인 임계값 (term 정확 매칭 실패 시)
     
     # Evidence 검색 설정
     EVIDENCE_PER_FACTOR_MIN: int = 8          # factor당 최소 evidence 수
@@ -88,13 +89,46 @@ class Settings(BaseSettings):
     EVIDENCE_RANK2_NEG: int = 2               # rank 2의 NEG quota
     EVIDENCE_RANK2_MIX: int = 2               # rank 2의 MIX quota
     EVIDENCE_RANK2_POS: int = 1               # rank 2의 POS quota
+    EVIDENCE_MMR_ENABLED: bool = True         # 거의 같은 리뷰가 evidence 슬롯을 채우지 않도록 MMR 선택
+    EVIDENCE_MMR_LAMBDA: float = 0.7          # MMR 관련도 가중치 (1.0 = 순위 순, 낮을수록 다양성 우선)
     
     # API 설정
     API_RELATED_REVIEWS_LIMIT: int = 5        # 관련 리뷰 제한
     API_MIN_FINALIZE_TURNS: int = 3           # 최소 종료 턴 수
     API_MIN_STABILITY_HITS: int = 2           # 최소 안정성 히트
-    API_MAX_CACHE_SIZE: int = 10              # 최대 캐시 크기
+    API_MAX_CACHE_SIZE: int = 1000            # 메모리 세션 수 안전 상한 (주 제한은 SESSION_MAX_BYTES + 유휴 TTL, 초과 시 LRU 제거)
+    SESSION_MAX_BYTES: int = 1_000_000_000    # 세션 추정 메모리 합계 상한 (0 = 무제한) - 세션 수 제한의 기준
+    SESSION_IDLE_TTL_SECONDS: int = 3600      # 마지막 접근 후 세션 유지 시간 (0 = 무제한)
+    PRODUCT_ANALYSIS_CACHE_SIZE: int = 8      # 세션 간 공유하는 상품 분석(리뷰 스냅샷별) 최대 보관 수
+    SESSION_BACKEND: str = "memory"           # 세션 저장소: "memory" (단일 워커), "sqlite" (같은 호스트 워커 공유), "redis" (레플리카 공유)
+    SESSION_SQLITE_PATH: str = "out/sessions.db"  # SESSION_BACKEND=sqlite 파일 경로
+    SESSION_REDIS_URL: str = "redis://localhost:6379/0"  # SESSION_BACKEND=redis 접속 URL
+    SESSION_SNAPSHOT_PATH: str = "out/session_snapshots/sessions.log"  # memory 백엔드 세션 스냅샷 로그 ("" = 끔, 재시작 시 첫 조회에 복원, 먼저 연 워커 1개만 기록)
+    SESSION_SNAPSHOT_COMPACT_BYTES: int = 64 * 1024 * 1024  # 스냅샷 로그가 이 크기 이상이고 절반 넘게 죽은 레코드면 압축
     API_CATEGORY_PREVIEW_REVIEWS: int = 20    # 카테고리 감지용 미리보기 리뷰 수
+    EXECUTOR_IO_WORKERS: int = 16             # 블로킹 I/O(파일, LLM SDK) 스레드 풀 크기
+    EXECUTOR_CPU_WORKERS: int = 0             # pandas/스코어링 작업 풀 크기 (0 = CPU 코어 수)
+    ANALYSIS_JOB_ENABLED: bool = True         # 수렴 시 분석(evidence → LLM 요약)을 백그라운드 작업으로 실행 (False = 응답에서 바로 계산)
+    ANALYSIS_JOB_WORKERS: int = 4             # 동시에 실행하는 분석 작업 수 (LLM 동시 호출 상한)
+    ANALYSIS_JOB_MAX_PENDING: int = 32        # 실행 대기 작업 상한 (초과 시 요청 안에서 바로 계산)
+    ANALYSIS_JOB_TTL_SECONDS: int = 600       # 끝난 작업 결과 보관 시간 (마지막 조회 기준)
+    ANALYSIS_JOB_MAX_WAIT_SECONDS: float = 25.0  # 상태 조회 long-poll 최대 대기 시간
+    ANALYSIS_JOB_STALE_SECONDS: int = 300     # 다른 워커 작업의 상태가 이 시간 동안 갱신되지 않으면 실패로 간주 (워커 종료 등)
+    
+    # Scoring 설정
+    SCORING_INCREMENTAL: bool = True          # 상품 분석 시 신규 리뷰만 점수 계산(점수 캐시의 직전 항목 재사용)
+    SCORE_CACHE_ENABLED: bool = True          # (리뷰 스냅샷, factor 정의) 해시 기반 점수 캐시 사용
+    SCORE_CACHE_DIR: str = "out/score_cache"  # 점수 캐시(npz) 디렉토리 (세션/분석/배치 공유)
+    SCORE_CACHE_MAX_FILES: int = 256          # 점수 캐시 최대 파일 수
+    SCORING_PARALLEL_ENABLED: bool = False    # 대용량 상품 멀티프로세스 청크 스코어링 (opt-in)
+    SCORING_PARALLEL_WORKERS: int = 0         # 워커 프로세스 수 (0 = CPU 코어 수)
+    SCORING_PARALLEL_CHUNK_SIZE: int = 20000  # 워커 1회 작업 단위(리뷰 수)
+    SCORING_PARALLEL_MIN_REVIEWS: int = 100000  # 이 리뷰 수 이상일 때만 병렬 처리 (미만은 단일 프로세스)
+    
+    # 중복 제거 설정
+    DEDUPE_MODE: str = "exact"                # "exact" (정규화 텍스트 완전 일치) 또는 "near" (MinHash LSH 근접 중복까지)
+    DEDUPE_NEAR_THRESHOLD: float = 0.8        # near 모드: 같은 리뷰로 볼 추정 Jaccard 유사도 하한
+    DEDUPE_NEAR_MIN_CHARS: int = 20           # near 모드: 비교 대상 최소 길이(공백 제외)
     
     # 리뷰 소스 설정
     REVIEW_SOURCE_MODE: str = "json_file"     # "json_file" 또는 "url"
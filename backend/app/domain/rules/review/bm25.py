@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""BM25 term index over normalized reviews (Domain Layer - Pure Python)
+
+리뷰 스냅샷 1건에 대해 factor term별 역색인(term → 리뷰 행 위치, 출현 횟수)을 한 번 만들고,
+factor의 anchor/context term을 질의로 BM25 점수를 계산한다.
+
+- term은 정규화 텍스트의 부분 문자열로 센다(교착어라 "시끄"가 "시끄러워요" 안에서 매칭되어야 함).
+- 문서 길이는 공백 기준 토큰 수.
+- `score_{factor}` 점수는 거의 상수(weight × 1.0/1.3 × 평점 배율)라, 같은 점수 안의 순서를 BM25로 정한다.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ....adapters.persistence.reg.store import Factor
+
+logger = logging.getLogger(__name__)
+
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+@dataclass
+class TermIndex:
+    """factor term 역색인"""
+    n_docs: int
+    doc_len: np.ndarray  # float64, (n_docs,) 공백 기준 토큰 수
+    avgdl: float
+    postings: Dict[str, Tuple[np.ndarray, np.ndarray]]  # term → (행 위치 int64, 출현 횟수 float64)
+
+    def idf(self, term: str) -> float:
+        n = len(self.postings[term][0]) if term in self.postings else 0
+        return math.log(1.0 + (self.n_docs - n + 0.5) / (n + 0.5))
+
+    def score(self, terms: Iterable[str], rows: np.ndarray) -> np.ndarray:
+        """rows(행 위치)별 BM25 점수 (질의 = terms, 중복 term은 한 번만)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        out = np.zeros(len(rows), dtype=float)
+        if len(rows) == 0 or self.n_docs == 0:
+            return out
+
+        # 질의 행만 위치 매핑 (전체 문서 크기 dense 누적 대신)
+        slot = np.full(self.n_docs, -1, dtype=np.int64)
+        slot[rows] = np.arange(len(rows))
+        norm = BM25_K1 * (1.0 - BM25_B + BM25_B * self.doc_len / self.avgdl) if self.avgdl > 0 else np.full(self.n_docs, BM25_K1)
+        for term in dict.fromkeys(terms):
+            if term not in self.postings:
+                continue
+            t_rows, tf = self.postings[term]
+            pos = slot[t_rows]
+            hit = pos >= 0
+            if not hit.any():
+                continue
+            r, f = t_rows[hit], tf[hit]
+            out[pos[hit]] += self.idf(term) * f * (BM25_K1 + 1.0) / (f + norm[r])
+        return out
+
+
+def build_term_index(norm_texts: pd.Series, terms: Iterable[str]) -> TermIndex:
+    """정규화 텍스트 Series(행 순서 = 점수 행렬 행 순서)에 대한 term 역색인 생성"""
+    texts = norm_texts.fillna("").astype(str).reset_index(drop=True)
+    lengths = texts.str.len().to_numpy()
+    doc_len = np.where(lengths > 0, texts.str.count(" ").to_numpy() + 1, 0).astype(float)
+
+    postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    for term in dict.fromkeys(t for t in terms if t):
+        tf = texts.str.count(re.escape(term)).to_numpy()
+        rows = np.flatnonzero(tf > 0)
+        if len(rows):
+            postings[term] = (rows.astype(np.int64), tf[rows].astype(float))
+
+    n_docs = len(texts)
+    avgdl = float(doc_len.mean()) if n_docs else 0.0
+    logger.debug(f"[BM25 색인] docs={n_docs}, terms={len(postings)}, avgdl={avgdl:.1f}")
+    return TermIndex(n_docs=n_docs, doc_len=doc_len, avgdl=avgdl, postings=postings)
+
+
+def factor_query_terms(f: Factor) -> list:
+    """factor의 BM25 질의 term (anchor + context)"""
+    return list(dict.fromkeys(list(f.anchor_terms) + list(f.context_terms)))
+
+
+def build_factor_term_index(norm_texts: pd.Series, factors: Iterable[Factor]) -> TermIndex:
+    """카테고리 factor들의 질의 term 전체에 대한 역색인"""
+    terms = [t for f in factors for t in factor_query_terms(f)]
+    return build_term_index(norm_texts, terms)
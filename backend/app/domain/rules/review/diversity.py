@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Diversity-aware evidence selection: MMR over MinHash signatures (Domain Layer - Pure Python)
+
+같은 불만을 거의 같은 문장으로 쓴 리뷰들이 evidence 슬롯을 채우지 않도록,
+후보 풀에서 maximal marginal relevance(MMR)로 고른다.
+
+    mmr(c) = λ · relevance(c) − (1 − λ) · max_{s ∈ 선택됨} sim(c, s)
+
+- relevance: 후보 풀 안의 순위 기반 (1 → 0 선형)
+- sim: 리뷰 정규화 텍스트의 MinHash 서명 일치율(추정 Jaccard, 문자 3-gram)
+- 라벨 quota(NEG/MIX/POS) 우선 → 남는 슬롯 보충 순서는 `_pick_by_quota`와 같다. λ = 1이면 결과도 같다.
+- 선택할 때마다 새 선택 1건과 풀 전체의 유사도만 갱신하므로 비용은 O(풀 크기 × 선택 수) — 선택 수가 상수라 풀 크기에 선형
+"""
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .near_dedupe import minhash_signatures
+
+logger = logging.getLogger(__name__)
+
+
+MMR_N_PERM = 32
+_EMPTY_SIG = np.uint32(0xFFFFFFFF)
+
+
+def text_signatures(norm_texts: Sequence[str]) -> np.ndarray:
+    """정규화 텍스트 → MinHash 서명 (n, MMR_N_PERM) — shingle이 없는 짧은 텍스트는 전부 0xFFFFFFFF"""
+    return minhash_signatures(list(norm_texts), n_perm=MMR_N_PERM, shingle_k=3)
+
+
+def _similarity(sigs: np.ndarray, sig: np.ndarray) -> np.ndarray:
+    """sigs 각 행과 sig의 추정 Jaccard (shingle 없는 텍스트끼리는 0)"""
+    if (sig == _EMPTY_SIG).all():
+        return np.zeros(len(sigs), dtype=float)
+    return (sigs == sig).mean(axis=1)
+
+
+class RedundancyTracker:
+    """retrieve 1회 동안 이미 뽑은 evidence의 서명 (factor 간 공유)"""
+
+    def __init__(self):
+        self.signatures: List[np.ndarray] = []
+
+    def max_similarity(self, sigs: np.ndarray) -> np.ndarray:
+        out = np.zeros(len(sigs), dtype=float)
+        for sig in self.signatures:
+            np.maximum(out, _similarity(sigs, sig), out=out)
+        return out
+
+
+def mmr_select(
+    labels: Sequence[str],
+    review_ids: Sequence[str],
+    sigs: np.ndarray,
+    quota: Dict[str, int],
+    seen_ids: set,
+    max_total_pick: int,
+    tracker: RedundancyTracker,
+    lam: float = 0.7,
+    relevance: Optional[np.ndarray] = None,
+) -> List[int]:
+    """후보 풀(순위 순)에서 quota를 지키며 MMR로 선택
+
+    Args:
+        labels: 후보별 라벨
+        review_ids: 후보별 review_id
+        sigs: 후보별 MinHash 서명 (text_signatures)
+        quota: {"NEG":2,"MIX":2,"POS":1} 등
+        seen_ids: 전역 중복 방지 (선택한 review_id가 추가됨)
+        max_total_pick: 최대 선택 수(보충 포함)
+        tracker: 이전 factor에서 뽑은 evidence 서명 (선택한 서명이 추가됨)
+        lam: 관련도 가중치 (1이면 순위 순 선택과 동일)
+        relevance: 후보별 관련도 (None이면 순위 기반 1 → 0)
+
+    Returns:
+        선택된 후보 번호 리스트 (quota 선택분 + 보충분, 각각 선택 순)
+    """
+    n = len(labels)
+    picked: List[int] = []
+    if n == 0 or max_total_pick <= 0:
+        return picked
+
+    rel = relevance if relevance is not None else 1.0 - np.arange(n) / n
+    rids = np.asarray([str(r) for r in review_ids], dtype=object)
+    labels_arr = np.asarray(labels, dtype=object)
+    blocked = np.array([(not r) or (r in seen_ids) for r in rids], dtype=bool)
+    max_sim = tracker.max_similarity(sigs)
+    counts = {k: 0 for k in quota}
+
+    def take(i: int) -> None:
+        nonlocal max_sim
+        picked.append(i)
+        seen_ids.add(rids[i])
+        blocked[rids == rids[i]] = True
+        tracker.signatures.append(sigs[i])
+        np.maximum(max_sim, _similarity(sigs, sigs[i]), out=max_sim)
+
+    def best(mask: np.ndarray) -> Optional[int]:
+        if not mask.any():
+            return None
+        gain = lam * rel - (1.0 - lam) * max_sim
+        return int(np.argmax(np.where(mask, gain, -np.inf)))
+
+    # 1) quota 우선 채우기
+    while len(picked) < max_total_pick:
+        open_labels = [k for k, q in quota.items() if counts[k] < q]
+        i = best(~blocked & np.isin(labels_arr, open_labels))
+        if i is None:
+            break
+        counts[labels_arr[i]] += 1
+        take(i)
+
+    # 2) quota 미달분 보충(NEU 포함)
+    while len(picked) < max_total_pick:
+        i = best(~blocked)
+        if i is None:
+            break
+        take(i)
+    return picked
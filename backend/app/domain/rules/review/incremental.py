@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Incremental rescoring: 새로 들어온 리뷰만 점수 계산 (Domain Layer - Pure Python)
+
+리뷰 파일이 조금씩 늘어날 때 전체를 다시 스코어링하지 않도록,
+이전 결과(ScoreSnapshot)에 있는 리뷰는 재사용하고 처음 보는 리뷰만 점수를 계산해 합친다.
+
+리뷰 식별 키: review_id + 정규화 텍스트 SHA1(dedupe_reviews의 `_sha1`)
+- 텍스트가 수정된 리뷰는 키가 달라져 새로 계산된다.
+- 평점이 바뀐 리뷰(rating multiplier가 다른 경우)도 새로 계산된다.
+- factor 정의(term/weight 등)가 바뀌면 스냅샷 전체를 버리고 처음부터 계산한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .normalize import normalize_series, sha1_of_text
+from .score_matrix import ScoreMatrix
+from .parallel import ParallelScoring
+from .scoring import rating_multiplier, score_texts
+from ....adapters.persistence.reg.store import Factor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScoreSnapshot:
+    """이전 스코어링 결과 (영속화 단위)"""
+    factor_set_hash: str
+    review_keys: np.ndarray  # str, (n_reviews,)
+    rating_mult: np.ndarray  # float, (n_reviews,)
+    matrix: ScoreMatrix
+    factor_totals: Dict[str, float]
+
+
+def factor_set_hash(factors: List[Factor]) -> str:
+    """점수 결과에 영향을 주는 Factor 정의 전체의 해시 (순서 포함)"""
+    payload = [
+        [f.factor_id, f.factor_key, f.anchor_terms, f.context_terms, f.negation_terms, float(f.weight)]
+        for f in factors
+    ]
+    return hashlib.sha1(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def review_snapshot_hash(df: pd.DataFrame) -> str:
+    """점수 결과에 영향을 주는 리뷰 스냅샷 내용(행 순서, 텍스트, 평점 배율)의 해시
+
+    점수 행렬은 행 위치 기준이라 같은 내용이라도 순서가 다르면 다른 해시가 된다.
+    정규화 전 원문 텍스트로 계산하므로 캐시 적중 시 정규화/매칭을 모두 건너뛸 수 있다.
+    """
+    text_hash = pd.util.hash_pandas_object(df["text"].fillna("").astype(str), index=False).to_numpy()
+    h = hashlib.sha1(text_hash.tobytes())
+    h.update(rating_multiplier(df).astype(np.float64).tobytes())
+    return h.hexdigest()
+
+
+def review_keys(df: pd.DataFrame) -> np.ndarray:
+    """리뷰 식별 키 배열: "{review_id}:{정규화 텍스트 sha1}" """
+    sha1 = df["_sha1"] if "_sha1" in df.columns else df["_norm_text"].map(sha1_of_text)
+    return (df["review_id"].astype(str) + ":" + sha1.astype(str)).to_numpy(dtype=str)
+
+
+def score_incrementally(
+    df: pd.DataFrame,
+    factors: List[Factor],
+    snapshot: Optional[ScoreSnapshot] = None,
+    parallel: Optional[ParallelScoring] = None,
+) -> Tuple[pd.DataFrame, ScoreMatrix, ScoreSnapshot, int]:
+    """스냅샷에 없는 리뷰만 점수 계산해 전체 점수 행렬을 구성
+
+    Args:
+        df: 정규화/중복제거된 리뷰 데이터프레임 (review_id, text, rating; `_norm_text`/`_sha1` 있으면 재사용)
+        factors: Factor 리스트 (행렬의 열 순서)
+        snapshot: 이전 결과 (없거나 factor 구성이 다르면 전체 계산)
+        parallel: 신규 리뷰 스코어링에 쓸 멀티프로세스 설정 (None이면 단일 프로세스)
+
+    Returns:
+        (_norm_text가 추가된 df 복사본, df 행 순서의 ScoreMatrix, 갱신된 ScoreSnapshot, 새로 계산한 리뷰 수)
+    """
+    df = df.copy()
+    if "_norm_text" not in df.columns:
+        df["_norm_text"] = normalize_series(df["text"])
+
+    keys = review_keys(df)
+    mult = rating_multiplier(df)
+    f_hash = factor_set_hash(factors)
+
+    # 이전 스냅샷에서의 행 위치 (-1 = 처음 보는 리뷰)
+    prev_pos = np.full(len(df), -1, dtype=np.int64)
+    if snapshot is not None and snapshot.factor_set_hash == f_hash:
+        pos_map = {k: i for i, k in enumerate(snapshot.review_keys.tolist())}
+        prev_pos = np.array([pos_map.get(k, -1) for k in keys.tolist()], dtype=np.int64)
+        known = prev_pos >= 0
+        changed = known.copy()
+        changed[known] = snapshot.rating_mult[prev_pos[known]] != mult[known]
+        prev_pos[changed] = -1
+        # 중복 제거 전 df라 같은 키가 여러 번 나오면 첫 행만 재사용
+        prev_pos[(prev_pos >= 0) & pd.Series(prev_pos).duplicated(keep="first").to_numpy()] = -1
+    elif snapshot is not None:
+        logger.info("[증분 스코어링] factor 정의 변경 감지 → 전체 재계산")
+
+    known_rows = np.flatnonzero(prev_pos >= 0)
+    new_rows = np.flatnonzero(prev_pos < 0)
+
+    fresh = score_texts(df["_norm_text"].iloc[new_rows], mult[new_rows], factors, parallel)
+    if len(known_rows) == 0:
+        matrix = fresh
+    else:
+        # [재사용 행..., 신규 행...]로 쌓은 뒤 df 행 순서로 재배치
+        reused = snapshot.matrix.take_rows(prev_pos[known_rows])
+        stacked = ScoreMatrix.vstack([reused, fresh])
+        stack_pos = np.empty(len(df), dtype=np.int64)
+        stack_pos[known_rows] = np.arange(len(known_rows))
+        stack_pos[new_rows] = len(known_rows) + np.arange(len(new_rows))
+        matrix = stacked.take_rows(stack_pos)
+
+    logger.info(
+        f"[증분 스코어링] reviews={len(df)}, 재사용={len(known_rows)}, 신규 계산={len(new_rows)}"
+    )
+
+    new_snapshot = ScoreSnapshot(
+        factor_set_hash=f_hash,
+        review_keys=keys,
+        rating_mult=mult,
+        matrix=matrix,
+        factor_totals=matrix.factor_totals(),
+    )
+    return df, matrix, new_snapshot, int(len(new_rows))
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Batch sentiment labeler: cue 위치 1회 계산 + window 질의 (Domain Layer - Pure Python)
+
+`classify_text_label`은 (리뷰, factor)마다 정규화 텍스트에서 hit 위치를 찾고
+POS/NEG/전환 cue 목록을 하나씩 `in`으로 훑는다. 여기서는 cue 사전과 카테고리의 모든 factor term을
+하나의 Aho-Corasick 오토마톤으로 컴파일해 리뷰당 한 번만 훑어 패턴별 시작 위치를 기록하고,
+factor별 라벨은 그 위치 목록에 대한 window 질의로 계산한다 (`classify_text_label`과 같은 결과).
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .matcher import AhoCorasick, factor_signature
+from .normalize import normalize_text as normalize
+from ....adapters.persistence.reg.store import Factor
+
+logger = logging.getLogger(__name__)
+
+
+POS_CUES = [
+    "괜찮", "좋", "만족", "추천", "문제없", "이상없", "잘됨", "잘되",
+    "조용", "무소음", "안시끄", "소음없", "냄새없", "연기없", "불편없", "안불편",
+    "간편", "편하", "쉬움", "빠르", "튼튼", "견고", "안전", "깨끗",
+]
+NEG_CUES = [
+    "불만", "별로", "실망", "후회", "비추", "문제", "고장", "as", "a/s", "환불",
+    "시끄", "소음", "냄새", "연기", "뜨거", "화상", "위험", "누수", "샘", "물샘",
+    "번거", "귀찮", "청소", "관리", "곰팡", "세척", "부식", "녹", "때",
+    "약함", "부족", "미흡", "안됨", "안되", "끊김", "오류",
+]
+SWITCH_CUES = ["근데", "하지만", "다만", "그러나", "반면", "대신", "오히려", "그런데"]
+
+# cue 종류 비트 플래그
+POS = 1
+NEG = 2
+SWITCH = 4
+
+_CUE_KINDS: Dict[str, int] = {}
+for _cues, _flag in ((POS_CUES, POS), (NEG_CUES, NEG), (SWITCH_CUES, SWITCH)):
+    for _cue in _cues:
+        _CUE_KINDS[_cue] = _CUE_KINDS.get(_cue, 0) | _flag
+
+
+@dataclass
+class ReviewCues:
+    """정규화 텍스트 1건의 매칭 위치"""
+    length: int
+    first: Dict[str, int]                  # 패턴(cue/factor term) → 첫 시작 위치 (`text.find(pattern)`)
+    spans: Dict[str, List[int]]            # 패턴 → 모든 시작 위치(오름차순)
+    cues: List[Tuple[int, int, int]]       # (start, end, cue 종류 비트) — 텍스트에 나온 cue만
+    kinds: int                             # 텍스트 전체에 나온 cue 종류 비트 OR
+
+
+@lru_cache(maxsize=64)
+def _compile_cue_automaton(signature) -> AhoCorasick:
+    """cue 사전 + factor term 전체를 하나의 오토마톤으로 (term 구성이 같으면 재사용)"""
+    patterns = dict.fromkeys(POS_CUES + NEG_CUES + SWITCH_CUES)
+    for kinds in signature:
+        for terms in kinds:
+            patterns.update(dict.fromkeys(t for t in terms if t))
+    automaton = AhoCorasick(list(patterns))
+    logger.debug(f"[CueLabeler 컴파일] patterns={len(automaton.patterns)}")
+    return automaton
+
+
+def _window_kinds(cues: List[Tuple[int, int, int]], lo: int, hi: int) -> int:
+    """text[lo:hi] 안에 통째로 들어간 cue들의 종류 비트 OR"""
+    kinds = 0
+    for start, end, kind in cues:
+        if start >= lo and end <= hi:
+            kinds |= kind
+    return kinds
+
+
+def _any_within(rc: ReviewCues, terms: Sequence[str], lo: int, hi: int) -> bool:
+    """terms 중 하나라도 text[lo:hi] 안에 통째로 있는지 (`t in text[lo:hi]`)"""
+    for t in terms:
+        if not t:
+            return True
+        last = hi - len(t)
+        for s in rc.spans.get(t, ()):
+            if s > last:
+                break
+            if s >= lo:
+                return True
+    return False
+
+
+class CueLabeler:
+    """카테고리 factor들에 대한 POS/NEG/MIX/NEU 배치 라벨러
+
+    리뷰별 cue/term 위치(정규화 텍스트 기준)와 (review_id, factor_key) 라벨을 인스턴스 안에 캐시한다.
+    분석 1건(같은 리뷰 스냅샷) 동안 하나를 만들어 factor들끼리 공유하는 용도.
+    """
+
+    def __init__(self, factors: Sequence[Factor], window: int = 30):
+        self.window = window
+        self._automaton = _compile_cue_automaton(factor_signature(factors))
+        # factor_key → (hit 기준 term: anchor가 없으면 context, negation term)
+        self._factor_terms: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+            f.factor_key: (tuple(f.anchor_terms or f.context_terms), tuple(f.negation_terms))
+            for f in factors
+        }
+        self._reviews: Dict[str, ReviewCues] = {}
+        self._labels: Dict[Tuple[str, str], str] = {}
+
+    def review_cues(self, norm_text: str) -> ReviewCues:
+        """정규화 텍스트 1건의 cue/term 위치 (같은 텍스트는 한 번만 계산)"""
+        rc = self._reviews.get(norm_text)
+        if rc is None:
+            spans: Dict[str, List[int]] = {}
+            cues: List[Tuple[int, int, int]] = []
+            kinds = 0
+            patterns = self._automaton.patterns
+            for start, pid in self._automaton.iter_matches(norm_text):
+                pat = patterns[pid]
+                kind = _CUE_KINDS.get(pat)
+                if kind:
+                    cues.append((start, start + len(pat), kind))
+                    kinds |= kind
+                spans.setdefault(pat, []).append(start)
+            for starts in spans.values():
+                starts.sort()
+            rc = ReviewCues(
+                length=len(norm_text),
+                first={t: starts[0] for t, starts in spans.items()},
+                spans=spans,
+                cues=cues,
+                kinds=kinds,
+            )
+            self._reviews[norm_text] = rc
+        return rc
+
+    def label(self, full_text: str, factor_key: str, norm_text: Optional[str] = None) -> str:
+        """`classify_text_label(full_text, factor, window, norm_text)`과 같은 라벨"""
+        if not full_text:
+            return "NEU"
+        rc = self.review_cues(norm_text if norm_text is not None else normalize(full_text))
+        terms, negation_terms = self._factor_terms[factor_key]
+
+        first = rc.first
+        i0 = None
+        for t in terms:
+            i = first.get(t, -1) if t else 0
+            if i != -1 and (i0 is None or i < i0):
+                i0 = i
+
+        if i0 is None:
+            has_pos = bool(rc.kinds & POS)
+            has_neg = bool(rc.kinds & NEG)
+            if has_pos and has_neg:
+                return "MIX"
+            if has_neg:
+                return "NEG"
+            if has_pos:
+                return "POS"
+            if any((not t) or t in first for t in negation_terms):
+                return "POS"
+            return "NEU"
+
+        lo = max(0, i0 - self.window)
+        hi = min(rc.length, i0 + self.window)
+        kinds = _window_kinds(rc.cues, lo, hi)
+
+        has_pos = bool(kinds & POS)
+        has_neg = bool(kinds & NEG)
+        has_switch = bool(rc.kinds & SWITCH)
+        has_negation = _any_within(rc, negation_terms, lo, hi)
+
+        if has_pos and has_neg:
+            return "MIX"
+        if has_neg:
+            return "MIX" if has_negation or has_switch else "NEG"
+        if has_pos:
+            return "POS"
+        if has_negation:
+            return "POS"
+        return "NEU"
+
+    def label_table(
+        self,
+        df: pd.DataFrame,
+        factor_keys: Optional[Sequence[str]] = None,
+    ) -> Dict[Tuple[str, str], str]:
+        """(review_id, factor_key) → 라벨 표 (이미 계산한 항목은 캐시에서 재사용)
+
+        Args:
+            df: review_id, text 컬럼이 있는 리뷰 DataFrame (`_norm_text` 있으면 재사용)
+            factor_keys: 라벨을 계산할 factor (None이면 전체)
+
+        Returns:
+            라벨 표 (같은 review_id가 여러 행이면 앞선 행 기준)
+        """
+        keys = list(factor_keys) if factor_keys is not None else list(self._factor_terms)
+        rids = df["review_id"].astype(str).tolist()
+        texts = df["text"].tolist()
+        norms = df["_norm_text"].tolist() if "_norm_text" in df.columns else [None] * len(df)
+
+        table: Dict[Tuple[str, str], str] = {}
+        for rid, text, nt in zip(rids, texts, norms):
+            for key in keys:
+                cache_key = (rid, key)
+                if cache_key in table:
+                    continue
+                label = self._labels.get(cache_key)
+                if label is None:
+                    label = self.label(text or "", key, norm_text=nt)
+                    self._labels[cache_key] = label
+                table[cache_key] = label
+        return table
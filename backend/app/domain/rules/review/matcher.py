@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Factor term matcher: Aho-Corasick multi-pattern automaton (Domain Layer - Pure Python)
+
+카테고리의 모든 anchor/context/negation term을 하나의 오토마톤으로 컴파일해서
+정규화된 리뷰 1건을 한 번만 훑고 모든 factor hit를 얻는다.
+(기존: 리뷰 × factor × term 만큼 `term in text` 반복)
+"""
+from __future__ import annotations
+
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+
+from ....adapters.persistence.reg.store import Factor
+
+logger = logging.getLogger(__name__)
+
+
+# term 종류 비트 플래그
+ANCHOR = 1
+CONTEXT = 2
+NEGATION = 4
+
+_KIND_FLAGS = (("anchor_terms", ANCHOR), ("context_terms", CONTEXT), ("negation_terms", NEGATION))
+
+
+class AhoCorasick:
+    """문자열 집합에 대한 Aho-Corasick 오토마톤
+
+    - 빈 문자열은 무시한다.
+    - `iter_matches`는 겹치는 매칭까지 모두 반환한다(`term in text`와 동일한 판정).
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns: List[str] = list(patterns)
+
+        # state 0 = root
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        for pid, pat in enumerate(self.patterns):
+            if not pat:
+                continue
+            state = 0
+            for ch in pat:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] = self._out[state] + (pid,)
+
+        # BFS로 fail 링크 구성 + output 병합(fail 체인의 출력까지 미리 합쳐둔다)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                cand = self._goto[f].get(ch, 0)
+                self._fail[nxt] = cand if cand != nxt else 0
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(start, pattern_id) 매칭을 끝 위치 순서로 반환"""
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for pid in out[state]:
+                    yield i - len(patterns[pid]) + 1, pid
+
+    def find_ids(self, text: str) -> Set[int]:
+        """텍스트에 등장하는 pattern_id 집합 (위치 불필요할 때의 빠른 경로)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class FactorMatcher:
+    """Factor 리스트의 모든 term을 컴파일한 매처
+
+    factor는 리스트 내 위치(index)로 식별한다. 같은 term이 여러 factor/종류에
+    걸쳐 있어도 한 번만 등록되고, term → [(factor_idx, flag), ...]로 펼쳐진다.
+    """
+
+    def __init__(self, term_sets: Sequence[Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]]):
+        self.n_factors = len(term_sets)
+
+        term_ids: Dict[str, int] = {}
+        targets: List[List[Tuple[int, int]]] = []
+        for f_idx, kinds in enumerate(term_sets):
+            for terms, (_, flag) in zip(kinds, _KIND_FLAGS):
+                for term in terms:
+                    if not term:
+                        continue
+                    tid = term_ids.get(term)
+                    if tid is None:
+                        tid = len(targets)
+                        term_ids[term] = tid
+                        targets.append([])
+                    if (f_idx, flag) not in targets[tid]:
+                        targets[tid].append((f_idx, flag))
+
+        self.terms: List[str] = list(term_ids)
+        self.term_ids = term_ids
+        self.targets: List[Tuple[Tuple[int, int], ...]] = [tuple(t) for t in targets]
+        self._automaton = AhoCorasick(self.terms)
+
+    def match(self, norm_text: str) -> Dict[int, int]:
+        """정규화 텍스트 1건 → {factor_idx: ANCHOR|CONTEXT|NEGATION 비트 OR}"""
+        hits: Dict[int, int] = {}
+        if not norm_text:
+            return hits
+        targets = self.targets
+        for tid in self._automaton.find_ids(norm_text):
+            for f_idx, flag in targets[tid]:
+                hits[f_idx] = hits.get(f_idx, 0) | flag
+        return hits
+
+    def iter_term_matches(self, norm_text: str) -> Iterator[Tuple[int, str]]:
+        """정규화 텍스트 1건 → (start, term) 매칭 (겹침 포함)"""
+        terms = self.terms
+        for start, tid in self._automaton.iter_matches(norm_text or ""):
+            yield start, terms[tid]
+
+
+def factor_signature(factors: Sequence[Factor]) -> Tuple[Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]], ...]:
+    """매처 컴파일에 영향을 주는 정보만 뽑은 hashable 시그니처"""
+    return tuple(
+        (tuple(f.anchor_terms), tuple(f.context_terms), tuple(f.negation_terms))
+        for f in factors
+    )
+
+
+@lru_cache(maxsize=64)
+def _compile_matcher(signature) -> FactorMatcher:
+    matcher = FactorMatcher(signature)
+    logger.debug(f"[FactorMatcher 컴파일] factors={matcher.n_factors}, terms={len(matcher.terms)}")
+    return matcher
+
+
+def get_factor_matcher(factors: Sequence[Factor]) -> FactorMatcher:
+    """Factor 리스트에 대한 컴파일된 매처 (term 구성이 같으면 재사용)"""
+    return _compile_matcher(factor_signature(factors))
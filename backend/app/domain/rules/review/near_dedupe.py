@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Near-duplicate review detection: MinHash + LSH banding (Domain Layer - Pure Python)
+
+복붙/템플릿 리뷰처럼 몇 글자만 다른 리뷰를 묶는다.
+
+- shingle: 공백을 뺀 정규화 텍스트의 문자 k-gram (띄어쓰기만 다른 리뷰도 같은 shingle)
+- MinHash: shingle 해시에 multiply-shift 해시 n_perm개를 적용해 최소값 서명 생성
+- LSH: 서명을 bands × rows로 잘라 같은 버킷에 들어간 리뷰만 후보로 비교 → O(n) 후보 생성
+- 후보는 버킷 대표(먼저 나온 리뷰)와만 비교하고, 서명 일치율(추정 Jaccard)이 threshold 이상이면 같은 클러스터로 합친다
+"""
+from __future__ import annotations
+
+import logging
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_SHIFT32 = np.uint64(32)
+
+
+def _block_shingles(texts: Sequence[str], k: int) -> tuple:
+    """블록 내 모든 텍스트의 문자 k-gram 해시를 한 번에 계산
+
+    텍스트들을 이어붙인 코드포인트 배열에서 다항식 롤링 해시를 구하고,
+    텍스트 경계를 넘는 윈도우는 버린다.
+
+    Returns:
+        (hashes: uint64 (W,), counts: int64 (n_texts,) 텍스트별 윈도우 수)
+    """
+    stripped = [(t or "").replace(" ", "") for t in texts]
+    lengths = np.array([len(t) for t in stripped], dtype=np.int64)
+    cps = np.frombuffer("".join(stripped).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    counts = np.maximum(lengths - k + 1, 0)
+    if len(cps) < k:
+        return np.zeros(0, dtype=np.uint64), counts
+
+    n_win = len(cps) - k + 1
+    h = np.zeros(n_win, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for i in range(k):
+            h = h * np.uint64(1000003) + cps[i:i + n_win]
+
+    # 윈도우 시작 위치가 자기 텍스트의 [start, end - k] 안에 있는 것만
+    text_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    valid = np.zeros(n_win, dtype=bool)
+    for_start = np.repeat(text_starts, counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    valid[for_start + offsets] = True
+    return h[valid], counts
+
+
+def minhash_signatures(
+    norm_texts: Sequence[str],
+    n_perm: int = 64,
+    shingle_k: int = 3,
+    seed: int = 1,
+    block_size: int = 512,
+) -> np.ndarray:
+    """MinHash 서명 행렬 (n_texts, n_perm), uint32
+
+    공백 제외 길이가 shingle_k보다 짧은 텍스트는 shingle이 없어 전부 0xFFFFFFFF가 된다(비교 대상에서 제외할 것).
+    """
+    rng = np.random.RandomState(seed)
+    a = (rng.randint(0, 2**32, size=n_perm, dtype=np.uint64) << _SHIFT32) | rng.randint(0, 2**32, size=n_perm, dtype=np.uint64) | np.uint64(1)
+    b = (rng.randint(0, 2**32, size=n_perm, dtype=np.uint64) << _SHIFT32) | rng.randint(0, 2**32, size=n_perm, dtype=np.uint64)
+
+    sigs = np.full((len(norm_texts), n_perm), 0xFFFFFFFF, dtype=np.uint32)
+    for lo in range(0, len(norm_texts), block_size):
+        hashes, counts = _block_shingles(norm_texts[lo:lo + block_size], shingle_k)
+        nonempty = np.flatnonzero(counts > 0)
+        if len(nonempty) == 0:
+            continue
+        # multiply-shift: (a*x + b)의 상위 32bit (uint64 곱셈은 2^64에서 wrap), factor-major (n_perm, W)
+        with np.errstate(over="ignore"):
+            hashed = ((a[:, None] * hashes[None, :] + b[:, None]) >> _SHIFT32).astype(np.uint32)
+        starts = np.concatenate(([0], np.cumsum(counts[nonempty])[:-1]))
+        sigs[lo + nonempty] = np.minimum.reduceat(hashed, starts, axis=1).T
+    return sigs
+
+
+def _band_keys(sigs: np.ndarray, bands: int) -> np.ndarray:
+    """(n, bands) 밴드 해시 — 밴드 안의 rows개 값을 하나의 uint64로 결합"""
+    n, n_perm = sigs.shape
+    rows = n_perm // bands
+    s = sigs[:, :bands * rows].astype(np.uint64).reshape(n, bands, rows)
+    keys = np.zeros((n, bands), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for r in range(rows):
+            keys = keys * np.uint64(0x9E3779B97F4A7C15) + s[:, :, r]
+    return keys
+
+
+def _find(parent: List[int], x: int) -> int:
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+def near_duplicate_clusters(
+    norm_texts: Sequence[str],
+    threshold: float = 0.8,
+    min_chars: int = 20,
+    n_perm: int = 64,
+    bands: int = 16,
+    shingle_k: int = 3,
+) -> np.ndarray:
+    """근접 중복 클러스터 대표 행 배열
+
+    Args:
+        norm_texts: 정규화된 텍스트 (exact 중복은 이미 제거된 상태 권장)
+        threshold: 같은 리뷰로 볼 추정 Jaccard 유사도 하한
+        min_chars: 이보다 짧은(공백 제외) 텍스트는 비교하지 않음 (짧은 리뷰는 우연히 겹치기 쉬움)
+        n_perm: MinHash 해시 함수 수
+        bands: LSH 밴드 수 (rows = n_perm // bands)
+        shingle_k: 문자 shingle 길이
+
+    Returns:
+        rep: (n,) int64 — 각 행이 속한 클러스터의 대표 행 위치(클러스터에서 가장 앞선 행, 단독이면 자기 자신)
+    """
+    n = len(norm_texts)
+    rep = np.arange(n, dtype=np.int64)
+    if n < 2:
+        return rep
+
+    lengths = np.array([len((t or "").replace(" ", "")) for t in norm_texts], dtype=np.int64)
+    eligible = np.flatnonzero(lengths >= max(min_chars, shingle_k))
+    if len(eligible) < 2:
+        return rep
+
+    sigs = minhash_signatures([norm_texts[i] for i in eligible], n_perm=n_perm, shingle_k=shingle_k)
+    keys = _band_keys(sigs, bands)
+
+    # 밴드별로 같은 키를 가진 행을 묶고, 버킷의 첫 행(=가장 앞선 행)과 나머지 행을 후보 쌍으로
+    pair_a: List[np.ndarray] = []
+    pair_b: List[np.ndarray] = []
+    for band in range(keys.shape[1]):
+        order = np.argsort(keys[:, band], kind="stable")
+        k_sorted = keys[order, band]
+        new_bucket = np.concatenate(([True], k_sorted[1:] != k_sorted[:-1]))
+        leader = order[np.maximum.accumulate(np.where(new_bucket, np.arange(len(order)), 0))]
+        member = ~new_bucket
+        pair_a.append(leader[member])
+        pair_b.append(order[member])
+
+    a = np.concatenate(pair_a)
+    b = np.concatenate(pair_b)
+    if len(a) == 0:
+        return rep
+    pairs = np.unique(np.stack([a, b], axis=1), axis=0)
+
+    # 서명 일치율로 Jaccard 추정 후 검증
+    sim = (sigs[pairs[:, 0]] == sigs[pairs[:, 1]]).mean(axis=1)
+    verified = pairs[sim >= threshold]
+
+    parent = list(range(len(eligible)))
+    for x, y in verified.tolist():
+        rx, ry = _find(parent, x), _find(parent, y)
+        if rx != ry:
+            # 더 앞선 행을 루트로 → 대표 = 클러스터에서 가장 앞선 행
+            if rx < ry:
+                parent[ry] = rx
+            else:
+                parent[rx] = ry
+
+    roots = np.array([_find(parent, i) for i in range(len(eligible))], dtype=np.int64)
+    rep[eligible] = eligible[roots]
+    return rep
+
+
+def cluster_members(rep: np.ndarray) -> Dict[int, List[int]]:
+    """{대표 행: [중복으로 제거되는 행...]} (크기 2 이상 클러스터만)"""
+    out: Dict[int, List[int]] = {}
+    for i in np.flatnonzero(rep != np.arange(len(rep))).tolist():
+        out.setdefault(int(rep[i]), []).append(i)
+    return out
@@ -1,14 +1,33 @@
 #!/usr/bin/env python3
 """리뷰 데이터 정규화 (Domain Layer - Pure Python)"""
 import hashlib
+import logging
 import re
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .near_dedupe import cluster_members, near_duplicate_clusters
+
+logger = logging.getLogger(__name__)
+
 
 _REPEAT_RE = re.compile(r"(ㅋ|ㅎ|!|\?){3,}")  # ㅋㅋㅋㅋ, ㅎㅎㅎㅎ, !!!!!, ????
 
+# 허용 문자 외(한글/자모/영문/숫자/공백 + 일부 구두점/기호)
+_DISALLOWED_RE = re.compile(r"[^\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F\w\d\s\.,!\?\-\(\)\[\]:;'\"%&@/\\]+")
+_SPACE_RE = re.compile(r"\s+")
+
+# 단위/기호 보정(자주 등장하는 것만) - 소문자 변환 후 적용
+# ("dＢ"/"dB"는 소문자 변환 뒤에는 나올 수 없어 제외,
+#  str.translate는 비ASCII 문자열에서 replace 연쇄보다 느려서 replace 유지)
+_UNIT_REPLACEMENTS = (("℃", "도"), ("ℓ", "l"), ("㎖", "ml"), ("㏈", "db"))
+
+
+def _collapse_repeat(m: re.Match) -> str:
+    return m.group(1) * 2
+
 
 def normalize_text(text: Optional[str]) -> str:
     """텍스트 정규화: 소문자 변환, 특수문자 정리, 공백 정리, 반복문자 축약"""
@@ -16,19 +35,28 @@ def normalize_text(text: Optional[str]) -> str:
         return ""
 
     s = str(text).lower()
+    for src, dst in _UNIT_REPLACEMENTS:
+        s = s.replace(src, dst)
 
-    # 단위/기호 보정(자주 등장하는 것만)
-    s = s.replace("℃", "도").replace("ℓ", "l").replace("㎖", "ml").replace("㏈", "db").replace("dＢ", "db").replace("dB", "db")
+    s = _DISALLOWED_RE.sub(" ", s)
+    s = _REPEAT_RE.sub(_collapse_repeat, s)  # ㅋㅋㅋㅋ → ㅋㅋ, !!!!! → !!
+    return _SPACE_RE.sub(" ", s).strip()
 
-    # 허용 문자 외 제거(한글/자모/영문/숫자/공백 + 일부 구두점/기호)
-    s = re.sub(r"[^\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F\w\d\s\.,!\?\-\(\)\[\]:;'\"%&@/\\]+", " ", s)
 
-    # 반복문자 축약: ㅋㅋㅋㅋ → ㅋㅋ, !!!!! → !!
-    s = _REPEAT_RE.sub(lambda m: m.group(1) * 2, s)
+def normalize_series(texts: pd.Series) -> pd.Series:
+    """normalize_text의 배치 버전 (같은 index의 Series 반환)
 
-    # 공백 정리
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    - 같은 원문은 한 번만 정규화한다(짧은 리뷰 "좋아요" 등은 중복이 많음).
+    - 결측값(None/NaN)은 빈 문자열로 정규화한다(`texts.fillna("").map(normalize_text)`와 동일).
+    """
+    codes, uniques = pd.factorize(texts.fillna("").astype(str))
+    s = pd.Series(uniques, dtype=object).str.lower()
+    for src, dst in _UNIT_REPLACEMENTS:
+        s = s.str.replace(src, dst, regex=False)
+    s = s.str.replace(_DISALLOWED_RE, " ", regex=True)
+    s = s.str.replace(_REPEAT_RE, _collapse_repeat, regex=True)
+    s = s.str.replace(_SPACE_RE, " ", regex=True).str.strip()
+    return pd.Series(s.to_numpy(dtype=object)[codes], index=texts.index, dtype=object)
 
 
 def sha1_of_text(text: str) -> str:
@@ -36,18 +64,83 @@ def sha1_of_text(text: str) -> str:
     return hashlib.sha1(text.encode("utf-8")).hexdigest()
 
 
-def dedupe_reviews(df: pd.DataFrame) -> Tuple[pd.DataFrame, int, int]:
-    """리뷰 데이터프레임 중복 제거(exact)"""
+def dedupe_reviews(
+    df: pd.DataFrame,
+    mode: str = "exact",
+    near_threshold: float = 0.8,
+    near_min_chars: int = 20,
+) -> Tuple[pd.DataFrame, int, int]:
+    """리뷰 데이터프레임 중복 제거
+
+    Args:
+        df: 리뷰 데이터프레임 (text)
+        mode: "exact" = 정규화 텍스트 SHA1 완전 일치만 제거,
+              "near" = exact 제거 후 MinHash LSH로 근접 중복(복붙/템플릿 리뷰)까지 제거
+        near_threshold: near 모드에서 같은 리뷰로 볼 추정 Jaccard 유사도 하한
+        near_min_chars: near 모드 비교 대상 최소 길이(공백 제외)
+
+    Returns:
+        (df, total, removed) — near 모드에서는 남은 행에 클러스터 컬럼이 추가된다.
+        - `_dup_count`: 대표 포함 클러스터 크기
+        - `_dup_ids`: 이 행(대표)으로 합쳐져 제거된 review_id 목록 (중복 없으면 빈 리스트)
+        (df.attrs는 파생 프레임마다 깊은 복사되므로 쓰지 않는다)
+    """
     df = df.copy()
-    df["_norm_text"] = df["text"].fillna("").map(normalize_text)
+    df["_norm_text"] = normalize_series(df["text"])
     df["_sha1"] = df["_norm_text"].map(sha1_of_text)
 
     total = len(df)
     df = df.drop_duplicates(subset=["_sha1"]).reset_index(drop=True)
+
+    if mode == "near":
+        df = _drop_near_duplicates(df, near_threshold, near_min_chars)
+    elif mode != "exact":
+        raise ValueError(f"지원하지 않는 중복 제거 모드: {mode}")
+
     removed = total - len(df)
     return df, total, removed
 
 
+def _drop_near_duplicates(df: pd.DataFrame, threshold: float, min_chars: int) -> pd.DataFrame:
+    """근접 중복 클러스터마다 가장 앞선 리뷰만 남김"""
+    rep = near_duplicate_clusters(df["_norm_text"].tolist(), threshold=threshold, min_chars=min_chars)
+    keep = rep == np.arange(len(df))
+    members = cluster_members(rep)
+
+    ids = df["review_id"].astype(str).tolist() if "review_id" in df.columns else [str(i) for i in range(len(df))]
+
+    out = df[keep].reset_index(drop=True)
+    out["_dup_count"] = np.bincount(rep, minlength=len(df))[keep]
+    out["_dup_ids"] = [[ids[m] for m in members.get(r, ())] for r in np.flatnonzero(keep).tolist()]
+    logger.info(f"[근접 중복 제거] 클러스터 {len(members)}개, 제거 {int((~keep).sum())}건")
+    return out
+
+
+# 벤더별 컬럼 매핑: 표준 필드 → 원본 컬럼 후보(앞에서부터, 존재하는 첫 컬럼 사용)
+# - smartstore: JSON 파일 형식(review_id, rating, text, created_at) + 레거시 CSV 형식(review_text, created_date, reviewer_name)
+# - coupang: TODO (형식 확정 전이라 매핑 없음 → 모든 필드 기본값)
+VENDOR_COLUMN_MAPPINGS: Dict[str, Dict[str, List[str]]] = {
+    "smartstore": {
+        "review_id": ["review_id", "id"],
+        "text": ["text", "review_text"],
+        "rating": ["rating"],
+        "date": ["created_at", "created_date"],
+        "author": ["author", "reviewer_name"],
+    },
+    "coupang": {},
+}
+
+# 표준 리뷰 필드와 기본값 (컬럼 순서 유지)
+REVIEW_FIELD_DEFAULTS: Dict[str, Any] = {
+    "review_id": "",
+    "text": "",
+    "rating": 0,
+    "date": "",
+    "author": "",
+    "verified": False,
+}
+
+
 def normalize_review(review: dict, vendor: str) -> dict:
     """
     벤더별로 다른 형식의 리뷰를 표준 형식으로 변환
@@ -59,27 +152,34 @@ def normalize_review(review: dict, vendor: str) -> dict:
     Returns:
         정규화된 리뷰 데이터 (text, rating, date, author, verified)
     """
-    normalized = {
-        "review_id": "",  # 추가: review_id 필드
-        "text": "",
-        "rating": 0,
-        "date": "",
-        "author": "",
-        "verified": False
-    }
-    
-    if vendor == "smartstore":
-        # JSON 파일 형식: review_id, rating, text, created_at
-        # 레거시 CSV 형식: review_text, rating, created_date, reviewer_name
-        normalized["review_id"] = review.get("review_id", review.get("id", ""))  # review_id 추출
-        normalized["text"] = review.get("text", review.get("review_text", ""))
-        normalized["rating"] = review.get("rating", 0)
-        normalized["date"] = review.get("created_at", review.get("created_date", ""))
-        normalized["author"] = review.get("author", review.get("reviewer_name", ""))
-    elif vendor == "coupang":
-        # TODO: Coupang 형식 처리
-        pass
-    
+    normalized = dict(REVIEW_FIELD_DEFAULTS)
+    for field, sources in VENDOR_COLUMN_MAPPINGS.get(vendor, {}).items():
+        for src in sources:
+            if src in review:
+                normalized[field] = review[src]
+                break
     return normalized
 
 
+def normalize_review_frame(reviews_df: pd.DataFrame, vendor: str) -> pd.DataFrame:
+    """normalize_review의 DataFrame 버전 - 행 단위 dict 없이 컬럼 선택/기본값 채우기로 변환
+
+    Args:
+        reviews_df: 원본 리뷰 데이터프레임
+        vendor: 벤더 이름 (smartstore, coupang 등)
+
+    Returns:
+        표준 컬럼(review_id, text, rating, date, author, verified)만 가진 데이터프레임 (RangeIndex)
+    """
+    mapping = VENDOR_COLUMN_MAPPINGS.get(vendor, {})
+    n = len(reviews_df)
+
+    columns: Dict[str, Any] = {}
+    for field, default in REVIEW_FIELD_DEFAULTS.items():
+        src = next((c for c in mapping.get(field, []) if c in reviews_df.columns), None)
+        if src is not None:
+            columns[field] = reviews_df[src].to_numpy()
+        else:
+            columns[field] = np.full(n, default, dtype=object if isinstance(default, str) else None)
+
+    return pd.DataFrame(columns, index=pd.RangeIndex(n))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Multi-process chunked scoring (Domain Layer - Pure Python)
+
+리뷰가 아주 많은 상품(10만 건+)은 정규화 텍스트를 청크로 나눠 ProcessPoolExecutor에서 점수를 계산하고,
+청크별 ScoreMatrix를 행 방향으로 이어붙여 단일 프로세스와 같은 결과를 만든다.
+
+- 워커 풀은 프로세스당 하나를 만들어 재사용한다(요청마다 프로세스를 띄우지 않음).
+- 워커는 forkserver로 띄운다. API 프로세스는 이미 io/cpu 스레드 풀을 돌리고 있어서 fork하면
+  다른 스레드가 잡고 있던 lock(logging, prometheus 등)을 물려받아 교착될 수 있다.
+- 풀을 만든 factor 구성의 매처는 워커 시작 시(initializer) 미리 컴파일한다.
+  다른 factor 구성은 워커별 첫 청크에서 컴파일해 `get_factor_matcher` 캐시에 보관한다.
+- 리뷰 수가 `min_reviews` 미만이면 프로세스 간 전송 비용이 더 커서 단일 프로세스로 계산한다.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from .matcher import get_factor_matcher
+from .score_matrix import ScoreMatrix
+from ....adapters.persistence.reg.store import Factor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ParallelScoring:
+    """병렬 스코어링 설정"""
+    n_workers: int = 0        # 0 이하 = CPU 코어 수
+    chunk_size: int = 20000   # 워커 1회 작업 단위(리뷰 수)
+    min_reviews: int = 100000  # 이 수 이상일 때만 병렬 처리 (crossover)
+
+    @property
+    def workers(self) -> int:
+        return self.n_workers if self.n_workers > 0 else (os.cpu_count() or 1)
+
+    def should_parallelize(self, n_reviews: int) -> bool:
+        return self.workers > 1 and n_reviews >= self.min_reviews and n_reviews > self.chunk_size
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()  # cpu 실행기 스레드 여러 개가 동시에 풀을 만들지 않도록
+
+
+def _mp_context() -> mp.context.BaseContext:
+    """forkserver (지원하지 않는 플랫폼은 spawn) - 스레드가 도는 프로세스에서 fork하지 않음"""
+    return mp.get_context("forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn")
+
+
+def _init_worker(factors: List[Factor]) -> None:
+    """워커 시작 시 매처 미리 컴파일"""
+    get_factor_matcher(factors)
+
+
+def _get_pool(n_workers: int, factors: List[Factor]) -> ProcessPoolExecutor:
+    """프로세스 공용 워커 풀 (워커 수가 바뀌면 재생성)"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != n_workers:
+            _shutdown_pool_locked()
+            _pool = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=_mp_context(),
+                initializer=_init_worker,
+                initargs=(list(factors),),
+            )
+            _pool_workers = n_workers
+            logger.info(f"[병렬 스코어링] 워커 풀 생성: workers={n_workers}")
+        return _pool
+
+
+def _shutdown_pool_locked() -> None:
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+def shutdown_pool(pool: Optional[ProcessPoolExecutor] = None) -> None:
+    """워커 풀 종료 (pool을 주면 그 풀이 아직 공용 풀일 때만 - 다른 요청이 이미 새로 만든 풀은 유지)"""
+    with _pool_lock:
+        if pool is None or pool is _pool:
+            _shutdown_pool_locked()
+
+
+atexit.register(shutdown_pool)
+
+
+def score_in_chunks(
+    score_fn: Callable[[Sequence[str], np.ndarray, List[Factor]], ScoreMatrix],
+    norm_texts: Sequence[str],
+    rating_mult: np.ndarray,
+    factors: List[Factor],
+    config: ParallelScoring,
+) -> ScoreMatrix:
+    """정규화 텍스트를 청크로 나눠 워커 풀에서 score_fn 실행 후 행 순서대로 병합
+
+    Args:
+        score_fn: 청크 스코어링 함수 (모듈 최상위 함수여야 pickle 가능)
+        norm_texts: 정규화된 리뷰 텍스트
+        rating_mult: 리뷰별 평점 가중치
+        factors: Factor 리스트
+        config: 병렬 설정
+
+    Returns:
+        전체 리뷰에 대한 ScoreMatrix (단일 프로세스 결과와 동일)
+
+    Raises:
+        BrokenProcessPool: 워커 프로세스가 비정상 종료됨 (손상된 풀은 버린 뒤 전파)
+    """
+    norm_texts = list(norm_texts)
+    rating_mult = np.asarray(rating_mult, dtype=float)
+    bounds = range(0, len(norm_texts), config.chunk_size)
+
+    pool = _get_pool(config.workers, factors)
+    futures = []
+    try:
+        for lo in bounds:
+            futures.append(pool.submit(
+                score_fn, norm_texts[lo:lo + config.chunk_size], rating_mult[lo:lo + config.chunk_size], factors
+            ))
+        parts = [f.result() for f in futures]
+    except BrokenProcessPool:
+        # 워커가 죽은 풀은 다시 쓸 수 없으므로 버림 (다음 호출에서 새로 생성)
+        shutdown_pool(pool)
+        raise
+    except BaseException:
+        # 청크 오류 등 풀과 무관한 실패 - 풀은 유지하고 남은 청크만 취소
+        for f in futures:
+            f.cancel()
+        raise
+
+    logger.info(
+        f"[병렬 스코어링] reviews={len(norm_texts)}, chunks={len(parts)}, workers={config.workers}"
+    )
+    return ScoreMatrix.vstack(parts)
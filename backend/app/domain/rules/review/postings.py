@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Per-factor evidence posting lists (Domain Layer - Pure Python)
+
+분석 시점에 factor마다 한 번만 만들어 두는 순위 목록:
+
+- `ranked_rows`: 점수 > 0인 리뷰 행 위치, 점수 내림차순 → 같은 점수 안에서는 factor term BM25 내림차순
+  (그다음 행 순서) — factor-reviews 목록
+- evidence 후보(anchor term이 실제로 있는 리뷰)와 후보별 라벨(NEG/MIX/POS/NEU), 근거 플래그
+- `by_label`: 라벨별 후보 목록(순위 순)
+
+evidence quota 선택은 라벨 목록의 앞에서부터 필요한 만큼만 꺼내므로
+요청마다 scored_df 전체를 필터/정렬하거나 라벨을 다시 분류하지 않는다.
+(목록이 전체 후보를 이미 잘 정렬해 두었으므로 상위 N배 후보 풀을 따로 뽑을 필요도 없다.)
+행 위치는 스코어링한 DataFrame의 iloc 기준이다.
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .bm25 import TermIndex, build_factor_term_index, factor_query_terms
+from .labeler import CueLabeler
+from .normalize import normalize_series
+from .retrieval import _contains_any
+from .score_matrix import ScoreMatrix
+from ....adapters.persistence.reg.store import Factor
+
+logger = logging.getLogger(__name__)
+
+
+LABELS = ("NEG", "MIX", "POS", "NEU")
+
+
+@dataclass
+class FactorPostings:
+    """factor 1개의 순위 목록 (후보 배열은 모두 순위 순으로 정렬)"""
+    factor_key: str
+    ranked_rows: np.ndarray   # int64, 점수 > 0인 행 위치 (점수 → BM25 내림차순)
+    rows: np.ndarray          # int64, evidence 후보 행 위치
+    scores: np.ndarray        # float64
+    bm25: np.ndarray          # float64, factor term 질의 BM25
+    review_ids: np.ndarray    # str
+    labels: np.ndarray        # str, NEG/MIX/POS/NEU
+    has_context: np.ndarray   # bool
+    has_negation: np.ndarray  # bool
+    by_label: Dict[str, np.ndarray] = field(default_factory=dict)  # 라벨 → 후보 번호(순위 순)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def pick(
+        self,
+        quota: Dict[str, int],
+        seen_ids: set,
+        max_total_pick: int,
+    ) -> List[int]:
+        """라벨 quota 우선 → 남는 슬롯은 순위 순으로 보충 (retrieval `_pick_by_quota`와 같은 규칙)
+
+        Args:
+            quota: {"NEG":2,"MIX":2,"POS":1} 등
+            seen_ids: 전역 중복 방지 (선택한 review_id가 추가됨)
+            max_total_pick: 이 factor에서 뽑을 최대치(보충 포함)
+
+        Returns:
+            선택된 후보 번호 리스트 (quota 선택분 순위 순 + 보충분 순위 순)
+        """
+        n = len(self.rows)
+        picked: List[int] = []
+        if max_total_pick <= 0 or n == 0:
+            return picked
+
+        # 1) quota 우선 채우기: quota가 남은 라벨 목록들의 앞부분을 순위 순으로 병합
+        counts = {k: 0 for k in quota}
+        lists = {k: self.by_label.get(k, np.zeros(0, dtype=np.int64)) for k, q in quota.items() if q > 0}
+        ptr = {k: 0 for k in lists}
+        heap = [(int(v[0]), k) for k, v in lists.items() if len(v)]
+        heapq.heapify(heap)
+        while heap and len(picked) < max_total_pick:
+            e, label = heapq.heappop(heap)
+            rid = self.review_ids[e]
+            if rid and rid not in seen_ids:
+                picked.append(e)
+                counts[label] += 1
+                seen_ids.add(rid)
+            ptr[label] += 1
+            if counts[label] < quota[label] and ptr[label] < len(lists[label]):
+                heapq.heappush(heap, (int(lists[label][ptr[label]]), label))
+
+        # 2) quota 미달분 보충(NEU 포함): 점수 높은 순으로 채움
+        for e in range(n):
+            if len(picked) >= max_total_pick:
+                break
+            rid = self.review_ids[e]
+            if not rid or rid in seen_ids:
+                continue
+            picked.append(e)
+            seen_ids.add(rid)
+        return picked
+
+    def pool(self, quota: Dict[str, int], seen_ids: set, max_total_pick: int, factor: int = 4) -> List[int]:
+        """MMR 후보 풀: 라벨별 아직 안 뽑힌 상위 quota × factor개 + 전체 상위 max_total_pick × factor개 (순위 순)"""
+        def first_unseen(entries, k: int) -> List[int]:
+            out: List[int] = []
+            for e in entries:
+                if len(out) >= k:
+                    break
+                rid = self.review_ids[e]
+                if rid and rid not in seen_ids:
+                    out.append(int(e))
+            return out
+
+        chosen = set(first_unseen(range(len(self.rows)), max_total_pick * factor))
+        for label, q in quota.items():
+            if q > 0:
+                chosen.update(first_unseen(self.by_label.get(label, ()), q * factor))
+        return sorted(chosen)
+
+
+def row_signature(df: pd.DataFrame) -> str:
+    """행 구성 서명: review_id 순서의 해시 (행 수가 같아도 리뷰가 바뀌거나 순서가 다르면 달라짐)"""
+    h = hashlib.sha1(str(len(df)).encode("ascii"))
+    if "review_id" in df.columns:
+        h.update(pd.util.hash_pandas_object(df["review_id"].astype(str), index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+@dataclass
+class EvidencePostings:
+    """분석 결과 1건(리뷰 스냅샷 × factor 구성)의 factor별 순위 목록"""
+    n_reviews: int
+    factors: Dict[str, FactorPostings]
+    term_index: Optional[TermIndex] = None  # 리뷰 스냅샷의 factor term 역색인
+    signature: str = ""                     # 만들 때 df의 `row_signature` (행 위치가 같은 리뷰를 가리키는지 확인용)
+
+    def get(self, factor_key: str) -> Optional[FactorPostings]:
+        return self.factors.get(factor_key)
+
+    def matches(self, df: pd.DataFrame) -> bool:
+        """df가 이 목록을 만든 스코어링 결과와 같은 행 구성인지 (행 수 + review_id 순서)"""
+        return self.n_reviews == len(df) and self.signature == row_signature(df)
+
+
+def build_factor_postings(
+    df: pd.DataFrame,
+    matrix: ScoreMatrix,
+    f: Factor,
+    labeler: CueLabeler,
+    term_index: TermIndex,
+) -> FactorPostings:
+    """factor 1개의 순위 목록 생성 (라벨/색인은 factor들이 공유)"""
+    j = matrix.factor_index(f.factor_key)
+    ranked = matrix.ranked_rows(j).astype(np.int64) if j is not None else np.zeros(0, dtype=np.int64)
+    score_col = matrix.column(j) if j is not None else np.zeros(len(df), dtype=float)
+
+    # 점수 내림차순(ranked_rows) 안에서 동점은 BM25 내림차순으로
+    bm25 = term_index.score(factor_query_terms(f), ranked)
+    order = np.lexsort((np.arange(len(ranked)), -bm25, -score_col[ranked]))
+    ranked, bm25 = ranked[order], bm25[order]
+
+    sub = df.iloc[ranked]
+    if "_norm_text" in sub.columns:
+        norms = sub["_norm_text"].fillna("").astype(str)
+    else:
+        norms = pd.Series("", index=sub.index)
+    rids = sub["review_id"].astype(str).to_numpy() if "review_id" in sub.columns else np.full(len(sub), "")
+
+    # evidence 후보: review_id 있음 + anchor term 매칭 (retrieval과 같은 기준)
+    keep = np.flatnonzero((rids != "") & _contains_any(norms, f.anchor_terms))
+    cand = sub.iloc[keep]
+    texts = cand["text"].tolist() if "text" in cand.columns else [""] * len(cand)
+    cand_norms = cand["_norm_text"].tolist() if "_norm_text" in cand.columns else [None] * len(cand)
+    labels = np.array(
+        [labeler.label(t or "", f.factor_key, norm_text=nt) for t, nt in zip(texts, cand_norms)],
+        dtype=object,
+    )
+
+    rows = ranked[keep]
+    by_label = {lab: np.flatnonzero(labels == lab) for lab in LABELS}
+    return FactorPostings(
+        factor_key=f.factor_key,
+        ranked_rows=ranked,
+        rows=rows,
+        scores=score_col[rows],
+        bm25=bm25[keep],
+        review_ids=rids[keep],
+        labels=labels,
+        has_context=_contains_any(norms, f.context_terms)[keep],
+        has_negation=_contains_any(norms, f.negation_terms)[keep],
+        by_label=by_label,
+    )
+
+
+def build_evidence_postings(df: pd.DataFrame, matrix: ScoreMatrix, factors: List[Factor]) -> EvidencePostings:
+    """분석 시점에 모든 factor의 순위 목록 생성
+
+    Args:
+        df: 스코어링한 리뷰 DataFrame (review_id, text, `_norm_text`; 행 순서 = matrix 행 순서)
+        matrix: df의 점수 행렬
+        factors: Factor 리스트
+
+    Returns:
+        EvidencePostings
+    """
+    # 행 선택(iloc)마다 점수 컬럼까지 복사하지 않도록 필요한 컬럼만
+    base = df[[c for c in ("review_id", "text", "_norm_text") if c in df.columns]]
+    labeler = CueLabeler(factors, window=30)
+    norms = base["_norm_text"] if "_norm_text" in base.columns else normalize_series(base["text"])
+    term_index = build_factor_term_index(norms, factors)
+    postings = {f.factor_key: build_factor_postings(base, matrix, f, labeler, term_index) for f in factors}
+    logger.debug(
+        f"[posting] reviews={len(df)}, factors={len(postings)}, "
+        f"candidates={sum(len(p) for p in postings.values())}"
+    )
+    return EvidencePostings(n_reviews=len(df), factors=postings, term_index=term_index, signature=row_signature(df))
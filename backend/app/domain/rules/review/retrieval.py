@@ -5,18 +5,28 @@ from __future__ import annotations
 import logging
 import math
 import re
-from typing import Dict, List, Tuple, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple, Any, Optional
 
+import numpy as np
 import pandas as pd
 
 # Import from domain layer
 from .normalize import normalize_text as normalize
+from .diversity import RedundancyTracker, mmr_select, text_signatures
+from .labeler import NEG_CUES, POS_CUES, SWITCH_CUES, CueLabeler
+from .sentence_index import SENT_SPLIT_RE, ReviewAnnotation, SentenceIndex, build_excerpt
 from ....adapters.persistence.reg.store import Factor
 
+if TYPE_CHECKING:
+    from .postings import EvidencePostings, FactorPostings
+    from .score_matrix import ScoreMatrix
+
 logger = logging.getLogger(__name__)
 
 
-_SENT_SPLIT_RE = re.compile(r"(?<=[\.!?。！？])\s+|\n+")
+_SENT_SPLIT_RE = SENT_SPLIT_RE
+
+MMR_POOL_FACTOR = 4  # MMR 후보 풀: 라벨별 quota × 4개 + 보충용 상위 max_pick × 4개
 
 
 def _safe_float(v: Any, default: float = 0.0) -> float:
@@ -40,15 +50,40 @@ def _safe_int(v: Any, default: int = 0) -> int:
         return default
 
 
-def extract_relevant_sentences(full_text: str, factor_obj: Factor, max_len: int = 160) -> str:
-    """factor(anchor/context)에 걸리는 문장만 뽑아 발췌."""
+def extract_relevant_sentences(
+    full_text: str,
+    factor_obj: Factor,
+    max_len: int = 160,
+    norm_text: Optional[str] = None,
+    annotation: Optional[ReviewAnnotation] = None,
+) -> str:
+    """factor(anchor/context)에 걸리는 문장만 뽑아 발췌.
+
+    norm_text: 이미 계산된 전체 정규화 텍스트(`_norm_text`). 정규화된 문장은 전체 정규화 텍스트의
+    부분 문자열이므로, 전체에 term이 하나도 없으면 문장별 정규화 없이 바로 fallback으로 간다.
+    annotation: SentenceIndex의 리뷰 주석. 있으면 문장 분리/정규화 없이 주석만 읽는다.
+    """
     if not full_text:
         return ""
 
+    terms = list(factor_obj.anchor_terms) + list(factor_obj.context_terms)
+    if annotation is not None:
+        excerpt, _ = build_excerpt(annotation, terms, max_len)
+        if excerpt:
+            return excerpt
+        if annotation.sentences:
+            return annotation.sentences[0].text[:max_len]
+        return full_text[:max_len]
+
     sents = _SENT_SPLIT_RE.split(full_text)
     selected: List[str] = []
 
-    for s_raw in sents:
+    if norm_text is not None and not any(t in norm_text for t in terms):
+        sents_to_check: List[str] = []
+    else:
+        sents_to_check = sents
+
+    for s_raw in sents_to_check:
         s_raw = (s_raw or "").strip()
         if not s_raw:
             continue
@@ -72,34 +107,31 @@ def extract_relevant_sentences(full_text: str, factor_obj: Factor, max_len: int
 
 # ------------------------- Labeling helpers -------------------------
 
-_POS_CUES = [
-    "괜찮", "좋", "만족", "추천", "문제없", "이상없", "잘됨", "잘되",
-    "조용", "무소음", "안시끄", "소음없", "냄새없", "연기없", "불편없", "안불편",
-    "간편", "편하", "쉬움", "빠르", "튼튼", "견고", "안전", "깨끗",
-]
-_NEG_CUES = [
-    "불만", "별로", "실망", "후회", "비추", "문제", "고장", "as", "a/s", "환불",
-    "시끄", "소음", "냄새", "연기", "뜨거", "화상", "위험", "누수", "샘", "물샘",
-    "번거", "귀찮", "청소", "관리", "곰팡", "세척", "부식", "녹", "때",
-    "약함", "부족", "미흡", "안됨", "안되", "끊김", "오류",
-]
-_SWITCH_CUES = ["근데", "하지만", "다만", "그러나", "반면", "대신", "오히려", "그런데"]
+_POS_CUES = POS_CUES
+_NEG_CUES = NEG_CUES
+_SWITCH_CUES = SWITCH_CUES
 
 
 def _find_any(hay: str, needles: List[str]) -> bool:
     return any(n in hay for n in needles)
 
 
-def classify_text_label(full_text: str, factor_obj: Factor, window: int = 30) -> str:
+def classify_text_label(
+    full_text: str,
+    factor_obj: Factor,
+    window: int = 30,
+    norm_text: Optional[str] = None,
+) -> str:
     """
     factor 관련 텍스트에서 POS/NEG/MIX/NEU 라벨 추정.
     - anchor/context 매칭 지점을 중심으로 주변 문맥(window chars)만 평가
     - negation_terms는 감점이 아니라 '우려 해소' 힌트로 활용
+    - norm_text: 이미 계산된 정규화 텍스트(`_norm_text`)가 있으면 다시 정규화하지 않음
     """
     if not full_text:
         return "NEU"
 
-    nt = normalize(full_text)
+    nt = norm_text if norm_text is not None else normalize(full_text)
 
     terms = factor_obj.anchor_terms or factor_obj.context_terms
     hit_idxs = []
@@ -159,16 +191,23 @@ def _pick_by_quota(
     quota: Dict[str, int],
     seen_ids: set,
     max_total_pick: int,
+    label_fn: Optional[Callable[[Dict], str]] = None,
 ) -> List[Dict]:
     """
     candidates: score 내림차순으로 정렬된 후보 dict 리스트
     quota: {"NEG":2,"MIX":2,"POS":1} 등
     seen_ids: 전역 중복 방지
     max_total_pick: 이 factor에서 뽑을 최대치(보충 포함)
+    label_fn: "label"이 없는 후보의 라벨 계산 함수 (실제로 살펴본 후보만 계산해 c["label"]에 저장)
     """
     picked: List[Dict] = []
     counts = {k: 0 for k in ["NEG", "MIX", "POS", "NEU"]}
 
+    def label_of(c: Dict) -> str:
+        if "label" not in c and label_fn is not None:
+            c["label"] = label_fn(c)
+        return c.get("label", "NEU")
+
     def can_take(label: str) -> bool:
         if label in quota:
             return counts[label] < quota[label]
@@ -181,7 +220,7 @@ def _pick_by_quota(
         rid = c.get("review_id")
         if not rid or rid in seen_ids:
             continue
-        label = c.get("label", "NEU")
+        label = label_of(c)
         if can_take(label):
             picked.append(c)
             counts[label] += 1
@@ -197,12 +236,199 @@ def _pick_by_quota(
             if not rid or rid in seen_ids:
                 continue
             picked.append(c)
-            counts[c.get("label", "NEU")] = counts.get(c.get("label", "NEU"), 0) + 1
+            label = label_of(c)
+            counts[label] = counts.get(label, 0) + 1
             seen_ids.add(rid)
 
     return picked
 
 
+def _candidate_pool(vals: np.ndarray, k: int) -> np.ndarray:
+    """점수 > 0인 행 위치(iloc)를 점수 내림차순(동점은 행 순서)으로 최대 k개"""
+    positive = np.flatnonzero(vals > 0)
+    return positive[np.argsort(-vals[positive], kind="stable")][:k]
+
+
+def _factor_score_values(df: pd.DataFrame, matrix: Optional["ScoreMatrix"], factor_key: str) -> np.ndarray:
+    """factor 점수 배열(df 행 순서) - 점수 행렬이 있으면 그 열, 없으면 score_{factor_key} 컬럼"""
+    if matrix is not None:
+        return matrix.column(matrix.factor_index(factor_key))
+    return _score_values(df[f"score_{factor_key}"])
+
+
+def _score_values(scores: pd.Series) -> np.ndarray:
+    """점수 컬럼(sparse 포함) → float 배열 (결측은 0)"""
+    return np.nan_to_num(np.asarray(scores, dtype=float), nan=0.0)
+
+
+def _contains_any(texts: pd.Series, terms: List[str]) -> np.ndarray:
+    """texts 각각에 terms 중 하나라도 포함되는지 (bool 배열)"""
+    if not terms or len(texts) == 0:
+        return np.zeros(len(texts), dtype=bool)
+    pattern = "|".join(re.escape(t) for t in terms)
+    return texts.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+
+
+def _reasons(factor_key: str, has_context: bool, has_negation: bool) -> List[str]:
+    reasons = [f"{factor_key}+anchor"]
+    if has_context:
+        reasons.append(f"{factor_key}+context")
+    if has_negation:
+        reasons.append(f"{factor_key}+negation")
+    return reasons
+
+
+def _finalize_candidate(
+    c: Dict,
+    df: pd.DataFrame,
+    f: Factor,
+    sentence_index: Optional[SentenceIndex],
+) -> Dict:
+    """선택된 후보에만 평점/발췌문/하이라이트 채우기 (c["_row"] = df 행 위치)"""
+    idx = df.index[c["_row"]]
+    row = df.iloc[c["_row"]]
+    text = row.get("text") or ""
+    norm_text = row.get("_norm_text")  # 없으면 None → 각 함수에서 정규화
+
+    annotation = sentence_index.annotation(idx) if sentence_index is not None else None
+    excerpt, highlights = "", []
+    if annotation is not None:
+        excerpt, highlights = build_excerpt(annotation, list(f.anchor_terms) + list(f.context_terms), max_len=160)
+    if not excerpt:
+        excerpt = extract_relevant_sentences(text, f, max_len=160, norm_text=norm_text, annotation=annotation)
+
+    out = {
+        "review_id": c["review_id"],
+        "rating": _safe_int(row.get("rating"), 0),
+        "excerpt": excerpt,
+        "reason": c["reason"],
+        "factor": c["factor"],
+        "score": c["score"],
+        "label": c.get("label", "NEU"),
+    }
+    if annotation is not None:
+        out["highlights"] = highlights
+    return out
+
+
+def _pool_signatures(df: pd.DataFrame, rows: Sequence[int]) -> np.ndarray:
+    """후보 행들의 정규화 텍스트 MinHash 서명 (MMR 중복도 계산용)"""
+    if "_norm_text" in df.columns:
+        norms = df["_norm_text"].iloc[list(rows)].fillna("").astype(str).tolist()
+    else:
+        norms = [normalize(t) for t in df["text"].iloc[list(rows)].tolist()]
+    return text_signatures(norms)
+
+
+def _pick_from_postings(
+    fp: "FactorPostings",
+    df: pd.DataFrame,
+    factor_key: str,
+    quota: Dict[str, int],
+    seen_ids: set,
+    max_pick: int,
+    tracker: Optional[RedundancyTracker] = None,
+    mmr_lambda: float = 1.0,
+) -> List[Dict]:
+    """분석 시점에 만든 라벨별 순위 목록에서 quota만큼 바로 선택 (tracker가 있으면 상위 후보 풀에서 MMR)"""
+    if tracker is None:
+        entries = fp.pick(quota, seen_ids, max_pick)
+    else:
+        pool = fp.pool(quota, seen_ids, max_pick, factor=MMR_POOL_FACTOR)
+        chosen = mmr_select(
+            labels=fp.labels[pool].tolist(),
+            review_ids=fp.review_ids[pool].tolist(),
+            sigs=_pool_signatures(df, fp.rows[pool]),
+            quota=quota,
+            seen_ids=seen_ids,
+            max_total_pick=max_pick,
+            tracker=tracker,
+            lam=mmr_lambda,
+        )
+        entries = [pool[i] for i in chosen]
+
+    return [
+        {
+            "review_id": str(fp.review_ids[e]),
+            "reason": _reasons(factor_key, bool(fp.has_context[e]), bool(fp.has_negation[e])),
+            "factor": factor_key,
+            "score": float(fp.scores[e]),
+            "label": fp.labels[e],
+            "_row": int(fp.rows[e]),
+        }
+        for e in entries
+    ]
+
+
+def _pick_from_frame(
+    df: pd.DataFrame,
+    score_values: np.ndarray,
+    f: Factor,
+    labeler: CueLabeler,
+    factor_key: str,
+    quota: Dict[str, int],
+    seen_ids: set,
+    max_pick: int,
+    pool_limit: int,
+    tracker: Optional[RedundancyTracker] = None,
+    mmr_lambda: float = 1.0,
+) -> List[Dict]:
+    """factor 점수(df 행 순서)에서 후보 풀을 만들어 선택 (posting 목록이 없을 때, tracker가 있으면 MMR)"""
+    pool = _candidate_pool(score_values, pool_limit)
+    if "review_id" not in df.columns or len(pool) == 0:
+        return []
+    sub = df.iloc[pool]
+
+    # 후보 필터/근거 플래그를 컬럼 연산으로 (review_id 있음, anchor 매칭)
+    norms = sub["_norm_text"].fillna("").astype(str) if "_norm_text" in sub.columns else pd.Series("", index=sub.index)
+    rids = sub["review_id"].astype(str).to_numpy()
+    has_anchor = _contains_any(norms, f.anchor_terms)
+    has_context = _contains_any(norms, f.context_terms)
+    has_negation = _contains_any(norms, f.negation_terms)
+    keep = np.flatnonzero((rids != "") & has_anchor)  # ✅ anchor_terms가 없는 리뷰는 증거로 부적합
+
+    scores = score_values[pool]
+    candidates: List[Dict] = [
+        {
+            "review_id": rids[i],
+            "reason": _reasons(factor_key, has_context[i], has_negation[i]),
+            "factor": factor_key,
+            "score": float(scores[i]),
+            "_row": int(pool[i]),
+        }
+        for i in keep.tolist()
+    ]
+
+    # 라벨은 quota 선택 중 필요한 후보만 계산
+    def label_of(c: Dict) -> str:
+        row = df.iloc[c["_row"]]
+        return labeler.label(row.get("text") or "", factor_key, norm_text=row.get("_norm_text"))
+
+    if tracker is not None:
+        labels = [label_of(c) for c in candidates]
+        chosen = mmr_select(
+            labels=labels,
+            review_ids=[c["review_id"] for c in candidates],
+            sigs=_pool_signatures(df, [c["_row"] for c in candidates]),
+            quota=quota,
+            seen_ids=seen_ids,
+            max_total_pick=max_pick,
+            tracker=tracker,
+            lam=mmr_lambda,
+        )
+        for i in chosen:
+            candidates[i]["label"] = labels[i]
+        return [candidates[i] for i in chosen]
+
+    return _pick_by_quota(
+        candidates=candidates,
+        quota=quota,
+        seen_ids=seen_ids,
+        max_total_pick=max_pick,
+        label_fn=label_of,
+    )
+
+
 def retrieve_evidence_reviews(
     df: pd.DataFrame,
     factors_map: Dict[str, Factor],
@@ -210,35 +436,56 @@ def retrieve_evidence_reviews(
     per_factor_limit: Tuple[int, int] = (5, 8),
     max_total_evidence: int = 15,
     quota_by_rank: Optional[Dict[int, Dict[str, int]]] = None,
+    sentence_index: Optional[SentenceIndex] = None,
+    postings: Optional["EvidencePostings"] = None,
+    mmr_lambda: Optional[float] = None,
+    score_matrix: Optional["ScoreMatrix"] = None,
 ) -> List[Dict]:
     """
     상위 요인별 증거 리뷰 추출(라벨 quota 적용)
 
     Args:
-        df: score_XXX 컬럼이 있는 df
+        df: 리뷰 df (score_matrix가 없으면 score_XXX 컬럼 필요)
         factors_map: factor_key -> Factor
         top_factors: (factor_key, score) 리스트
         per_factor_limit: (min,max) (현재는 max를 후보/보충 상한으로 사용)
         max_total_evidence: 전체 evidence 상한
         quota_by_rank: {0:{...},1:{...}} 형태로 rank별 quota override 가능
+        sentence_index: df의 문장/term 주석 캐시 (있으면 발췌문에 하이라이트 위치 `highlights` 포함)
+        postings: 분석 시점에 만든 factor별 라벨 순위 목록 (점수 → BM25 순; df와 행 구성(review_id 순서)이 같을 때만 사용,
+            없으면 df에서 점수 상위 후보 풀을 뽑아 선택)
+        mmr_lambda: 있으면 거의 같은 리뷰가 슬롯을 채우지 않도록 MMR로 선택 (관련도 가중치, 1이면 순위 순과 동일)
+        score_matrix: df 행 순서의 점수 행렬 (있으면 score_XXX 컬럼 대신 사용)
 
     Returns:
         evidence dict list
     """
     evidence: List[Dict] = []
     seen_ids: set = set()
+    labeler: Optional[CueLabeler] = None  # posting 목록이 없는 factor가 있을 때만 생성 (factor 간 cue 위치 공유)
+    tracker = RedundancyTracker() if mmr_lambda is not None else None  # factor 간 중복도 공유
+    lam = mmr_lambda if mmr_lambda is not None else 1.0
 
     _, max_n = per_factor_limit
     quota_by_rank = quota_by_rank or {}
+    if postings is not None and not postings.matches(df):
+        logger.warning("  - posting 목록과 df 행 구성(review_id 순서)이 달라 사용하지 않음")
+        postings = None
+    if score_matrix is not None and score_matrix.n_reviews != len(df):
+        logger.warning("  - 점수 행렬과 df 행 수가 달라 score 컬럼 사용")
+        score_matrix = None
 
     for rank, (factor_key, _) in enumerate(top_factors):
         if len(evidence) >= max_total_evidence:
             logger.debug(f"  - 최대 evidence 수 도달 ({max_total_evidence}), 중단")
             break
 
-        col = f"score_{factor_key}"
-        if col not in df.columns:
-            logger.warning(f"  - factor '{factor_key}' 컴럼 없음, 스킵")
+        if score_matrix is not None:
+            has_scores = score_matrix.factor_index(factor_key) is not None
+        else:
+            has_scores = f"score_{factor_key}" in df.columns
+        if not has_scores:
+            logger.warning(f"  - factor '{factor_key}' 점수 없음, 스킵")
             continue
         if factor_key not in factors_map:
             logger.warning(f"  - factor '{factor_key}' factors_map에 없음, 스킵")
@@ -258,63 +505,23 @@ def retrieve_evidence_reviews(
         remaining_total = max_total_evidence - len(evidence)
         max_pick_here = min(max_pick_here, remaining_total)
 
-        # 후보 풀: 중복/0점 필터로 빠지는 것 감안해 넉넉히
-        try:
-            subset = df.nlargest(max_pick_here * 10, col)
-        except Exception:
-            subset = df.sort_values(col, ascending=False).head(max_pick_here * 10)
-
-        candidates: List[Dict] = []
-        for _, row in subset.iterrows():
-            rid = str(row["review_id"]) if "review_id" in row.index else None
-            if not rid:
-                continue
-
-            score = _safe_float(row.get(col), 0.0)
-            if score <= 0:
-                continue
-
-            norm = (row.get("_norm_text") or "")
-            reasons: List[str] = []
-
-            has_anchor = any(t in norm for t in f.anchor_terms)
-            if has_anchor:
-                reasons.append(f"{factor_key}+anchor")
-            if any(t in norm for t in f.context_terms):
-                reasons.append(f"{factor_key}+context")
-            if any(t in norm for t in f.negation_terms):
-                reasons.append(f"{factor_key}+negation")
-
-            # ✅ anchor_terms가 없는 리뷰는 증거로 부적합 (context만으로는 부족)
-            if not has_anchor:
-                continue
-
-            text = (row.get("text") or "")
-            excerpt = extract_relevant_sentences(text, f, max_len=160)
-            label = classify_text_label(text, f, window=30)
-
-            candidates.append(
-                {
-                    "review_id": rid,
-                    "rating": _safe_int(row.get("rating"), 0),
-                    "excerpt": excerpt,
-                    "reason": reasons,
-                    "factor": factor_key,
-                    "score": score,
-                    "label": label,
-                }
+        fp = postings.get(factor_key) if postings is not None else None
+        if fp is not None:
+            # posting 목록: 전체 후보가 (점수, BM25) 순으로 정렬되어 있어 후보 풀을 따로 뽑지 않음
+            # (MMR일 때만 라벨별 상위 quota × MMR_POOL_FACTOR개로 풀 제한)
+            picked = _pick_from_postings(fp, df, factor_key, quota, seen_ids, max_pick_here, tracker, lam)
+        else:
+            # 후보 풀: 중복/0점 필터로 빠지는 것 감안해 넉넉히 (점수 > 0, 내림차순, 동점은 행 순서)
+            pool_limit = max_pick_here * 10
+            if labeler is None:
+                labeler = CueLabeler(list(factors_map.values()), window=30)
+            scores = _factor_score_values(df, score_matrix, factor_key)
+            picked = _pick_from_frame(
+                df, scores, f, labeler, factor_key, quota, seen_ids, max_pick_here, pool_limit, tracker, lam
             )
 
-        # score 높은 순 정렬
-        candidates.sort(key=lambda x: float(x.get("score") or 0.0), reverse=True)
-
-        # quota 기반 선택
-        picked = _pick_by_quota(
-            candidates=candidates,
-            quota=quota,
-            seen_ids=seen_ids,
-            max_total_pick=max_pick_here,
-        )
+        # 발췌문은 최종 선택된 후보만 계산
+        picked = [_finalize_candidate(c, df, f, sentence_index) for c in picked]
 
         evidence.extend(picked)
 
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Review × Factor sparse score matrix (Domain Layer - Pure Python)
+
+점수 결과를 factor마다 DataFrame 컬럼 3개로 펼치는 대신,
+0이 아닌 점수만 저장하는 희소 행렬(factor 단위 압축, CSC) + negation 비트마스크로 보관한다.
+
+- 집계(factor별 합계/매칭 수), factor별 필터링/정렬은 행렬 연산으로 처리
+- 분석/세션은 행렬만 보관한다. score_* 컬럼이 필요한 곳(`compute_review_factor_scores`, 결과 CSV 저장)만
+  `to_frame_columns()`로 sparse 컬럼을 만들어 붙인다
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class ScoreMatrix:
+    """리뷰 × factor 희소 점수 행렬
+
+    factor(j)의 0이 아닌 점수는 `data[indptr[j]:indptr[j+1]]`,
+    해당 리뷰의 행 위치(0-based, DataFrame의 iloc 기준)는 `indices[...]`에 오름차순으로 저장된다.
+    negation 플래그는 리뷰마다 factor 비트를 packbits(little)로 묶어 `neg_bits`에 저장한다.
+    """
+    n_reviews: int
+    factor_keys: List[str]
+    factor_ids: List[int]
+    indptr: np.ndarray   # int64, (n_factors + 1,)
+    indices: np.ndarray  # int32, (nnz,)
+    data: np.ndarray     # float64, (nnz,)
+    neg_bits: np.ndarray  # uint8, (n_reviews, ceil(n_factors / 8))
+
+    # ----------------------------- 생성 -----------------------------
+
+    @classmethod
+    def from_dense(
+        cls,
+        scores: np.ndarray,
+        neg_mask: np.ndarray,
+        factor_keys: List[str],
+        factor_ids: List[int],
+    ) -> "ScoreMatrix":
+        """(n_reviews, n_factors) dense 점수/negation 배열에서 생성"""
+        scores = np.asarray(scores, dtype=float)
+        n_reviews, n_factors = scores.shape if scores.ndim == 2 else (0, len(factor_keys))
+
+        # factor-major 순서로 0이 아닌 값 수집 → 각 factor 안에서 행 번호 오름차순
+        cols, rows = np.nonzero(scores.T)
+        counts = np.bincount(cols, minlength=n_factors)
+        indptr = np.zeros(n_factors + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        neg_mask = np.asarray(neg_mask, dtype=bool).reshape(n_reviews, n_factors)
+        neg_bits = np.packbits(neg_mask, axis=1, bitorder="little")
+
+        return cls(
+            n_reviews=int(n_reviews),
+            factor_keys=list(factor_keys),
+            factor_ids=[int(x) for x in factor_ids],
+            indptr=indptr,
+            indices=rows.astype(np.int32),
+            data=scores.T[cols, rows].astype(float),
+            neg_bits=neg_bits,
+        )
+
+    @classmethod
+    def _from_triplets(
+        cls,
+        n_reviews: int,
+        factor_keys: List[str],
+        factor_ids: List[int],
+        rows: np.ndarray,
+        cols: np.ndarray,
+        data: np.ndarray,
+        neg_bits: np.ndarray,
+    ) -> "ScoreMatrix":
+        """(row, col, value) 트리플렛에서 생성 — factor별 행 번호 오름차순으로 정렬"""
+        order = np.lexsort((rows, cols))
+        counts = np.bincount(cols, minlength=len(factor_keys))
+        indptr = np.zeros(len(factor_keys) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(
+            n_reviews=int(n_reviews),
+            factor_keys=list(factor_keys),
+            factor_ids=list(factor_ids),
+            indptr=indptr,
+            indices=rows[order].astype(np.int32),
+            data=data[order].astype(float),
+            neg_bits=neg_bits,
+        )
+
+    def take_rows(self, rows: np.ndarray) -> "ScoreMatrix":
+        """지정한 행 위치만 골라 새 행렬 생성 (결과의 i번째 행 = 원본 rows[i]번째 행, rows는 중복 없음)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        inv = np.full(self.n_reviews, -1, dtype=np.int64)
+        inv[rows] = np.arange(len(rows))
+
+        new_rows = inv[self.indices]
+        keep = new_rows >= 0
+        return self._from_triplets(
+            len(rows), self.factor_keys, self.factor_ids,
+            new_rows[keep], self._column_ids()[keep], self.data[keep],
+            self.neg_bits[rows],
+        )
+
+    @classmethod
+    def vstack(cls, parts: List["ScoreMatrix"]) -> "ScoreMatrix":
+        """같은 factor 구성의 행렬들을 행 방향으로 이어붙임"""
+        first = parts[0]
+        for p in parts[1:]:
+            if p.factor_keys != first.factor_keys:
+                raise ValueError("factor 구성이 다른 ScoreMatrix는 이어붙일 수 없습니다")
+
+        offsets = np.cumsum([0] + [p.n_reviews for p in parts])
+        return cls._from_triplets(
+            int(offsets[-1]), first.factor_keys, first.factor_ids,
+            np.concatenate([p.indices.astype(np.int64) + off for p, off in zip(parts, offsets)]),
+            np.concatenate([p._column_ids() for p in parts]),
+            np.concatenate([p.data for p in parts]),
+            np.concatenate([p.neg_bits for p in parts], axis=0),
+        )
+
+    # ----------------------------- 조회 -----------------------------
+
+    @property
+    def n_factors(self) -> int:
+        return len(self.factor_keys)
+
+    @property
+    def nnz(self) -> int:
+        return int(self.data.shape[0])
+
+    def factor_index(self, factor_key: str) -> Optional[int]:
+        """factor_key → 열 위치 (없으면 None)"""
+        try:
+            return self.factor_keys.index(factor_key)
+        except ValueError:
+            return None
+
+    def column_entries(self, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        """factor j의 (행 위치, 점수) — 점수 > 0인 리뷰만, 행 순서"""
+        lo, hi = self.indptr[j], self.indptr[j + 1]
+        return self.indices[lo:hi], self.data[lo:hi]
+
+    def ranked_rows(self, j: int) -> np.ndarray:
+        """factor j에서 점수 > 0인 행 위치를 점수 내림차순으로(동점은 행 순서 유지)"""
+        rows, vals = self.column_entries(j)
+        return rows[np.argsort(-vals, kind="stable")]
+
+    def column(self, j: int) -> np.ndarray:
+        """factor j의 dense 점수 벡터"""
+        out = np.zeros(self.n_reviews, dtype=float)
+        rows, vals = self.column_entries(j)
+        out[rows] = vals
+        return out
+
+    def neg_column(self, j: int) -> np.ndarray:
+        """factor j의 negation 플래그 벡터"""
+        if self.n_reviews == 0:
+            return np.zeros(0, dtype=bool)
+        return ((self.neg_bits[:, j >> 3] >> (j & 7)) & 1).astype(bool)
+
+    def neg_mask(self) -> np.ndarray:
+        """(n_reviews, n_factors) negation 플래그 행렬"""
+        return np.unpackbits(self.neg_bits, axis=1, count=self.n_factors, bitorder="little").astype(bool)
+
+    def to_dense(self) -> np.ndarray:
+        """(n_reviews, n_factors) dense 점수 행렬"""
+        return self.dense_rows(0, self.n_reviews)
+
+    def dense_rows(self, lo: int, hi: int) -> np.ndarray:
+        """행 구간 [lo, hi)의 dense 점수 블록 (factor별 행 번호가 정렬돼 있어 searchsorted로 잘라냄)"""
+        lo, hi = max(0, lo), min(self.n_reviews, hi)
+        out = np.zeros((max(0, hi - lo), self.n_factors), dtype=float)
+        for j in range(self.n_factors):
+            rows, vals = self.column_entries(j)
+            a, b = np.searchsorted(rows, (lo, hi))
+            out[rows[a:b] - lo, j] = vals[a:b]
+        return out
+
+    def top_k_per_review(self, k: int = 3, chunk_size: int = 8192) -> Tuple[np.ndarray, np.ndarray]:
+        """리뷰별 상위 k개 factor (열 위치, 점수)
+
+        점수 내림차순, 동점이면 factor 순서가 앞선 것 우선(파이썬 stable sort와 동일한 결과).
+        np.partition으로 k번째 값을 구해 후보를 고른 뒤 k개만 정렬하므로 행 전체 정렬이 필요 없다.
+
+        Returns:
+            (idx, vals): 각각 (n_reviews, min(k, n_factors))
+        """
+        k = max(0, min(k, self.n_factors))
+        idx_out = np.zeros((self.n_reviews, k), dtype=np.int64)
+        val_out = np.zeros((self.n_reviews, k), dtype=float)
+        if k == 0 or self.n_reviews == 0:
+            return idx_out, val_out
+
+        for lo in range(0, self.n_reviews, chunk_size):
+            block = self.dense_rows(lo, lo + chunk_size)
+            if k < self.n_factors:
+                # k번째로 큰 값(kth) 초과는 모두 포함, kth와 같은 값은 앞쪽 factor부터 남은 자리만큼 포함
+                kth = -np.partition(-block, k - 1, axis=1)[:, k - 1]
+                greater = block > kth[:, None]
+                equal = block == kth[:, None]
+                room = k - greater.sum(axis=1)
+                selected = greater | (equal & (np.cumsum(equal, axis=1) <= room[:, None]))
+                idx = np.nonzero(selected)[1].reshape(-1, k)  # 행마다 정확히 k개, 열 오름차순
+            else:
+                idx = np.broadcast_to(np.arange(k), block.shape).copy()
+
+            vals = np.take_along_axis(block, idx, axis=1)
+            order = np.argsort(-vals, axis=1, kind="stable")
+            idx_out[lo:lo + len(block)] = np.take_along_axis(idx, order, axis=1)
+            val_out[lo:lo + len(block)] = np.take_along_axis(vals, order, axis=1)
+
+        return idx_out, val_out
+
+    # ----------------------------- 집계 -----------------------------
+
+    def _column_ids(self) -> np.ndarray:
+        return np.repeat(np.arange(self.n_factors), np.diff(self.indptr))
+
+    def column_sums(self) -> np.ndarray:
+        """factor별 점수 합계"""
+        return np.bincount(self._column_ids(), weights=self.data, minlength=self.n_factors)
+
+    def nonzero_counts(self) -> np.ndarray:
+        """factor별 점수 > 0 리뷰 수"""
+        return np.bincount(self._column_ids(), weights=(self.data > 0), minlength=self.n_factors).astype(int)
+
+    def factor_totals(self) -> Dict[str, float]:
+        """{factor_key: 점수 합계}"""
+        return {k: float(v) for k, v in zip(self.factor_keys, self.column_sums())}
+
+    def factor_counts(self) -> Dict[str, int]:
+        """{factor_key: 점수 > 0 리뷰 수}"""
+        return {k: int(v) for k, v in zip(self.factor_keys, self.nonzero_counts())}
+
+    def nbytes(self) -> int:
+        """행렬이 차지하는 배열 메모리(bytes)"""
+        return int(self.indptr.nbytes + self.indices.nbytes + self.data.nbytes + self.neg_bits.nbytes)
+
+    # ----------------------------- 호환 뷰 -----------------------------
+
+    def to_frame_columns(self, index: pd.Index) -> Dict[str, pd.Series]:
+        """기존 `score_f{id}` / `score_{key}` / `has_neg_{key}` 컬럼을 sparse Series로 생성"""
+        columns: Dict[str, pd.Series] = {}
+        for j, (key, fid) in enumerate(zip(self.factor_keys, self.factor_ids)):
+            score = pd.Series(pd.arrays.SparseArray(self.column(j), fill_value=0.0), index=index)
+            columns[f"score_f{fid}"] = score  # factor_id 기반 컬럼
+            columns[f"score_{key}"] = score  # 하위 호환을 위한 factor_key 컬럼
+            columns[f"has_neg_{key}"] = pd.Series(
+                pd.arrays.SparseArray(self.neg_column(j), fill_value=False), index=index
+            )
+        return columns
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, List, Tuple, Any
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 # Import from domain layer
-from .normalize import normalize_text as normalize
+from .normalize import normalize_text as normalize, normalize_series
+from .matcher import ANCHOR, CONTEXT, NEGATION, get_factor_matcher
+from .score_matrix import ScoreMatrix
+from .parallel import ParallelScoring, score_in_chunks
 from ....adapters.persistence.reg.store import Factor
 
 logger = logging.getLogger(__name__)
@@ -41,6 +46,11 @@ def score_text_against_factor(norm_text: str, factor: Factor) -> Tuple[float, Li
     return score, reasons, neg_hit
 
 
+def rating_multiplier(df: pd.DataFrame) -> np.ndarray:
+    """리뷰별 평점 가중치 배열"""
+    return _rating_multiplier_series(df).to_numpy(dtype=float)
+
+
 def _rating_multiplier_series(df: pd.DataFrame) -> pd.Series:
     """평점 기반 가중치(낮은 별점일수록 더 가중) - 벡터화"""
     if "rating" not in df.columns:
@@ -54,85 +64,172 @@ def _rating_multiplier_series(df: pd.DataFrame) -> pd.Series:
     return mult.astype(float)
 
 
-def compute_review_factor_scores(
+def score_normalized_texts(
+    norm_texts: Iterable[str],
+    rating_mult: np.ndarray,
+    factors: List[Factor],
+) -> ScoreMatrix:
+    """정규화된 텍스트 + 평점 가중치로 점수 행렬 계산 (정규화는 호출자가 이미 수행)"""
+    norm_texts = list(norm_texts)
+    rating_mult = np.asarray(rating_mult, dtype=float)
+
+    # ✅ 카테고리 전체 term을 하나의 오토마톤으로 컴파일 → 리뷰당 1회 스캔으로 모든 factor hit 수집
+    matcher = get_factor_matcher(factors)
+    n_reviews, n_factors = len(norm_texts), len(factors)
+    anchor_hit = np.zeros((n_reviews, n_factors), dtype=bool)
+    context_hit = np.zeros((n_reviews, n_factors), dtype=bool)
+    neg_hit = np.zeros((n_reviews, n_factors), dtype=bool)
+
+    for i, norm in enumerate(norm_texts):
+        for f_idx, flags in matcher.match(norm).items():
+            if flags & ANCHOR:
+                anchor_hit[i, f_idx] = True
+            if flags & CONTEXT:
+                context_hit[i, f_idx] = True
+            if flags & NEGATION:
+                neg_hit[i, f_idx] = True  # ✅ negation은 감점하지 않고 별도 플래그로만
+
+    # score_text_against_factor와 동일: anchor 1.0 + context 0.3 → × weight × rating_multiplier
+    base = anchor_hit * 1.0 + context_hit * 0.3
+    weights = np.array([f.weight for f in factors], dtype=float)
+    scores = (base * weights) * rating_mult[:, None]
+
+    return ScoreMatrix.from_dense(
+        scores,
+        neg_hit,
+        factor_keys=[f.factor_key for f in factors],
+        factor_ids=[f.factor_id for f in factors],
+    )
+
+
+def score_texts(
+    norm_texts: Iterable[str],
+    rating_mult: np.ndarray,
+    factors: List[Factor],
+    parallel: Optional[ParallelScoring] = None,
+) -> ScoreMatrix:
+    """score_normalized_texts + 대용량일 때 멀티프로세스 청크 처리 (결과 동일)"""
+    norm_texts = list(norm_texts)
+    if parallel is None or not parallel.should_parallelize(len(norm_texts)):
+        return score_normalized_texts(norm_texts, rating_mult, factors)
+
+    try:
+        return score_in_chunks(score_normalized_texts, norm_texts, rating_mult, factors, parallel)
+    except BrokenProcessPool as e:
+        # 손상된 풀은 score_in_chunks가 버림 (다음 요청에서 새로 생성)
+        logger.warning(f"[병렬 스코어링 실패] 워커 풀 손상 - 단일 프로세스로 재계산: {e}")
+        return score_normalized_texts(norm_texts, rating_mult, factors)
+    except Exception as e:
+        # 전송(pickle) 실패 등 풀과 무관한 오류 - 다른 요청이 쓰는 풀은 유지 (단일 프로세스에서도 실패하면 그대로 전파)
+        logger.warning(f"[병렬 스코어링 실패] 단일 프로세스로 재계산: {e}")
+        return score_normalized_texts(norm_texts, rating_mult, factors)
+
+
+def compute_score_matrix(
     df: pd.DataFrame,
     factors: List[Factor],
-    compute_top_per_review: bool = True,
-) -> Tuple[pd.DataFrame, Dict[str, int]]:
-    """모든 리뷰에 대해 각 요인별 점수 계산
+    parallel: Optional[ParallelScoring] = None,
+) -> Tuple[pd.DataFrame, ScoreMatrix]:
+    """모든 리뷰 × factor 점수를 희소 행렬로 계산
 
     Args:
-        df: 리뷰 데이터프레임
-        factors: Factor 객체 리스트
-        compute_top_per_review: 리뷰별 top_factors/top_factor_scores 계산 여부(성능 옵션)
+        df: 리뷰 데이터프레임 (text, rating; dedupe_reviews가 만든 `_norm_text`가 있으면 재사용)
+        factors: Factor 객체 리스트 (행렬의 열 순서)
+        parallel: 멀티프로세스 청크 스코어링 설정 (None이면 단일 프로세스)
 
     Returns:
-        (scored_df, factor_counts)
+        (_norm_text가 추가된 df 복사본, ScoreMatrix)
     """
     logger.info(f"[Factor 점수 계산 시작] reviews={len(df)}, factors={len(factors)}")
     df = df.copy()
-    df["_norm_text"] = df["text"].fillna("").map(normalize)
+    if "_norm_text" not in df.columns:
+        df["_norm_text"] = normalize_series(df["text"])
 
-    rating_mult = _rating_multiplier_series(df)
+    rating_mult = rating_multiplier(df)
+    matrix = score_texts(df["_norm_text"], rating_mult, factors, parallel)
 
-    factor_counts: Dict[str, int] = {}
+    logger.debug(f"  - score matrix: nnz={matrix.nnz}/{len(df) * len(factors)}, {matrix.nbytes()} bytes")
+    return df, matrix
 
-    # (선택) negation flag 컬럼들을 만들고 싶다면 여기서
-    # df["_neg_flags"] = [[] for _ in range(len(df))]  # 필요 시
 
-    for factor in factors:
-        # 컬럼명: factor_id 우선, factor_key는 하위 호환
-        col_id = f"score_f{factor.factor_id}"
-        col_key = f"score_{factor.factor_key}"
-        has_neg_col = f"has_neg_{factor.factor_key}"
-
-        scores: List[float] = []
-        neg_flags: List[bool] = []
-
-        # ✅ iloc 반복 제거: norm text Series로 순회
-        for norm in df["_norm_text"]:
-            s, reasons, has_neg = score_text_against_factor(norm, factor)
-            ws = (s * factor.weight)
-            scores.append(ws)
-            neg_flags.append(has_neg)
-
-        score_series = pd.Series(scores, index=df.index) * rating_mult
-        df[col_id] = score_series  # factor_id 기반 컬럼
-        df[col_key] = score_series  # 하위 호환을 위한 factor_key 컬럼
-        df[has_neg_col] = neg_flags  # ✅ negation은 별도 플래그로 남김
-
-        factor_counts[factor.factor_key] = int((score_series > 0).sum())
-    
-    logger.info(f"[Factor 점수 계산 완료] factor_counts={sum(factor_counts.values())} 총 매칭")
-    logger.debug(f"  - 상위 5 factors: {sorted(factor_counts.items(), key=lambda x: x[1], reverse=True)[:5]}")
+def attach_score_columns(
+    df: pd.DataFrame,
+    matrix: ScoreMatrix,
+    compute_top_per_review: bool = True,
+) -> pd.DataFrame:
+    """ScoreMatrix를 기존 컬럼 형식(score_f{id}, score_{key}, has_neg_{key})의 sparse 뷰로 붙임
+
+    분석/세션 경로는 행렬만 쓰므로 컬럼이 필요한 곳(compute_review_factor_scores, 결과 저장)에서만 호출한다.
+    """
+    new_cols: Dict[str, Any] = matrix.to_frame_columns(df.index)
+
+    # 컬럼을 한 번에 붙여서 DataFrame 단편화 방지
+    df = df.copy(deep=False)
+    for col in [c for c in new_cols if c in df.columns]:
+        df[col] = new_cols.pop(col)
+    if new_cols:
+        df = pd.concat([df, pd.DataFrame(new_cols, index=df.index)], axis=1)
 
     if compute_top_per_review:
-        # ⚠️ 성능 이슈가 있으면 옵션으로 끄세요.
-        score_cols = [f"score_f{f.factor_id}" for f in factors if f"score_f{f.factor_id}" in df.columns]
-        factor_keys = [f.factor_key for f in factors if f"score_f{f.factor_id}" in df.columns]
-
-        top_tags: List[List[str]] = []
-        top_scores: List[List[Tuple[str, float]]] = []
-
-        # ✅ iterrows 대신 values 기반 접근(조금 더 빠름)
-        values = df[score_cols].values
-        for row_vals in values:
-            scored = list(zip(factor_keys, [float(v) if v else 0.0 for v in row_vals]))
-            scored.sort(key=lambda x: x[1], reverse=True)
-            topN = [k for k, v in scored[:3] if v > 0]
-            top_tags.append(topN)
-            top_scores.append(scored[:3])
+        # ✅ 행렬 전체에 대해 argpartition 기반 top-3를 한 번에 계산
+        top_idx, top_vals = matrix.top_k_per_review(k=3)
+        keys = np.array(matrix.factor_keys, dtype=object)
+
+        top_keys = keys[top_idx].tolist() if matrix.n_factors else [[] for _ in range(len(df))]
+        top_vals_list = top_vals.tolist()
+
+        top_tags: List[List[str]] = [
+            [k for k, v in zip(ks, vs) if v > 0] for ks, vs in zip(top_keys, top_vals_list)
+        ]
+        top_scores: List[List[Tuple[str, float]]] = [
+            list(zip(ks, vs)) for ks, vs in zip(top_keys, top_vals_list)
+        ]
 
         df["top_factors"] = top_tags
         df["top_factor_scores"] = top_scores
 
-    return df, factor_counts
+    return df
+
 
+def compute_review_factor_scores(
+    df: pd.DataFrame,
+    factors: List[Factor],
+    compute_top_per_review: bool = True,
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """모든 리뷰에 대해 각 요인별 점수 계산
+
+    Args:
+        df: 리뷰 데이터프레임
+        factors: Factor 객체 리스트
+        compute_top_per_review: 리뷰별 top_factors/top_factor_scores 계산 여부(성능 옵션)
+
+    Returns:
+        (scored_df, factor_counts)
+    """
+    df, matrix = compute_score_matrix(df, factors)
+    factor_counts = matrix.factor_counts()
+
+    logger.info(f"[Factor 점수 계산 완료] factor_counts={sum(factor_counts.values())} 총 매칭")
+    logger.debug(f"  - 상위 5 factors: {sorted(factor_counts.items(), key=lambda x: x[1], reverse=True)[:5]}")
 
-def select_top_factors_from_question(question: str, factors: List[Factor], top_k: int = 3) -> List[Tuple[str, float]]:
+    scored_df = attach_score_columns(df, matrix, compute_top_per_review=compute_top_per_review)
+    return scored_df, factor_counts
+
+
+def select_top_factors_from_question(
+    question: str,
+    factors: List[Factor],
+    top_k: int = 3,
+    similarity_threshold: float = 0.1,
+    similar_fn: Optional[Callable[[str, int, float], List[Tuple[str, float]]]] = None,
+) -> List[Tuple[str, float]]:
     """사용자 질문에서 관련 요인 추출 (MVP: anchor 기준)
 
     NOTE: context_terms까지 확장하면 훨씬 자연스럽게 factor가 잡힘.
+    term이 그대로 들어있지 않으면(오타/활용형) similar_fn으로 찾는다 (유사도 × weight).
+
+    Args:
+        similar_fn: (question, top_k, threshold) → [(factor_key, 유사도)] 유사도 매처 (상위 계층에서 주입, None이면 생략)
     """
     logger.debug(f"[질문에서 Factor 추출] question={question[:50]}..., top_k={top_k}")
     nq = normalize(question)
@@ -150,6 +247,13 @@ def select_top_factors_from_question(question: str, factors: List[Factor], top_k
     scored.sort(key=lambda x: x[1], reverse=True)
     top = [(k, float(s)) for k, s in scored if s > 0][:top_k]
 
+    if not top and similar_fn is not None:
+        weights = {f.factor_key: f.weight for f in factors}
+        similar = similar_fn(question, top_k, similarity_threshold)
+        top = sorted(((k, float(sim * weights[k])) for k, sim in similar), key=lambda x: x[1], reverse=True)
+        if top:
+            logger.debug(f"  - 정확 매칭 실패, 유사도 매칭: {[(k, round(sim, 3)) for k, sim in similar]}")
+
     if not top:
         logger.debug("  - 매칭 실패, weight 상위 factors 사용")
         # fallback: weight 상위
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Per-review sentence segmentation + term hit index (Domain Layer - Pure Python)
+
+리뷰마다 한 번만 문장을 나누고(`SENT_SPLIT_RE`), 문장별로 정규화 텍스트에서 걸린 factor term과
+원문 문장 내 위치(offset)를 기록해둔다. 발췌문 생성(evidence excerpt, factor-reviews 문장)은
+이 주석(annotation)을 읽기만 하므로 (리뷰, factor) 조합마다 문장 분리/정규화를 반복하지 않는다.
+
+offset은 원문 문장을 소문자로 바꾼 문자열에서의 위치라 프론트엔드 하이라이트에 그대로 쓸 수 있다.
+(정규화 과정에서만 생기는 매칭 - 예: 특수문자가 공백으로 바뀌어 이어진 경우 - 은 위치 없이 term만 기록)
+"""
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .matcher import FactorMatcher, get_factor_matcher
+from .normalize import normalize_text as normalize
+from ....adapters.persistence.reg.store import Factor
+
+logger = logging.getLogger(__name__)
+
+
+SENT_SPLIT_RE = re.compile(r"(?<=[\.!?。！？])\s+|\n+")
+
+
+@dataclass
+class AnnotatedSentence:
+    """원문 문장 1개 (앞뒤 공백 제거) + term 매칭 정보"""
+    text: str
+    terms: Dict[str, List[int]] = field(default_factory=dict)  # term → 원문 문장 내 시작 위치들(없으면 빈 리스트)
+
+    def first_hit(self, terms: Iterable[str]) -> Optional[str]:
+        """terms 순서대로 이 문장에 걸린 첫 term"""
+        for t in terms:
+            if t in self.terms:
+                return t
+        return None
+
+    def has_any(self, terms: Iterable[str]) -> bool:
+        return any(t in self.terms for t in terms)
+
+
+@dataclass
+class ReviewAnnotation:
+    """리뷰 1건의 문장 목록 (비어있는 문장 제외, 원문 순서)"""
+    sentences: List[AnnotatedSentence]
+
+    def matching(self, terms: Sequence[str]) -> List[AnnotatedSentence]:
+        """terms 중 하나라도 걸린 문장들"""
+        return [s for s in self.sentences if s.has_any(terms)]
+
+
+def _raw_offsets(lowered: str, term: str) -> List[int]:
+    out: List[int] = []
+    i = lowered.find(term)
+    while i != -1:
+        out.append(i)
+        i = lowered.find(term, i + 1)
+    return out
+
+
+def annotate_review(text: str, matcher: FactorMatcher) -> ReviewAnnotation:
+    """리뷰 원문 → 문장별 term 매칭 주석"""
+    sentences: List[AnnotatedSentence] = []
+    if not text:
+        return ReviewAnnotation(sentences)
+
+    for s_raw in SENT_SPLIT_RE.split(text):
+        s_raw = (s_raw or "").strip()
+        if not s_raw:
+            continue
+        hit_terms = {term for _, term in matcher.iter_term_matches(normalize(s_raw))}
+        lowered = s_raw.lower()
+        sentences.append(AnnotatedSentence(
+            text=s_raw,
+            terms={t: _raw_offsets(lowered, t) for t in hit_terms},
+        ))
+    return ReviewAnnotation(sentences)
+
+
+class SentenceIndex:
+    """리뷰별 문장/term 주석 캐시 (처음 조회할 때 한 번만 계산)
+
+    키는 리뷰 텍스트 Series의 index label(= scored_df의 index)이다.
+    """
+
+    def __init__(self, texts: pd.Series, factors: List[Factor]):
+        """
+        Args:
+            texts: 리뷰 원문 Series (scored_df["text"])
+            factors: 카테고리 Factor 리스트 (모든 anchor/context/negation term을 한 번에 매칭)
+        """
+        self._texts = texts
+        self._matcher = get_factor_matcher(factors)
+        self._cache: Dict[Hashable, ReviewAnnotation] = {}
+
+    def annotation(self, label: Hashable) -> ReviewAnnotation:
+        ann = self._cache.get(label)
+        if ann is None:
+            text = self._texts.get(label)
+            ann = annotate_review(text if isinstance(text, str) else "", self._matcher)
+            self._cache[label] = ann
+        return ann
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def build_excerpt(
+    annotation: ReviewAnnotation,
+    terms: Sequence[str],
+    max_len: int = 160,
+) -> Tuple[str, List[Dict]]:
+    """terms에 걸린 문장을 이어붙인 발췌문 + 발췌문 기준 하이라이트 위치
+
+    Returns:
+        (excerpt, highlights): highlights = [{"term", "start", "end"}] (max_len 안에 완전히 들어간 것만)
+    """
+    terms = list(dict.fromkeys(terms))  # anchor/context에 같은 term이 있으면 한 번만
+    selected = annotation.matching(terms)
+    if not selected:
+        return "", []
+
+    parts: List[str] = []
+    highlights: List[Dict] = []
+    pos = 0
+    for s in selected:
+        for t in terms:
+            for off in s.terms.get(t, ()):
+                start, end = pos + off, pos + off + len(t)
+                if end <= max_len:
+                    highlights.append({"term": t, "start": start, "end": end})
+        parts.append(s.text)
+        pos += len(s.text) + 1  # " ".join 구분자
+    highlights.sort(key=lambda h: (h["start"], h["end"]))
+    return " ".join(parts)[:max_len], highlights
@@ -0,0 +1,285 @@
+"""리뷰 × Factor 점수 캐시 (npz) - Infrastructure Layer
+
+(리뷰 스냅샷 내용 해시, factor 정의 해시)를 키로 ScoreMatrix를 디스크에 저장한다.
+대화 세션, /analyze, 배치 스크립트가 같은 디렉토리를 공유하므로
+같은 리뷰 파일 × 같은 카테고리 factor 조합은 프로세스/세션이 달라도 한 번만 계산된다.
+
+배치 스크립트에서도 `cached_score_matrix(df, factors, category)`를 그대로 호출하면 된다.
+
+증분 스코어링도 같은 캐시를 쓴다: 캐시 파일에 리뷰 식별 키/평점 배율을 함께 저장하고,
+상품별로 마지막에 쓴 캐시 파일을 가리키는 작은 포인터(`latest_*.json`)만 따로 둔다.
+리뷰 파일이 늘어나 캐시가 빗나가면 포인터가 가리키는 이전 행렬을 ScoreSnapshot으로 읽어 신규 리뷰만 계산한다.
+"""
+import json
+import logging
+import os
+import re
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...adapters.persistence.reg.store import Factor
+from ...core.settings import settings
+from ...domain.rules.review.incremental import (
+    ScoreSnapshot,
+    factor_set_hash,
+    review_keys,
+    review_snapshot_hash,
+    score_incrementally,
+)
+from ...domain.rules.review.normalize import normalize_series
+from ...domain.rules.review.parallel import ParallelScoring
+from ...domain.rules.review.score_matrix import ScoreMatrix
+from ...domain.rules.review.scoring import compute_score_matrix, rating_multiplier
+from ..observability.metrics import score_cache_hits_total, score_cache_misses_total
+
+logger = logging.getLogger(__name__)
+
+# 점수 계산 규칙(정규화/스코어링 공식)이 바뀌면 올려서 기존 캐시를 무효화
+SCORE_CACHE_VERSION = 1
+
+
+def pack_score_matrix(matrix: ScoreMatrix) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """ScoreMatrix → (JSON 메타, npz 배열)"""
+    meta = {
+        "n_reviews": matrix.n_reviews,
+        "factor_keys": matrix.factor_keys,
+        "factor_ids": matrix.factor_ids,
+    }
+    arrays = {
+        "indptr": matrix.indptr,
+        "indices": matrix.indices,
+        "data": matrix.data,
+        "neg_bits": matrix.neg_bits,
+    }
+    return meta, arrays
+
+
+def unpack_score_matrix(meta: Dict[str, Any], z) -> ScoreMatrix:
+    """pack_score_matrix로 저장한 메타/배열에서 ScoreMatrix 복원"""
+    return ScoreMatrix(
+        n_reviews=int(meta["n_reviews"]),
+        factor_keys=list(meta["factor_keys"]),
+        factor_ids=[int(x) for x in meta["factor_ids"]],
+        indptr=z["indptr"],
+        indices=z["indices"],
+        data=z["data"],
+        neg_bits=z["neg_bits"],
+    )
+
+
+class ScoreCache:
+    """내용 해시 기반 ScoreMatrix 디스크 캐시"""
+
+    def __init__(self, cache_dir: str | Path, max_files: int = 256):
+        """
+        Args:
+            cache_dir: 캐시 파일 디렉토리
+            max_files: 보관할 최대 파일 수 (초과 시 오래 쓰지 않은 파일부터 삭제)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_files = max_files
+
+    def _get_path(self, review_hash: str, factor_hash: str) -> Path:
+        return self.cache_dir / f"v{SCORE_CACHE_VERSION}_{review_hash[:20]}_{factor_hash[:20]}.npz"
+
+    def get(self, review_hash: str, factor_hash: str) -> Optional[ScoreMatrix]:
+        """캐시된 점수 행렬 (없거나 손상되었으면 None)"""
+        path = self._get_path(review_hash, factor_hash)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as z:
+                meta = json.loads(str(z["meta"]))
+                if meta.get("review_hash") != review_hash or meta.get("factor_hash") != factor_hash:
+                    return None
+                matrix = unpack_score_matrix(meta, z)
+            os.utime(path)  # 최근 사용 시각 갱신 (정리 순서 기준)
+            return matrix
+        except Exception as e:
+            logger.warning(f"점수 캐시 로드 실패 (무시하고 재계산): {path}: {e}")
+            return None
+
+    def put(
+        self,
+        review_hash: str,
+        factor_hash: str,
+        matrix: ScoreMatrix,
+        keys: Optional[np.ndarray] = None,
+        rating_mult: Optional[np.ndarray] = None,
+    ) -> Path:
+        """점수 행렬 저장 (임시 파일에 쓴 뒤 교체 → 동시 읽기에 안전)
+
+        Args:
+            keys: 행별 리뷰 식별 키 (있으면 증분 스코어링 스냅샷으로도 쓸 수 있음)
+            rating_mult: 행별 평점 배율 (keys와 함께 저장)
+        """
+        path = self._get_path(review_hash, factor_hash)
+        meta, arrays = pack_score_matrix(matrix)
+        meta["review_hash"] = review_hash
+        meta["factor_hash"] = factor_hash
+        if keys is not None and rating_mult is not None:
+            arrays["review_keys"] = np.asarray(keys, dtype=str)
+            arrays["rating_mult"] = np.asarray(rating_mult, dtype=np.float64)
+
+        tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp_path, meta=np.array(json.dumps(meta, ensure_ascii=False)), **arrays)
+        os.replace(tmp_path, path)
+        self._prune()
+        return path
+
+    def _get_latest_path(self, category: str, product_id: str) -> Path:
+        safe_id = re.sub(r"[^\w\-]+", "_", f"{category}_{product_id}")
+        return self.cache_dir / f"latest_{safe_id}.json"
+
+    def link_latest(self, category: str, product_id: str, review_hash: str, factor_hash: str) -> None:
+        """상품의 마지막 점수 캐시 항목 기록 (다음 증분 스코어링의 기준)"""
+        path = self._get_latest_path(category, product_id)
+        payload = {"review_hash": review_hash, "factor_hash": factor_hash}
+        try:
+            if path.exists() and json.loads(path.read_text(encoding="utf-8")) == payload:
+                return
+        except (OSError, ValueError):
+            pass
+        tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.tmp.json")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def latest_snapshot(self, category: str, product_id: str) -> Optional[ScoreSnapshot]:
+        """상품의 마지막 점수 캐시 항목을 ScoreSnapshot으로 로드 (없거나 정리되었으면 None)"""
+        path = self._get_latest_path(category, product_id)
+        try:
+            pointer = json.loads(path.read_text(encoding="utf-8"))
+            review_hash, factor_hash = pointer["review_hash"], pointer["factor_hash"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+        npz_path = self._get_path(review_hash, factor_hash)
+        if not npz_path.exists():
+            return None
+        try:
+            with np.load(npz_path, allow_pickle=False) as z:
+                if "review_keys" not in z.files:
+                    return None
+                meta = json.loads(str(z["meta"]))
+                matrix = unpack_score_matrix(meta, z)
+                snapshot = ScoreSnapshot(
+                    factor_set_hash=meta["factor_hash"],
+                    review_keys=z["review_keys"],
+                    rating_mult=z["rating_mult"],
+                    matrix=matrix,
+                    factor_totals=matrix.factor_totals(),
+                )
+            os.utime(npz_path)
+            return snapshot
+        except Exception as e:
+            logger.warning(f"점수 스냅샷 로드 실패 (무시하고 재계산): {npz_path}: {e}")
+            return None
+
+    def _prune(self) -> None:
+        """max_files 초과분을 최근 사용 시각이 오래된 순으로 삭제"""
+        files = list(self.cache_dir.glob("v*_*.npz"))
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=lambda p: p.stat().st_mtime)
+        for p in files[:len(files) - self.max_files]:
+            try:
+                p.unlink()
+            except OSError:
+                pass
+
+
+_score_cache: Optional[ScoreCache] = None
+
+
+def get_score_cache() -> Optional[ScoreCache]:
+    """설정 기반 프로세스 공용 ScoreCache (비활성화 시 None)"""
+    global _score_cache
+    if not settings.SCORE_CACHE_ENABLED:
+        return None
+    if _score_cache is None:
+        _score_cache = ScoreCache(settings.SCORE_CACHE_DIR, max_files=settings.SCORE_CACHE_MAX_FILES)
+    return _score_cache
+
+
+def get_parallel_scoring() -> Optional[ParallelScoring]:
+    """설정 기반 멀티프로세스 스코어링 설정 (비활성화 시 None)"""
+    if not settings.SCORING_PARALLEL_ENABLED:
+        return None
+    return ParallelScoring(
+        n_workers=settings.SCORING_PARALLEL_WORKERS,
+        chunk_size=settings.SCORING_PARALLEL_CHUNK_SIZE,
+        min_reviews=settings.SCORING_PARALLEL_MIN_REVIEWS,
+    )
+
+
+def cached_score_matrix(
+    df: pd.DataFrame,
+    factors: List[Factor],
+    category: str = "",
+    cache: Optional[ScoreCache] = None,
+    compute_fn: Optional[Callable[[pd.DataFrame, List[Factor]], Tuple[pd.DataFrame, ScoreMatrix]]] = None,
+    product_id: str = "",
+) -> Tuple[pd.DataFrame, ScoreMatrix]:
+    """캐시를 거쳐 점수 행렬 계산 (compute_score_matrix와 같은 반환값)
+
+    Args:
+        df: 리뷰 데이터프레임 (text, rating)
+        factors: Factor 리스트 (행렬의 열 순서)
+        category: 메트릭 라벨 (product_id와 함께 증분 스코어링 키)
+        cache: 사용할 캐시 (None이면 설정 기반 공용 캐시)
+        compute_fn: 캐시 미스 시 계산 함수 (기본: 설정의 병렬 옵션을 적용한 compute_score_matrix)
+        product_id: 지정하면 캐시 미스 시 이 상품의 마지막 캐시 항목을 재사용해 신규 리뷰만 계산
+
+    Returns:
+        (_norm_text가 있는 df 복사본, ScoreMatrix)
+    """
+    parallel = get_parallel_scoring()
+    cache = cache or get_score_cache()
+    if cache is None:
+        return (compute_fn or partial(compute_score_matrix, parallel=parallel))(df, factors)
+
+    review_hash = review_snapshot_hash(df)
+    factor_hash = factor_set_hash(factors)
+
+    matrix = cache.get(review_hash, factor_hash)
+    if matrix is not None and matrix.n_reviews == len(df):
+        score_cache_hits_total.labels(category=category).inc()
+        logger.info(f"[점수 캐시 적중] reviews={len(df)}, factors={len(factors)}")
+        df = df.copy()
+        if "_norm_text" not in df.columns:
+            df["_norm_text"] = normalize_series(df["text"])
+        if product_id:
+            _link_latest(cache, category, product_id, review_hash, factor_hash)
+        return df, matrix
+
+    score_cache_misses_total.labels(category=category).inc()
+    if compute_fn is None and product_id:
+        snapshot = cache.latest_snapshot(category, product_id)
+        df, matrix, new_snapshot, scored_count = score_incrementally(df, factors, snapshot, parallel=parallel)
+        keys, rating_mult = new_snapshot.review_keys, new_snapshot.rating_mult
+        logger.info(f"  - 증분 스코어링: 신규 {scored_count}건 / 전체 {len(df)}건")
+    else:
+        df, matrix = (compute_fn or partial(compute_score_matrix, parallel=parallel))(df, factors)
+        keys = review_keys(df) if "review_id" in df.columns else None
+        rating_mult = rating_multiplier(df)
+    try:
+        cache.put(review_hash, factor_hash, matrix, keys=keys, rating_mult=rating_mult)
+    except Exception as e:
+        logger.warning(f"점수 캐시 저장 실패: {e}")
+    else:
+        if product_id:
+            _link_latest(cache, category, product_id, review_hash, factor_hash)
+    return df, matrix
+
+
+def _link_latest(cache: ScoreCache, category: str, product_id: str, review_hash: str, factor_hash: str) -> None:
+    try:
+        cache.link_latest(category, product_id, review_hash, factor_hash)
+    except Exception as e:
+        logger.warning(f"점수 캐시 포인터 저장 실패: {e}")
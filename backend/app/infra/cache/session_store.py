@@ -0,0 +1,293 @@
+"""세션 저장소: 메모리 상한(LRU + 유휴 TTL)이 있는 프로세스 내 세션 캐시 - Infrastructure Layer
+
+세션마다 scored_df/normalized_df/점수 행렬/문장 색인을 들고 있으므로 dict에 계속 쌓으면
+파드 메모리가 끝없이 늘어난다. `SessionStore`는 dict처럼 쓰되 아래 조건에서 세션을 내보낸다.
+
+- 항목 수가 max_entries를 넘으면 가장 오래 쓰지 않은 세션부터 (LRU)
+- 추정 메모리 합계가 max_bytes를 넘으면 가장 오래 쓰지 않은 세션부터
+- 마지막 접근 후 ttl_seconds가 지난 세션 (조회/저장 시 정리)
+
+항목 크기는 저장 시점에 `estimate_size`로 추정하고, 세션 데이터가 제자리에서 불어나면
+(문장 색인/대화 세션 추가 등) `refresh_size`로 다시 잰다.
+"""
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...adapters.persistence.reg.catalog import RegCatalog
+from ...adapters.persistence.reg.question_graph import QuestionGraph
+from ...adapters.persistence.reg.store import Factor, Question
+from ...domain.rules.review.matcher import FactorMatcher
+from ..observability.metrics import session_store_bytes, session_store_entries, session_store_evictions_total
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 공유 객체 (REG 카탈로그/매처 캐시 등이 소유) - 세션 안에서 참조만 하면 크기에 넣지 않음
+_SHARED_TYPES: Tuple[type, ...] = (RegCatalog, QuestionGraph, Factor, Question, FactorMatcher)
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+_MAX_DEPTH = 12            # 객체 그래프 탐색 깊이
+_STR_SAMPLE_SIZE = 1000    # object 컬럼 크기 추정용 표본 수
+
+
+def register_shared_type(cls: type) -> None:
+    """다른 캐시가 소유하고 세션은 참조만 하는 타입 등록 (세션 크기 추정에서 제외)"""
+    global _SHARED_TYPES
+    if cls not in _SHARED_TYPES:
+        _SHARED_TYPES = _SHARED_TYPES + (cls,)
+
+
+def _holds_pyobjects(dtype) -> bool:
+    """값이 파이썬 객체 배열로 저장되는 컬럼인지 (object, python 저장소 문자열 - pyarrow 문자열은 nbytes가 정확함)"""
+    if isinstance(dtype, pd.StringDtype):
+        return dtype.storage == "python"
+    return dtype == object
+
+
+def _frame_size(obj: pd.DataFrame | pd.Series, seen: Set[int]) -> int:
+    """DataFrame/Series 메모리 추정 (object 컬럼은 표본 평균으로 외삽 - deep=True 전체 순회 회피)
+
+    object 컬럼의 문자열은 버퍼 주소로 한 번만 센다 (scored_df["text"]를 따로 들고 있는 경우 등).
+    """
+    frame = obj.to_frame() if isinstance(obj, pd.Series) else obj
+    total = int(frame.memory_usage(index=True, deep=False).sum())
+    n = len(frame)
+    if n == 0:
+        return total
+    for col, dtype in frame.dtypes.items():
+        if not _holds_pyobjects(dtype):
+            continue
+        values = frame[col].to_numpy()
+        ptr = values.__array_interface__["data"][0]
+        if ptr in seen:
+            continue
+        seen.add(ptr)
+        sample = values if n <= _STR_SAMPLE_SIZE else values[:: max(1, n // _STR_SAMPLE_SIZE)]
+        avg = sum(sys.getsizeof(v) for v in sample) / len(sample)
+        total += int(avg * n)
+    return total
+
+
+def estimate_size(obj: Any, _seen: Optional[Set[int]] = None, _depth: int = 0) -> int:
+    """객체가 붙잡고 있는 메모리 추정 (bytes)
+
+    DataFrame/ndarray는 버퍼 크기, 컨테이너와 일반 객체는 내용을 따라가며 합산한다.
+    안쪽에서 참조하는 공유 타입(`register_shared_type`)은 세지 않는다.
+    같은 객체는 한 번만 센다 (세션 dict와 대화 세션이 같은 scored_df를 공유하는 경우 등).
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen or isinstance(obj, _SKIP_TYPES) or _depth > _MAX_DEPTH:
+        return 0
+    if _depth > 0 and isinstance(obj, _SHARED_TYPES):  # 최상위 값(공유 객체를 직접 캐시하는 경우)은 측정
+        return 0
+    _seen.add(id(obj))
+
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return _frame_size(obj, _seen)
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes) + sys.getsizeof(np.empty(0))
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return sys.getsizeof(obj)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += estimate_size(k, _seen, _depth + 1) + estimate_size(v, _seen, _depth + 1)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for v in obj:
+            size += estimate_size(v, _seen, _depth + 1)
+    elif hasattr(obj, "__dict__"):
+        size += estimate_size(vars(obj), _seen, _depth + 1)
+    elif hasattr(obj, "__slots__"):
+        for name in obj.__slots__:
+            size += estimate_size(getattr(obj, name, None), _seen, _depth + 1)
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    last_access: float  # time.monotonic()
+
+
+class SessionStore:
+    """LRU + 유휴 TTL + 메모리 상한이 있는 세션 저장소 (스레드 안전)
+
+    dict처럼 `store[sid] = data`, `store.get(sid)`, `sid in store`, `store.pop(sid)`로 쓴다.
+    조회(get/[])는 세션을 최근 사용으로 갱신한다. 쫓겨난 세션은 조회 시 없는 세션과 같다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        ttl_seconds: float = 0,
+    ):
+        """
+        Args:
+            name: 메트릭 라벨 (store)
+            max_entries: 최대 세션 수 (0 = 무제한)
+            max_bytes: 추정 메모리 합계 상한 (0 = 무제한)
+            ttl_seconds: 마지막 접근 후 유지 시간 (0 = 무제한)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()  # 앞쪽 = 가장 오래 쓰지 않음
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+    # ----------------------------- dict 인터페이스 -----------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            now = time.monotonic()
+            if self._expired(entry, now):
+                self._evict(key, "ttl")
+                return default
+            entry.last_access = now
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        """존재 확인 (LRU 순서는 바꾸지 않음)"""
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            return entry is not None and not self._expired(entry, time.monotonic())
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        size = estimate_size(value)  # 락 밖에서 계산
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = _Entry(value, size, time.monotonic())
+            self._bytes += size
+            self._enforce(keep=key)
+            self._update_gauges()
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry.size
+            self._update_gauges()
+            return entry.value
+
+    def __delitem__(self, key: str) -> None:
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def keys(self):
+        return list(self)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._update_gauges()
+
+    # ----------------------------- 크기/정리 -----------------------------
+
+    def refresh_size(self, key: str) -> None:
+        """제자리에서 바뀐 세션의 크기를 다시 추정하고 상한을 적용"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            value = entry.value
+        size = estimate_size(value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.value is not value:
+                return
+            self._bytes += size - entry.size
+            entry.size = size
+            self._enforce(keep=key)
+            self._update_gauges()
+
+    def sweep(self) -> int:
+        """TTL 지난 세션 정리 (정리한 수)"""
+        with self._lock:
+            now = time.monotonic()
+            expired = [k for k, e in self._entries.items() if self._expired(e, now)]
+            for k in expired:
+                self._evict(k, "ttl")
+            if expired:
+                self._update_gauges()
+            return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - entry.last_access > self.ttl_seconds
+
+    def _evict(self, key: str, reason: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        session_store_evictions_total.labels(store=self.name, reason=reason).inc()
+        logger.info(f"[세션 저장소:{self.name}] 세션 제거({reason}): {key} (~{entry.size / 1e6:.1f}MB)")
+        self._update_gauges()
+
+    def _enforce(self, keep: Optional[str] = None) -> None:
+        """TTL → 항목 수 → 메모리 순으로 상한 적용 (keep 세션은 마지막까지 남김)"""
+        now = time.monotonic()
+        for k in [k for k, e in self._entries.items() if k != keep and self._expired(e, now)]:
+            self._evict(k, "ttl")
+        while self.max_entries > 0 and len(self._entries) > self.max_entries:
+            self._evict(self._oldest(keep), "lru")
+        while self.max_bytes > 0 and self._bytes > self.max_bytes and len(self._entries) > 1:
+            self._evict(self._oldest(keep), "bytes")
+
+    def _oldest(self, keep: Optional[str]) -> str:
+        for k in self._entries:
+            if k != keep:
+                return k
+        raise KeyError("no evictable session")
+
+    def _update_gauges(self) -> None:
+        session_store_entries.labels(store=self.name).set(len(self._entries))
+        session_store_bytes.labels(store=self.name).set(self._bytes)
+
+
+_MISSING = object()
@@ -0,0 +1 @@
+"""Concurrency - 블로킹 작업 실행기 (이벤트 루프 밖에서 실행)"""
@@ -0,0 +1,152 @@
+"""관리형 실행기: async 핸들러의 블로킹 작업을 이벤트 루프 밖에서 실행
+
+async 핸들러 안에서 pandas 스코어링, 파일 I/O, 동기 LLM SDK 호출을 그대로 실행하면
+그동안 같은 uvicorn 워커의 다른 요청이 모두 멈춘다. 핸들러는 이 실행기에 작업을 넘기고 await한다.
+
+- io: 파일 읽기, 리뷰 수집, LLM 호출 등 대기 시간이 긴 작업 (스레드 수 넉넉히)
+- cpu: pandas/numpy 스코어링·evidence 추출 등 계산 작업 (CPU 코어 수로 제한해 동시 계산이 서로 밀어내지 않게)
+  — 세션 캐시/DataFrame을 그대로 주고받아야 해서 스레드에서 실행한다.
+  리뷰가 아주 많은 상품의 점수 계산은 그 안에서 다시 프로세스 풀(`domain.rules.review.parallel`)로 나뉜다.
+
+풀별로 대기열 길이, 실행 중 작업 수, 대기 시간, 실행 시간을 Prometheus 메트릭으로 기록한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+from ...core.settings import settings
+from ..observability.metrics import (
+    executor_active_tasks,
+    executor_queue_depth,
+    executor_task_duration_seconds,
+    executor_wait_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ManagedExecutor:
+    """이름 붙은 스레드 풀 + 대기/실행 메트릭"""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-worker")
+        self._lock = threading.Lock()
+        self.queued = 0   # 제출됐지만 시작 전
+        self.active = 0   # 실행 중
+
+    def _dequeue(self) -> None:
+        with self._lock:
+            self.queued -= 1
+        executor_queue_depth.labels(pool=self.name).dec()
+
+    def _release_cancelled(self, future: Future) -> None:
+        """시작 전에 취소된 작업(대기 중 취소, shutdown의 cancel_futures)의 대기열 자리 반환"""
+        if future.cancelled():
+            self._dequeue()
+
+    def _track(self, fn: Callable[..., T], submitted: float) -> Callable[[], T]:
+        def run() -> T:
+            started = time.perf_counter()
+            self._dequeue()
+            with self._lock:
+                self.active += 1
+            executor_active_tasks.labels(pool=self.name).inc()
+            executor_wait_seconds.labels(pool=self.name).observe(started - submitted)
+            try:
+                return fn()
+            finally:
+                with self._lock:
+                    self.active -= 1
+                executor_active_tasks.labels(pool=self.name).dec()
+                executor_task_duration_seconds.labels(pool=self.name).observe(time.perf_counter() - started)
+        return run
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """fn(*args, **kwargs)를 풀에서 실행하고 결과를 await (예외는 그대로 전달)
+
+        contextvars(로깅/트레이싱 컨텍스트)는 호출한 코루틴의 값을 복사해 넘긴다.
+        종료된 풀이면 RuntimeError, 시작 전에 취소되면 CancelledError (둘 다 대기열 자리는 반환).
+        """
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, fn, *args, **kwargs)
+        with self._lock:
+            self.queued += 1
+        executor_queue_depth.labels(pool=self.name).inc()
+        try:
+            future = self._pool.submit(self._track(call, time.perf_counter()))
+        except RuntimeError:
+            self._dequeue()
+            raise
+        future.add_done_callback(self._release_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"max_workers": self.max_workers, "queued": self.queued, "active": self.active}
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_executors: Dict[str, ManagedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _pool_size(name: str) -> int:
+    if name == "io":
+        return max(1, settings.EXECUTOR_IO_WORKERS)
+    n = settings.EXECUTOR_CPU_WORKERS
+    return n if n > 0 else (os.cpu_count() or 1)
+
+
+def get_executor(name: str) -> ManagedExecutor:
+    """프로세스 공용 실행기 ("io" 또는 "cpu", 처음 사용할 때 생성)"""
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                if name not in ("io", "cpu"):
+                    raise ValueError(f"unknown executor: {name}")
+                executor = _executors[name] = ManagedExecutor(name, _pool_size(name))
+                logger.info(f"[실행기] {name} 풀 생성: workers={executor.max_workers}")
+    return executor
+
+
+async def run_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """블로킹 I/O 작업(파일, 리뷰 수집, LLM 호출)을 io 풀에서 실행"""
+    return await get_executor("io").run(fn, *args, **kwargs)
+
+
+async def run_cpu(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """pandas/스코어링 계산 작업을 cpu 풀에서 실행"""
+    return await get_executor("cpu").run(fn, *args, **kwargs)
+
+
+def executor_stats() -> Dict[str, Dict[str, int]]:
+    """풀별 {max_workers, queued, active}"""
+    return {name: ex.stats() for name, ex in list(_executors.items())}
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """모든 실행기 종료 (앱 종료 시)"""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait)
+        _executors.clear()
+
+
+atexit.register(shutdown_executors)
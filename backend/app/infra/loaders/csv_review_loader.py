@@ -1,7 +1,7 @@
 """CSV Review Loader"""
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import pandas as pd
 
 from .review_loader import ReviewLoader
@@ -23,9 +23,7 @@ class CSVReviewLoader(ReviewLoader):
         CSV는 파일명에 category가 직접 포함되지 않을 수 있어
         모든 파일을 검색하거나 메타데이터 필요
         """
-        # CSV 파일 패턴: <vendor>_<product_id>_<timestamp>.csv
-        pattern = f"{vendor}_*.csv" if vendor else "*.csv"
-        files = list(self.review_dir.glob(pattern))
+        files = self._find_category_files(vendor)
         
         if not files:
             logger.warning(f"CSV 리뷰 파일 없음: vendor={vendor}, category={category}")
@@ -37,7 +35,7 @@ class CSVReviewLoader(ReviewLoader):
         logger.warning(f"CSV 형식에서는 category 기반 검색이 제한적입니다: {category}")
         
         if latest:
-            latest_file = max(files, key=lambda p: p.stat().st_mtime)
+            latest_file = self._latest(files)
             df = pd.read_csv(latest_file)
             logger.info(f"CSV 리뷰 로드: {latest_file.name} ({len(df)}건)")
             return df
@@ -47,6 +45,23 @@ class CSVReviewLoader(ReviewLoader):
             logger.info(f"CSV 리뷰 로드: {len(files)}개 파일, 총 {len(df)}건")
             return df
     
+    def _find_category_files(self, vendor: Optional[str] = None) -> List[Path]:
+        """카테고리 검색 대상 CSV 파일 목록 (파일 패턴: <vendor>_<product_id>_<timestamp>.csv)"""
+        pattern = f"{vendor}_*.csv" if vendor else "*.csv"
+        return list(self.review_dir.glob(pattern))
+    
+    def source_files(
+        self,
+        category: str,
+        vendor: Optional[str] = None,
+        latest: bool = True
+    ) -> Optional[List[Path]]:
+        """load_by_category가 읽을 CSV 파일 목록"""
+        files = self._find_category_files(vendor)
+        if not files:
+            return None
+        return [self._latest(files)] if latest else files
+    
     def load_by_product(
         self,
         product_id: str,
@@ -3,7 +3,7 @@ import logging
 import json
 import re
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import pandas as pd
 
 from .review_loader import ReviewLoader
@@ -25,22 +25,7 @@ class JSONReviewLoader(ReviewLoader):
         파일명 패턴: reviews_<vendor>_<category_parts>_<product>_<timestamp>.json
         예: reviews_nespressokorea_electronics_coffee_machine_nespresso_20260103_111926.json
         """
-        # 파일명에서 vendor와 timestamp를 제외한 중간 부분에서 category 찾기
-        pattern_re = re.compile(r"reviews_(?P<vendor>[^_]+)_(?P<middle>.+)_(?P<timestamp>\d{8}_\d{6})\.json")
-        
-        matching_files = []
-        for json_file in self.review_dir.glob("reviews_*.json"):
-            match = pattern_re.match(json_file.name)
-            if match:
-                file_vendor = match.group('vendor')
-                file_middle = match.group('middle')  # category + product가 섞인 부분
-                
-                # vendor와 category 매칭
-                vendor_match = (vendor is None) or (file_vendor == vendor)
-                category_match = category in file_middle  # middle 부분에서 category 찾기
-                
-                if vendor_match and category_match:
-                    matching_files.append(json_file)
+        matching_files = self._find_category_files(category, vendor)
         
         if not matching_files:
             logger.warning(f"JSON 리뷰 파일 없음: vendor={vendor}, category={category}")
@@ -48,7 +33,7 @@ class JSONReviewLoader(ReviewLoader):
         
         if latest:
             # 최신 파일만
-            latest_file = max(matching_files, key=lambda p: p.stat().st_mtime)
+            latest_file = self._latest(matching_files)
             with open(latest_file, 'r', encoding='utf-8') as f:
                 reviews_data = json.load(f)
             df = pd.DataFrame(reviews_data)
@@ -65,6 +50,38 @@ class JSONReviewLoader(ReviewLoader):
             logger.info(f"JSON 리뷰 로드: {len(matching_files)}개 파일, 총 {len(df)}건")
             return df
     
+    def _find_category_files(self, category: str, vendor: Optional[str] = None) -> List[Path]:
+        """vendor/category가 일치하는 JSON 리뷰 파일 목록"""
+        # 파일명에서 vendor와 timestamp를 제외한 중간 부분에서 category 찾기
+        pattern_re = re.compile(r"reviews_(?P<vendor>[^_]+)_(?P<middle>.+)_(?P<timestamp>\d{8}_\d{6})\.json")
+        
+        matching_files = []
+        for json_file in self.review_dir.glob("reviews_*.json"):
+            match = pattern_re.match(json_file.name)
+            if match:
+                file_vendor = match.group('vendor')
+                file_middle = match.group('middle')  # category + product가 섞인 부분
+                
+                # vendor와 category 매칭
+                vendor_match = (vendor is None) or (file_vendor == vendor)
+                category_match = category in file_middle  # middle 부분에서 category 찾기
+                
+                if vendor_match and category_match:
+                    matching_files.append(json_file)
+        return matching_files
+    
+    def source_files(
+        self,
+        category: str,
+        vendor: Optional[str] = None,
+        latest: bool = True
+    ) -> Optional[List[Path]]:
+        """load_by_category가 읽을 JSON 파일 목록"""
+        matching_files = self._find_category_files(category, vendor)
+        if not matching_files:
+            return None
+        return [self._latest(matching_files)] if latest else matching_files
+    
     def load_by_product(
         self,
         product_id: str,
@@ -1,7 +1,7 @@
 """Review Loader - Abstract Base Class"""
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 import pandas as pd
 
 
@@ -56,3 +56,37 @@ class ReviewLoader(ABC):
             리뷰 DataFrame (없으면 None)
         """
         pass
+    
+    def source_files(
+        self,
+        category: str,
+        vendor: Optional[str] = None,
+        latest: bool = True
+    ) -> Optional[List[Path]]:
+        """load_by_category가 읽을 파일 목록 (파일 기반 로더가 아니면 None)"""
+        return None
+    
+    @staticmethod
+    def _latest(files: List[Path]) -> Path:
+        """수정 시각이 가장 늦은 파일"""
+        return max(files, key=lambda p: p.stat().st_mtime)
+    
+    def source_signature(
+        self,
+        category: str,
+        vendor: Optional[str] = None,
+        latest: bool = True
+    ) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+        """load_by_category가 읽을 파일들의 (경로, mtime_ns, 크기) - 파일을 읽지 않고 스냅샷 식별
+        
+        Returns:
+            파일 시그니처 튜플 (파일 기반이 아니거나 파일이 없으면 None)
+        """
+        files = self.source_files(category, vendor=vendor, latest=latest)
+        if not files:
+            return None
+        try:
+            stats = [(p, p.stat()) for p in files]
+        except OSError:
+            return None
+        return tuple((str(p), st.st_mtime_ns, st.st_size) for p, st in stats)
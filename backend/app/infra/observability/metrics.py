@@ -98,6 +98,22 @@ scoring_duration_seconds = Histogram(
     registry=REGISTRY
 )
 
+# 점수 캐시 적중 수
+score_cache_hits_total = Counter(
+    'score_cache_hits_total',
+    'Total score cache hits',
+    ['category'],
+    registry=REGISTRY
+)
+
+# 점수 캐시 미스 수 (실제 점수 계산)
+score_cache_misses_total = Counter(
+    'score_cache_misses_total',
+    'Total score cache misses',
+    ['category'],
+    registry=REGISTRY
+)
+
 # ============================================================================
 # LLM 메트릭
 # ============================================================================
@@ -127,6 +143,100 @@ llm_tokens_total = Counter(
     registry=REGISTRY
 )
 
+# ============================================================================
+# 실행기(executor) 메트릭
+# ============================================================================
+
+# 실행기 대기열 길이 (제출됐지만 아직 시작하지 못한 작업 수)
+executor_queue_depth = Gauge(
+    'executor_queue_depth',
+    'Tasks waiting for an executor worker',
+    ['pool'],  # pool: io, cpu
+    registry=REGISTRY
+)
+
+# 실행 중인 작업 수
+executor_active_tasks = Gauge(
+    'executor_active_tasks',
+    'Tasks currently running on an executor',
+    ['pool'],
+    registry=REGISTRY
+)
+
+# 제출 → 시작까지 대기 시간
+executor_wait_seconds = Histogram(
+    'executor_wait_seconds',
+    'Time a task waited for an executor worker',
+    ['pool'],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+    registry=REGISTRY
+)
+
+# 작업 실행 시간
+executor_task_duration_seconds = Histogram(
+    'executor_task_duration_seconds',
+    'Executor task run time',
+    ['pool'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    registry=REGISTRY
+)
+
+# ============================================================================
+# 백그라운드 분석 작업 메트릭
+# ============================================================================
+
+# 끝난 분석 작업 수
+analysis_jobs_total = Counter(
+    'analysis_jobs_total',
+    'Background analysis jobs by outcome',
+    ['status'],  # status: done, failed, inline (대기열이 가득 차 요청 안에서 계산)
+    registry=REGISTRY
+)
+
+# 대기 + 실행 중인 분석 작업 수
+analysis_jobs_inflight = Gauge(
+    'analysis_jobs_inflight',
+    'Background analysis jobs queued or running',
+    registry=REGISTRY
+)
+
+# 분석 작업 단계별 소요 시간
+analysis_job_phase_seconds = Histogram(
+    'analysis_job_phase_seconds',
+    'Background analysis job phase duration',
+    ['phase'],  # phase: queued, evidence, summary
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+    registry=REGISTRY
+)
+
+# ============================================================================
+# 세션 저장소 메트릭
+# ============================================================================
+
+# 저장된 세션 수
+session_store_entries = Gauge(
+    'session_store_entries',
+    'Sessions held in memory',
+    ['store'],  # store: review, chat
+    registry=REGISTRY
+)
+
+# 세션 추정 메모리 합계
+session_store_bytes = Gauge(
+    'session_store_bytes',
+    'Estimated memory held by in-memory sessions',
+    ['store'],
+    registry=REGISTRY
+)
+
+# 제거된 세션 수
+session_store_evictions_total = Counter(
+    'session_store_evictions_total',
+    'Sessions evicted from the in-memory store',
+    ['store', 'reason'],  # reason: lru, bytes, ttl
+    registry=REGISTRY
+)
+
 # ============================================================================
 # 에러 메트릭
 # ============================================================================
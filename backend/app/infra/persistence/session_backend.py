@@ -0,0 +1,235 @@
+"""세션 백엔드: 대화 세션 상태 저장소 (메모리 / SQLite / Redis)
+
+워커(프로세스)마다 dict로 세션을 들고 있으면 같은 세션의 요청이 항상 같은 워커로 가야 한다.
+공유 백엔드(SQLite, Redis)는 대화 상태만 작게 직렬화해 저장하고, 무거운 상품 분석은
+참조(`session_ref()`)로만 남겨 어느 워커든 세션을 이어받을 수 있게 한다.
+
+- memory: 프로세스 내 `SessionStore` (기본값, 단일 워커) + 선택적 append-only 스냅샷(`session_snapshot`)으로 재시작 후 lazy 복원
+- sqlite: 로컬 파일 DB - 같은 호스트의 여러 uvicorn 워커가 공유 (로컬 테스트/단일 노드)
+- redis: 여러 레플리카가 공유 (`redis` 패키지 필요, 테스트는 fakeredis 클라이언트를 그대로 넘기면 됨)
+
+직렬화는 `session_codec` 참고 (대화 상태 JSON + 상품 분석 참조, 큰 상태는 zlib 압축).
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ...core.settings import settings
+from ..cache.session_store import SessionStore
+from .session_codec import decode_session_state, encode_session_state
+from .session_snapshot import SessionSnapshotLog, SnapshotLogLocked
+
+logger = logging.getLogger(__name__)
+
+class SessionBackend(ABC):
+    """세션 상태 저장소 인터페이스
+
+    load가 돌려준 dict를 수정한 뒤 save로 다시 저장한다 (공유 백엔드는 save 전까지 다른 워커에 보이지 않음).
+    """
+    name: str = ""
+    is_shared: bool = True     # 워커 간 공유 (직렬화)
+    blocking_io: bool = True   # load/save가 디스크/네트워크 I/O를 할 수 있음 (호출자는 io 실행기에서 호출)
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 상태 (없거나 만료되었으면 None)"""
+
+    @abstractmethod
+    def save(self, session_id: str, state: Dict[str, Any]) -> None:
+        """세션 상태 저장 (마지막 접근 시각 갱신)"""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """세션 삭제"""
+
+    def close(self) -> None:
+        """연결 정리"""
+
+
+class InMemorySessionBackend(SessionBackend):
+    """프로세스 내 세션 (직렬화 없이 dict를 그대로 보관, LRU + 유휴 TTL + 메모리 상한)
+
+    snapshot이 있으면 저장할 때마다 스냅샷 로그에도 덧붙이고, 메모리에 없는 세션
+    (재시작 전 세션, LRU로 밀려난 세션)은 조회 시 스냅샷에서 복원한다 (상품 분석은 `analysis_ref`로 남음).
+    """
+    name = "memory"
+    is_shared = False
+
+    def __init__(self, store: SessionStore, snapshot: Optional[SessionSnapshotLog] = None):
+        self.store = store
+        self.snapshot = snapshot
+        self.blocking_io = snapshot is not None
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        state = self.store.get(session_id)
+        if state is None and self.snapshot is not None:
+            state = self.snapshot.load(session_id)
+            if state is not None:
+                logger.info(f"[세션 백엔드] 스냅샷에서 세션 복원: {session_id}")
+                self.store[session_id] = state
+        return state
+
+    def save(self, session_id: str, state: Dict[str, Any]) -> None:
+        if self.store.get(session_id) is not state:
+            self.store[session_id] = state
+        else:
+            self.store.refresh_size(session_id)
+        if self.snapshot is not None:
+            self.snapshot.append(session_id, state)
+
+    def delete(self, session_id: str) -> None:
+        self.store.pop(session_id)
+        if self.snapshot is not None:
+            self.snapshot.delete(session_id)
+
+    def close(self) -> None:
+        if self.snapshot is not None:
+            self.snapshot.close()
+
+
+class SQLiteSessionBackend(SessionBackend):
+    """SQLite 파일 세션 (같은 호스트의 워커끼리 공유, WAL 모드)"""
+    name = "sqlite"
+
+    _PURGE_EVERY = 100  # save N회마다 만료 세션 정리
+
+    def __init__(self, path: str | Path, ttl_seconds: float = 0):
+        """
+        Args:
+            path: DB 파일 경로
+            ttl_seconds: 마지막 저장 후 유지 시간 (0 = 무제한)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()  # 스레드별 연결 (이벤트 루프 + 실행기 스레드)
+        self._saves = 0
+        with self._conn() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, state BLOB NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=10.0)
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_seconds if self.ttl_seconds > 0 else float("-inf")
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            "SELECT state FROM sessions WHERE session_id = ? AND updated_at >= ?",
+            (session_id, self._cutoff()),
+        ).fetchone()
+        return decode_session_state(row[0]) if row else None
+
+    def save(self, session_id: str, state: Dict[str, Any]) -> None:
+        blob = encode_session_state(state)
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO sessions (session_id, state, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at",
+                (session_id, blob, time.time()),
+            )
+            self._saves += 1
+            if self.ttl_seconds > 0 and self._saves % self._PURGE_EVERY == 0:
+                conn.execute("DELETE FROM sessions WHERE updated_at < ?", (self._cutoff(),))
+
+    def delete(self, session_id: str) -> None:
+        with self._conn() as conn:
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RedisSessionBackend(SessionBackend):
+    """Redis 세션 (레플리카끼리 공유, 만료는 Redis TTL)"""
+    name = "redis"
+
+    def __init__(self, client: Any, ttl_seconds: float = 0, prefix: str = "reviewlens:session:"):
+        """
+        Args:
+            client: redis.Redis 호환 클라이언트 (get/set/delete, decode_responses=False)
+            ttl_seconds: 마지막 저장 후 유지 시간 (0 = 무제한)
+            prefix: 키 접두사
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, ttl_seconds: float = 0) -> "RedisSessionBackend":
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("SESSION_BACKEND=redis 사용 시 redis 패키지가 필요합니다 (pip install redis)") from e
+        return cls(redis.Redis.from_url(url), ttl_seconds=ttl_seconds)
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        blob = self.client.get(self.prefix + session_id)
+        return decode_session_state(blob) if blob else None
+
+    def save(self, session_id: str, state: Dict[str, Any]) -> None:
+        ex = int(self.ttl_seconds) if self.ttl_seconds > 0 else None
+        self.client.set(self.prefix + session_id, encode_session_state(state), ex=ex)
+
+    def delete(self, session_id: str) -> None:
+        self.client.delete(self.prefix + session_id)
+
+    def close(self) -> None:
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            close()
+
+
+def create_session_backend(kind: str, store_name: str = "review") -> SessionBackend:
+    """설정값(memory/sqlite/redis)에 맞는 세션 백엔드 생성"""
+    ttl = settings.SESSION_IDLE_TTL_SECONDS
+    if kind == "memory":
+        snapshot = None
+        if settings.SESSION_SNAPSHOT_PATH:
+            try:
+                snapshot = SessionSnapshotLog(
+                    settings.SESSION_SNAPSHOT_PATH,
+                    ttl_seconds=ttl,
+                    compact_min_bytes=settings.SESSION_SNAPSHOT_COMPACT_BYTES,
+                )
+            except SnapshotLogLocked as e:
+                # 여러 워커 + memory 백엔드: 처음 연 워커만 스냅샷을 쓴다 (공유가 필요하면 sqlite/redis)
+                logger.warning(f"[세션 백엔드] {e} - 이 워커는 스냅샷 없이 메모리 세션만 사용")
+        return InMemorySessionBackend(SessionStore(
+            store_name,
+            max_entries=settings.API_MAX_CACHE_SIZE,
+            max_bytes=settings.SESSION_MAX_BYTES,
+            ttl_seconds=ttl,
+        ), snapshot=snapshot)
+    if kind == "sqlite":
+        return SQLiteSessionBackend(settings.SESSION_SQLITE_PATH, ttl_seconds=ttl)
+    if kind == "redis":
+        return RedisSessionBackend.from_url(settings.SESSION_REDIS_URL, ttl_seconds=ttl)
+    raise ValueError(f"unknown SESSION_BACKEND: {kind}")
+
+
+@lru_cache(maxsize=1)
+def get_session_backend() -> SessionBackend:
+    """프로세스 공용 세션 백엔드 (settings.SESSION_BACKEND)"""
+    backend = create_session_backend(settings.SESSION_BACKEND)
+    logger.info(f"[세션 백엔드] {backend.name}")
+    return backend
@@ -0,0 +1,44 @@
+"""세션 상태 직렬화: 공유 세션 백엔드/세션 스냅샷 공용 포맷
+
+- `session_ref()`를 가진 값(공유 상품 분석 등)은 `<key>_ref`에 참조만 저장 - 복원은 호출자가 담당
+- TRANSIENT_KEYS(파생 캐시)는 저장하지 않음
+- 나머지는 JSON, 일정 크기 이상이면 zlib 압축
+"""
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Dict, Optional
+
+SESSION_CODEC_VERSION = 1
+TRANSIENT_KEYS = frozenset({"asked_questions_state"})  # 다시 계산 가능한 파생 캐시 (질문 그래프 객체 포함)
+_COMPRESS_MIN_BYTES = 512
+
+
+def encode_session_state(state: Dict[str, Any]) -> bytes:
+    """세션 상태 → bytes (b"j" + JSON 또는 b"z" + zlib(JSON))"""
+    payload: Dict[str, Any] = {"_v": SESSION_CODEC_VERSION}
+    for key, value in state.items():
+        if key in TRANSIENT_KEYS:
+            continue
+        if hasattr(value, "session_ref"):
+            payload[f"{key}_ref"] = value.session_ref()
+        else:
+            payload[key] = value
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(raw) >= _COMPRESS_MIN_BYTES:
+        return b"z" + zlib.compress(raw, 6)
+    return b"j" + raw
+
+
+def decode_session_state(blob: bytes) -> Optional[Dict[str, Any]]:
+    """bytes → 세션 상태 (형식/버전이 맞지 않으면 None)"""
+    tag, body = blob[:1], blob[1:]
+    if tag == b"z":
+        body = zlib.decompress(body)
+    elif tag != b"j":
+        return None
+    state = json.loads(body.decode("utf-8"))
+    if state.pop("_v", None) != SESSION_CODEC_VERSION:
+        return None
+    return state
@@ -0,0 +1,240 @@
+"""세션 스냅샷 로그: 메모리 세션 백엔드의 append-only 영속화 (재시작 후 lazy 복원)
+
+예전 `SessionPersistence`는 세션마다 reviews_df 전체를 들여쓴 JSON으로 덮어써서
+세션 수 × 리뷰 수만큼 디스크를 쓰고, 복원하려면 모든 파일을 읽어야 했다.
+여기서는 세션을 저장할 때마다 작은 레코드 하나를 로그 끝에 덧붙인다.
+
+- 레코드 = 헤더(magic, 길이, crc32, 저장 시각, session_id 길이) + session_id + 세션 상태 blob
+  (blob은 `encode_session_state` - 대화 상태 + 상품 분석 참조(리뷰 스냅샷 내용 해시 키), 리뷰 데이터 없음)
+- blob 길이 0 = 삭제 표시
+- 시작 시에는 아무것도 읽지 않는다. 처음 조회할 때 헤더만 훑어 session_id → 마지막 레코드 위치 색인을 만들고,
+  이후 조회는 해당 레코드 하나만 읽는다. 상품 분석(리뷰)은 호출자가 참조 키로 공유 캐시에서 다시 연결한다.
+- 죽은 레코드(덮어쓴 이전 상태/삭제/만료)가 절반을 넘고 파일이 compact_min_bytes보다 크면 살아있는 레코드만 새 파일로 옮긴다.
+- 마지막 레코드가 쓰다 끊겼으면(비정상 종료) 색인을 만들 때 그 지점부터 잘라낸다.
+
+한 프로세스(메모리 백엔드)만 쓰는 로그다 (단일 writer). 색인/압축이 프로세스 안에만 있어서
+다른 프로세스가 같은 파일에 덧붙이거나 압축하면 레코드가 섞이거나 사라진다.
+그래서 생성할 때 옆의 `<로그>.lock` 파일에 배타 잠금(flock)을 걸고, 이미 다른 프로세스가 잡고 있으면
+`SnapshotLogLocked` - 메모리 백엔드는 스냅샷 없이 동작한다. 여러 워커가 세션을 공유하려면 sqlite/redis 백엔드를 쓴다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+from .session_codec import decode_session_state, encode_session_state
+
+try:
+    import fcntl
+except ImportError:  # Windows - 잠금 없이 단일 프로세스로 가정
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"RLS1"
+_HEADER = struct.Struct("<4sIIdH")  # magic, blob 길이, crc32(session_id + blob), 저장 시각(unix), session_id 길이
+
+
+def _record(session_id: str, blob: bytes, saved_at: float) -> bytes:
+    sid = session_id.encode("utf-8")
+    crc = zlib.crc32(blob, zlib.crc32(sid))
+    return _HEADER.pack(_MAGIC, len(blob), crc, saved_at, len(sid)) + sid + blob
+
+
+class SnapshotLogLocked(RuntimeError):
+    """다른 프로세스가 이미 같은 스냅샷 로그를 쓰고 있음"""
+
+
+class SessionSnapshotLog:
+    """append-only 세션 스냅샷 파일 (스레드 안전)"""
+
+    def __init__(self, path: str | Path, ttl_seconds: float = 0, compact_min_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            path: 로그 파일 경로
+            ttl_seconds: 마지막 저장 후 복원 가능 시간 (0 = 무제한)
+            compact_min_bytes: 이 크기 이상일 때만 압축(compaction) 고려
+
+        Raises:
+            SnapshotLogLocked: 다른 프로세스가 이 로그를 열고 있음
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_file = self._acquire_writer_lock()
+        self.ttl_seconds = ttl_seconds
+        self.compact_min_bytes = compact_min_bytes
+        self._lock = threading.Lock()
+        self._writer: Optional[BinaryIO] = None
+        # session_id → (blob 위치, blob 길이, 저장 시각) - 처음 조회 시 생성
+        self._index: Optional[Dict[str, Tuple[int, int, float]]] = None
+        self._live_bytes = 0
+
+    def _acquire_writer_lock(self) -> Optional[BinaryIO]:
+        """`<로그>.lock`에 배타 잠금 (close 또는 프로세스 종료 시 해제)"""
+        if fcntl is None:
+            return None
+        lock_file = open(self.path.with_name(self.path.name + ".lock"), "ab")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise SnapshotLogLocked(f"세션 스냅샷 로그를 다른 프로세스가 사용 중: {self.path}")
+        return lock_file
+
+    # ----------------------------- 쓰기 -----------------------------
+
+    def append(self, session_id: str, state: Dict[str, Any]) -> None:
+        """세션 상태 저장 (로그 끝에 레코드 추가)"""
+        self._append(session_id, encode_session_state(state))
+
+    def delete(self, session_id: str) -> None:
+        """세션 삭제 표시"""
+        self._append(session_id, b"")
+
+    def _append(self, session_id: str, blob: bytes) -> None:
+        saved_at = time.time()
+        rec = _record(session_id, blob, saved_at)
+        with self._lock:
+            writer = self._get_writer()
+            offset = writer.tell()
+            writer.write(rec)
+            writer.flush()
+            end = offset + len(rec)
+            if self._index is None:
+                # 색인은 첫 조회 때 파일에서 만든다 (이 레코드 포함) - 쓰기만 하는 프로세스도 커지면 압축하도록 그때 생성
+                if end < self.compact_min_bytes:
+                    return
+                self._ensure_index()
+            index = self._index
+            old = index.pop(session_id, None)
+            if old is not None:
+                self._live_bytes -= old[1]
+            if blob:
+                index[session_id] = (offset + len(rec) - len(blob), len(blob), saved_at)
+                self._live_bytes += len(blob)
+            if end >= self.compact_min_bytes and self._live_bytes * 2 < end:
+                self._compact()
+
+    def _get_writer(self) -> BinaryIO:
+        if self._writer is None:
+            self._writer = open(self.path, "ab")
+        return self._writer
+
+    # ----------------------------- 읽기 -----------------------------
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션의 마지막 상태 (없음/삭제/만료/손상이면 None)"""
+        with self._lock:
+            entry = self._ensure_index().get(session_id)
+            if entry is None or self._expired(entry[2]):
+                return None
+            offset, length, saved_at = entry
+            sid = session_id.encode("utf-8")
+            with open(self.path, "rb") as f:
+                f.seek(offset - _HEADER.size - len(sid))
+                header = f.read(_HEADER.size)
+                f.seek(len(sid), os.SEEK_CUR)
+                blob = f.read(length)
+        _, _, crc, _, _ = _HEADER.unpack(header)
+        if len(blob) != length or zlib.crc32(blob, zlib.crc32(sid)) != crc:
+            logger.warning(f"[세션 스냅샷] 손상된 레코드 무시: {session_id}")
+            return None
+        return decode_session_state(blob)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ensure_index())
+
+    def _expired(self, saved_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - saved_at > self.ttl_seconds
+
+    def _ensure_index(self) -> Dict[str, Tuple[int, int, float]]:
+        """헤더만 훑어 색인 생성 (blob은 건너뜀) - 끊긴 꼬리 레코드는 잘라냄"""
+        if self._index is not None:
+            return self._index
+
+        started = time.perf_counter()
+        index: Dict[str, Tuple[int, int, float]] = {}
+        live = 0
+        good_end = 0
+        if self.path.exists():
+            size = self.path.stat().st_size
+            with open(self.path, "rb") as f:
+                while True:
+                    header = f.read(_HEADER.size)
+                    if len(header) < _HEADER.size:
+                        break
+                    magic, length, _, saved_at, sid_len = _HEADER.unpack(header)
+                    if magic != _MAGIC:
+                        break
+                    blob_offset = good_end + _HEADER.size + sid_len
+                    if blob_offset + length > size:
+                        break
+                    session_id = f.read(sid_len).decode("utf-8", errors="replace")
+                    f.seek(length, os.SEEK_CUR)
+                    old = index.pop(session_id, None)
+                    if old is not None:
+                        live -= old[1]
+                    if length:
+                        index[session_id] = (blob_offset, length, saved_at)
+                        live += length
+                    good_end = blob_offset + length
+            if good_end < size:
+                if self._writer is not None:
+                    self._writer.close()
+                    self._writer = None
+                logger.warning(f"[세션 스냅샷] 끊긴 레코드 잘라냄: {size - good_end} bytes")
+                with open(self.path, "r+b") as f:
+                    f.truncate(good_end)
+
+        self._index = index
+        self._live_bytes = live
+        logger.info(
+            f"[세션 스냅샷] 색인 생성: {len(index)}개 세션, {good_end / 1e6:.1f}MB "
+            f"({time.perf_counter() - started:.3f}s)"
+        )
+        return index
+
+    # ----------------------------- 압축 -----------------------------
+
+    def _compact(self) -> None:
+        """살아있는(만료되지 않은) 세션의 마지막 레코드만 새 파일로 옮김 (lock 보유 상태에서 호출)"""
+        index = self._ensure_index()
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        new_index: Dict[str, Tuple[int, int, float]] = {}
+        live = 0
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        with open(self.path, "rb") as src, open(tmp, "wb") as dst:
+            for session_id, (offset, length, saved_at) in index.items():
+                if self._expired(saved_at):
+                    continue
+                src.seek(offset)
+                rec = _record(session_id, src.read(length), saved_at)
+                pos = dst.tell()
+                dst.write(rec)
+                new_index[session_id] = (pos + len(rec) - length, length, saved_at)
+                live += length
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp, self.path)
+        self._index = new_index
+        self._live_bytes = live
+        logger.info(f"[세션 스냅샷] 압축: {len(new_index)}개 세션, {self.path.stat().st_size / 1e6:.1f}MB")
+
+    def close(self) -> None:
+        """파일 닫고 writer 잠금 해제 (이후 다른 프로세스가 열 수 있음)"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = None
@@ -101,15 +101,27 @@ def create_app() -> FastAPI:
     @app.on_event("startup")
     async def startup_event():
         """애플리케이션 시작 시 실행"""
-        logger.info("[Startup] 세션 복원 시작...")
         try:
-            # TODO: 새로운 구조에 맞게 세션 복원 로직 재구현
-            # from .infra.persistence.session_repo import SessionRepository
-            # session_repo = SessionRepository()
-            # await session_repo.restore_sessions()
-            logger.info("[Startup] 세션 복원 완료")
+            # 세션은 첫 조회 시 스냅샷/공유 백엔드에서 lazy 복원 (시작 시간은 세션 수와 무관)
+            from .infra.persistence.session_backend import get_session_backend
+            backend = get_session_backend()
+            logger.info(f"[Startup] 세션 백엔드 준비: {backend.name} (세션은 첫 조회 시 복원)")
         except Exception as e:
-            logger.error(f"[Startup] 세션 복원 중 오류: {str(e)}", exc_info=True)
+            logger.error(f"[Startup] 세션 백엔드 초기화 중 오류: {str(e)}", exc_info=True)
+
+    # Shutdown event
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """애플리케이션 종료 시 분석 작업, 실행기(io/cpu 풀), 세션 백엔드 연결 정리"""
+        from .infra.concurrency.executors import shutdown_executors
+        from .infra.persistence.session_backend import get_session_backend
+        from .services.analysis_jobs import get_analysis_job_manager
+        if get_analysis_job_manager.cache_info().currsize:
+            await get_analysis_job_manager().cancel_all()
+        shutdown_executors()
+        if get_session_backend.cache_info().currsize:
+            get_session_backend().close()
+        logger.info("[Shutdown] 분석 작업/실행기/세션 백엔드 종료 완료")
 
     # Metrics middleware (첫 번째로 등록하여 모든 요청 추적)
     app.add_middleware(MetricsMiddleware)
@@ -0,0 +1,247 @@
+"""백그라운드 분석 작업 - 대화 수렴 후 분석(evidence → LLM 요약)을 응답 밖에서 실행 (Service Layer)
+
+수렴한 답변 요청이 evidence 추출과 동기 LLM 호출(수 초)을 기다리면 그동안 채팅 UI가 멈춘다.
+분석을 작업으로 넘기고 작업 ID만 바로 돌려준 뒤, 클라이언트는 상태 조회(long-poll)로 결과를 받는다.
+
+- 단계: queued → retrieving → summarizing → done | failed
+  summarizing부터 상위 요인/evidence(부분 결과)를 공개하고, done에서 LLM 요약까지 포함한 전체 결과로 바꾼다.
+- evidence 단계는 cpu 실행기, LLM 단계는 io 실행기에서 실행 (`infra.concurrency.executors`)
+- 동시에 실행하는 작업은 ANALYSIS_JOB_WORKERS개, 대기는 ANALYSIS_JOB_MAX_PENDING개까지.
+  대기열이 가득 차면 `AnalysisJobsBusy` - 호출자는 요청 안에서 바로 계산한다.
+- 작업은 세션별 1개 (다시 수렴하면 새 작업으로 교체), 끝난 작업은 마지막 조회 후 TTL 동안 보관.
+- 상태가 바뀔 때마다 on_update 콜백 → 호출자가 세션에 `record()`(작업 ID/상태/상위 요인)만 기록해
+  다른 워커에서도 상태를 조회할 수 있게 한다. 전체 결과는 이 작업 저장소에서 내려준다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from ..core.settings import settings
+from ..infra.cache.session_store import SessionStore
+from ..infra.concurrency.executors import run_cpu, run_io
+from ..infra.observability.metrics import (
+    analysis_job_phase_seconds,
+    analysis_jobs_inflight,
+    analysis_jobs_total,
+)
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = frozenset({"done", "failed"})
+
+
+class AnalysisJobsBusy(RuntimeError):
+    """대기 중인 분석 작업이 상한에 도달함"""
+
+
+@dataclass(eq=False)
+class AnalysisJob:
+    """세션 1개의 분석 작업 상태 (이벤트 루프에서만 갱신)"""
+    job_id: str
+    session_id: str
+    status: str = "queued"
+    analysis: Optional[Dict[str, Any]] = None  # summarizing: 상위 요인/evidence, done: LLM 요약 포함 전체
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "session_id": self.session_id,
+            "status": self.status,
+            "analysis": self.analysis,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+    def record(self) -> Dict[str, Any]:
+        """세션 상태에 남기는 작은 요약 (전체 결과 제외, 부분 결과는 상위 요인만)"""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "top_factors": (self.analysis or {}).get("top_factors"),
+        }
+
+    def _set(self, status: str, analysis: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        self.status = status
+        if analysis is not None:
+            self.analysis = analysis
+        self.error = error
+        self.updated_at = time.time()
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait_change(self, timeout: float) -> None:
+        """상태가 바뀔 때까지 최대 timeout초 대기 (끝난 작업은 즉시 반환)"""
+        if self.finished or timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class AnalysisJobManager:
+    """세션 ID → 최근 분석 작업 (동시 실행 수/대기 수 제한)"""
+
+    def __init__(self, max_workers: int, max_pending: int, ttl_seconds: float = 0):
+        """
+        Args:
+            max_workers: 동시에 실행하는 작업 수
+            max_pending: 실행을 기다리는 작업 수 상한
+            ttl_seconds: 마지막 조회 후 작업 보관 시간 (0 = 무제한)
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+        self._jobs = SessionStore("analysis_job", ttl_seconds=ttl_seconds)
+        self._tasks: Set[asyncio.Task] = set()
+        self._inflight = 0                 # create ~ 끝날 때까지 (대기 + 실행 중)
+        self._unstarted: Set[str] = set()  # create 후 start 전인 작업 ID
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self, session_id: str) -> Optional[AnalysisJob]:
+        return self._jobs.get(session_id)
+
+    def create(self, session_id: str) -> AnalysisJob:
+        """대기 상태 작업 등록 (start 전에 작업 ID를 세션에 저장할 수 있게 분리)
+
+        Raises:
+            AnalysisJobsBusy: 대기 + 실행 중 작업이 상한 이상
+        """
+        if self._inflight >= self.max_workers + self.max_pending:
+            raise AnalysisJobsBusy(f"analysis jobs in flight: {self._inflight}")
+        # 자리는 여기서 예약 (start 전 await 사이에 들어온 create도 상한에 포함되도록)
+        self._inflight += 1
+        analysis_jobs_inflight.inc()
+        job = AnalysisJob(job_id=uuid.uuid4().hex[:16], session_id=session_id)
+        self._jobs[session_id] = job
+        self._unstarted.add(job.job_id)
+        return job
+
+    def discard(self, job: AnalysisJob, error: str = "not started") -> None:
+        """시작하지 못한 작업의 예약 자리 반환 (create 후 start 전에 실패했을 때)"""
+        if job.job_id not in self._unstarted:
+            return
+        self._unstarted.discard(job.job_id)
+        self._release()
+        job._set("failed", error=error)
+
+    def _release(self) -> None:
+        self._inflight -= 1
+        analysis_jobs_inflight.dec()
+
+    def start(
+        self,
+        job: AnalysisJob,
+        prepare: Callable[[], Tuple[Dict[str, Any], Any]],
+        summarize: Callable[[Dict[str, Any], Any], Dict[str, Any]],
+        on_update: Optional[Callable[[AnalysisJob], Awaitable[None]]] = None,
+    ) -> None:
+        """작업 실행 예약 (이벤트 루프에서 호출)
+
+        Args:
+            prepare: () → (부분 결과, 다음 단계 입력) - cpu 실행기
+            summarize: (부분 결과, 다음 단계 입력) → 전체 결과 - io 실행기
+            on_update: 부분 결과/완료 시 호출 (예: 세션 백엔드에 기록)
+        """
+        self._unstarted.discard(job.job_id)
+        task = asyncio.create_task(self._run(job, prepare, summarize, on_update))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    async def _run(
+        self,
+        job: AnalysisJob,
+        prepare: Callable[[], Tuple[Dict[str, Any], Any]],
+        summarize: Callable[[Dict[str, Any], Any], Dict[str, Any]],
+        on_update: Optional[Callable[[AnalysisJob], Awaitable[None]]],
+    ) -> None:
+        cancelled = False
+        try:
+            async with self._get_slots():
+                analysis_job_phase_seconds.labels(phase="queued").observe(time.time() - job.created_at)
+                job._set("retrieving")
+                started = time.perf_counter()
+                partial, state = await run_cpu(prepare)
+                analysis_job_phase_seconds.labels(phase="evidence").observe(time.perf_counter() - started)
+
+                job._set("summarizing", analysis=partial)
+                await self._notify(on_update, job)
+
+                started = time.perf_counter()
+                result = await run_io(summarize, partial, state)
+                analysis_job_phase_seconds.labels(phase="summary").observe(time.perf_counter() - started)
+                job._set("done", analysis=result)
+            analysis_jobs_total.labels(status="done").inc()
+            logger.info(f"[분석 작업] 완료: {job.session_id} ({job.job_id}, {job.updated_at - job.created_at:.2f}s)")
+        except asyncio.CancelledError:
+            cancelled = True
+            job._set("failed", error="cancelled")
+            analysis_jobs_total.labels(status="failed").inc()
+            raise
+        except Exception as e:
+            logger.error(f"[분석 작업] 실패: {job.session_id} ({job.job_id}): {e}", exc_info=True)
+            job._set("failed", error=str(e))
+            analysis_jobs_total.labels(status="failed").inc()
+        finally:
+            self._release()
+            # 취소되어도 끝난 상태를 기록해야 다른 워커의 조회가 끝없이 기다리지 않음
+            notify = self._notify(on_update, job)
+            if cancelled:
+                await asyncio.shield(notify)
+            else:
+                await notify
+
+    @staticmethod
+    async def _notify(on_update: Optional[Callable[[AnalysisJob], Awaitable[None]]], job: AnalysisJob) -> None:
+        if on_update is None:
+            return
+        try:
+            await on_update(job)
+        except Exception as e:
+            logger.warning(f"[분석 작업] 상태 기록 실패: {job.session_id} ({job.job_id}): {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {"max_workers": self.max_workers, "max_pending": self.max_pending, "inflight": self._inflight}
+
+    async def cancel_all(self, timeout: float = 5.0) -> None:
+        """실행 중/대기 작업 취소 후 끝난 상태 기록까지 대기 (앱 종료 시, 실행기 종료 전에 호출)"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+
+
+@lru_cache(maxsize=1)
+def get_analysis_job_manager() -> AnalysisJobManager:
+    """프로세스 공용 분석 작업 관리자"""
+    return AnalysisJobManager(
+        max_workers=settings.ANALYSIS_JOB_WORKERS,
+        max_pending=settings.ANALYSIS_JOB_MAX_PENDING,
+        ttl_seconds=settings.ANALYSIS_JOB_TTL_SECONDS,
+    )
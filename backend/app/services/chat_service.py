@@ -3,6 +3,9 @@ import logging
 from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
+from ..core.settings import settings
+from ..infra.cache.session_store import SessionStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,7 +18,13 @@ class ChatService:
             data_dir: Factor/Question CSV 데이터 디렉토리
         """
         self.data_dir = Path(data_dir)
-        self.sessions: Dict[str, 'DialogueSessionState'] = {}
+        # session_id → DialogueSessionState (LRU + 유휴 TTL + 메모리 상한)
+        self.sessions = SessionStore(
+            "chat",
+            max_entries=settings.API_MAX_CACHE_SIZE,
+            max_bytes=settings.SESSION_MAX_BYTES,
+            ttl_seconds=settings.SESSION_IDLE_TTL_SECONDS,
+        )
         
     def create_session(
         self, 
@@ -35,21 +44,16 @@ class ChatService:
         Returns:
             세션 정보
         """
-        from ..adapters.persistence.reg.store import load_csvs, parse_factors, parse_questions
+        from ..adapters.persistence.reg.catalog import get_reg_catalog
+        from ..adapters.persistence.reg.store import load_reviews_csv
         
         logger.info(f"세션 생성: {session_id} (category={category}, product={product_name})")
         
-        # Factor/Question 데이터 로드
-        if reviews_df is not None:
-            _, factors_df, questions_df = load_csvs(self.data_dir)
-            reviews = reviews_df
-        else:
-            reviews, factors_df, questions_df = load_csvs(self.data_dir)
-        
-        # 파싱
-        all_factors = parse_factors(factors_df)
-        factors = [f for f in all_factors if f.category == category]
-        questions = parse_questions(questions_df)
+        # Factor/Question: 프로세스 공유 카탈로그 (파싱 완료본)
+        catalog = get_reg_catalog(self.data_dir)
+        reviews = reviews_df if reviews_df is not None else load_reviews_csv(self.data_dir)
+        factors = catalog.factors_for(category)
+        questions = list(catalog.questions)
         
         # 세션 상태 저장
         session_state = DialogueSessionState(
@@ -88,10 +92,9 @@ class ChatService:
         Returns:
             봇 응답
         """
-        if session_id not in self.sessions:
+        session = self.sessions.get(session_id)
+        if session is None:
             raise ValueError(f"Session not found: {session_id}")
-        
-        session = self.sessions[session_id]
         logger.info(f"턴 처리: {session_id}, 메시지: {user_message[:50]}...")
         
         # 턴 수 증가
@@ -139,10 +142,9 @@ class ChatService:
     
     def get_session(self, session_id: str) -> Optional[Dict]:
         """세션 조회"""
-        if session_id not in self.sessions:
+        session = self.sessions.get(session_id)
+        if session is None:
             return None
-        
-        session = self.sessions[session_id]
         return {
             "session_id": session_id,
             "category": session.category,
@@ -0,0 +1,195 @@
+"""상품 분석 공유 캐시 - 상품 리뷰 스냅샷별 분석 결과를 모든 세션이 읽기 전용으로 공유 (Service Layer)
+
+같은 상품을 고른 사용자마다 정규화/스코어링/evidence 순위 목록/문장 주석을 새로 만들고
+세션마다 사본을 들고 있던 것을, (상품, 리뷰 스냅샷, factor 정의) 단위로 한 번 만들어 공유한다.
+세션에는 대화 상태와 `ProductAnalysis` 참조만 남는다 (공유 세션 백엔드에는 `session_ref()`만 저장).
+
+- 스냅샷 키: 리뷰 원본 파일 (경로, mtime, 크기) + factor 정의 해시 + 정규화(중복 제거) 설정
+  → 리뷰 파일이 갱신되거나 REG가 리로드되면 새 분석을 만든다 (이전 분석은 참조하던 세션이 끝날 때까지 유지).
+  파일 기반 로더가 아니면 원본 리뷰 DataFrame 내용 해시를 쓴다.
+- 같은 스냅샷을 동시에 요청하면 한 요청만 계산하고 나머지는 그 결과를 기다린다.
+- `ProductAnalysis`의 DataFrame/점수 행렬은 여러 세션이 공유하므로 수정 금지
+  (문장 주석 `sentence_index`만 조회 시 채워지는 메모이다).
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ..adapters.persistence.reg.store import Factor
+from ..core.settings import settings
+from ..domain.rules.review.incremental import factor_set_hash
+from ..domain.rules.review.postings import EvidencePostings
+from ..domain.rules.review.score_matrix import ScoreMatrix
+from ..domain.rules.review.sentence_index import SentenceIndex
+from ..infra.cache.session_store import SessionStore, register_shared_type
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, eq=False)
+class ProductAnalysis:
+    """상품 리뷰 스냅샷 1개의 분석 결과 (세션 간 공유, 읽기 전용)"""
+    key: str
+    category: str
+    category_name: str
+    product_name: str
+    normalized_df: pd.DataFrame
+    scored_df: pd.DataFrame                  # 정규화 리뷰 (_norm_text 포함, 행 순서 = score_matrix 행)
+    score_matrix: ScoreMatrix
+    factors: Tuple[Factor, ...]              # 점수를 만든 factor 정의 (카탈로그가 리로드되어도 점수와 일치)
+    top_factors: Tuple[Tuple[str, float], ...]
+    evidence_postings: EvidencePostings
+    sentence_index: SentenceIndex            # scored_df 문장/term 주석 (조회 시 채워짐)
+    suggested_factors: Tuple[Dict[str, Any], ...]
+
+    @property
+    def review_count(self) -> int:
+        return len(self.normalized_df)
+
+    def factor(self, factor_key: str) -> Optional[Factor]:
+        return next((f for f in self.factors if f.factor_key == factor_key), None)
+
+    def session_ref(self) -> Dict[str, str]:
+        """공유 세션 백엔드에 저장할 참조 (분석 자체는 워커마다 캐시/재구성)"""
+        return {
+            "key": self.key,
+            "product_name": self.product_name,
+            "category": self.category,
+            "category_name": self.category_name,
+        }
+
+
+# 세션 메모리 추정에서 공유 분석은 제외 (상품 분석 캐시가 따로 집계)
+register_shared_type(ProductAnalysis)
+
+
+def product_snapshot_key(
+    product_name: str,
+    factors: List[Factor],
+    vendor: str,
+    source: Optional[Tuple[Tuple[str, int, int], ...]] = None,
+    raw_df: Optional[pd.DataFrame] = None,
+) -> str:
+    """(상품, 리뷰 스냅샷, factor 정의, 정규화 설정) 해시 - 적중 시 리뷰 파일 읽기/정규화를 모두 건너뜀
+
+    Args:
+        source: 리뷰 로더의 source_signature (파일 경로/mtime/크기) - 있으면 파일을 읽지 않고 키 계산
+        raw_df: source가 없을 때(파일 기반이 아닌 로더) 내용 해시에 쓸 원본 리뷰
+    """
+    h = hashlib.sha1(f"{product_name}\0{vendor}".encode("utf-8"))
+    if source is not None:
+        h.update(repr(source).encode("utf-8"))
+    elif raw_df is not None:
+        h.update(f"{list(raw_df.columns)}".encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(raw_df.astype(str), index=False).to_numpy().tobytes())
+    else:
+        raise ValueError("source 또는 raw_df가 필요합니다")
+    h.update(factor_set_hash(factors).encode("ascii"))
+    h.update(f"{settings.DEDUPE_MODE}:{settings.DEDUPE_NEAR_THRESHOLD}:{settings.DEDUPE_NEAR_MIN_CHARS}".encode("ascii"))
+    return h.hexdigest()
+
+
+class ProductAnalysisCache:
+    """스냅샷 키 → ProductAnalysis (LRU, 같은 키 동시 계산은 1회)"""
+
+    def __init__(self, max_entries: int):
+        self._store = SessionStore("product", max_entries=max_entries)
+        self._locks: Dict[str, list] = {}  # 키 → [lock, 참조 수]
+        self._locks_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ProductAnalysis]:
+        return self._store.get(key)
+
+    def get_or_build(self, key: str, build: Callable[[], ProductAnalysis]) -> ProductAnalysis:
+        """캐시된 분석 또는 build()로 새로 만든 분석 (키별 single-flight)"""
+        analysis = self._store.get(key)
+        if analysis is not None:
+            logger.info(f"[상품 분석 캐시] 적중: {analysis.product_name} ({key[:12]})")
+            return analysis
+
+        with self._locks_lock:
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])  # [lock, 대기/실행 중 요청 수]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                analysis = self._store.get(key)  # 기다리는 동안 다른 요청이 만들었을 수 있음
+                if analysis is None:
+                    analysis = build()
+                    self._store[key] = analysis
+                    logger.info(f"[상품 분석 캐시] 생성: {analysis.product_name} ({key[:12]})")
+                return analysis
+        finally:
+            with self._locks_lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[key]
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+@lru_cache(maxsize=1)
+def get_product_analysis_cache() -> ProductAnalysisCache:
+    """프로세스 공유 상품 분석 캐시"""
+    return ProductAnalysisCache(max_entries=settings.PRODUCT_ANALYSIS_CACHE_SIZE)
+
+
+def build_product_analysis(
+    service: Any,
+    key: str,
+    product_name: str,
+    category: str,
+    category_name: str,
+    raw_df: pd.DataFrame,
+    factors: List[Factor],
+    vendor: str = "smartstore",
+    top_k: int = 5,
+) -> ProductAnalysis:
+    """원본 리뷰 → 정규화 → 스코어링 → evidence 순위 목록/문장 주석까지 만든 공유 분석
+
+    Args:
+        service: ReviewService (normalize_reviews/analyze_reviews)
+        key: product_snapshot_key
+        raw_df: 로더가 읽은 원본 리뷰
+        factors: 카테고리 Factor 리스트
+    """
+    normalized_df = service.normalize_reviews(raw_df, vendor=vendor)
+    analysis = service.analyze_reviews(
+        reviews_df=normalized_df,
+        factors=factors,
+        top_k=top_k,
+        save_results=False,
+        category=category,
+        product_id=product_name,
+        incremental=settings.SCORING_INCREMENTAL,
+    )
+    scored_df = analysis["scored_reviews_df"]
+    factor_map = {f.factor_key: f for f in factors}
+    return ProductAnalysis(
+        key=key,
+        category=category,
+        category_name=category_name,
+        product_name=product_name,
+        normalized_df=normalized_df,
+        scored_df=scored_df,
+        score_matrix=analysis["score_matrix"],
+        factors=tuple(factors),
+        top_factors=tuple(analysis["top_factors"]),
+        evidence_postings=analysis["evidence_postings"],
+        sentence_index=SentenceIndex(scored_df["text"], list(factors)),
+        suggested_factors=tuple(
+            {
+                "factor_id": factor_map[factor_key].factor_id,
+                "factor_key": factor_key,
+                "display_name": factor_map[factor_key].display_name,
+            }
+            for factor_key, _ in analysis["top_factors"]
+        ),
+    )
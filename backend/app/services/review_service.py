@@ -7,10 +7,13 @@ import pandas as pd
 from ..infra.loaders import ReviewLoaderFactory
 from ..infra.storage.csv_storage import CSVStorage
 from ..infra.cache.review_cache import ReviewCache
+from ..infra.cache.score_cache import cached_score_matrix
 from ..infra.collectors.smartstore import SmartStoreCollector
-from ..domain.rules.review.normalize import normalize_review, dedupe_reviews
-from ..domain.rules.review.scoring import compute_review_factor_scores
+from ..domain.rules.review.normalize import normalize_review_frame, dedupe_reviews
+from ..domain.rules.review.scoring import attach_score_columns
+from ..domain.rules.review.score_matrix import ScoreMatrix
 from ..domain.rules.review.retrieval import retrieve_evidence_reviews
+from ..domain.rules.review.postings import build_evidence_postings
 from ..core.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -274,30 +277,24 @@ class ReviewService:
         """
         logger.info(f"리뷰 정규화: {len(reviews_df)}건 (vendor={vendor})")
         
-        # 1. 각 리뷰 정규화
-        normalized = []
-        for _, row in reviews_df.iterrows():
-            norm_row = normalize_review(row, vendor=vendor)
-            normalized.append(norm_row)
-        
-        df = pd.DataFrame(normalized)
+        # 1. 벤더별 컬럼 매핑으로 표준 컬럼 구성 (행 단위 처리 없음)
+        df = normalize_review_frame(reviews_df, vendor=vendor)
         
         # 2. 중복 제거 (튜플 반환: df, total, removed)
-        df, total, removed = dedupe_reviews(df)
+        df, total, removed = dedupe_reviews(
+            df,
+            mode=settings.DEDUPE_MODE,
+            near_threshold=settings.DEDUPE_NEAR_THRESHOLD,
+            near_min_chars=settings.DEDUPE_NEAR_MIN_CHARS,
+        )
         
-        logger.info(f"  - 정규화 완료: {len(df)}건 (중복 제거: {removed}건)")
+        logger.info(f"  - 정규화 완료: {len(df)}건 (중복 제거: {removed}건, mode={settings.DEDUPE_MODE})")
         
         return df
     
-    def _aggregate_factor_scores(self, scored_df: pd.DataFrame, factors: List[Any]) -> Dict[str, float]:
-        """scored DataFrame에서 factor 점수 집계"""
-        factor_scores = {}
-        for factor in factors:
-            col_name = f"score_{factor.factor_key}"
-            if col_name in scored_df.columns:
-                total_score = scored_df[col_name].sum()
-                factor_scores[factor.factor_key] = total_score
-        return factor_scores
+    def _aggregate_factor_scores(self, score_matrix: ScoreMatrix) -> Dict[str, float]:
+        """점수 행렬에서 factor 점수 집계 (열 합계)"""
+        return score_matrix.factor_totals()
     
     def _get_top_factors(self, factor_scores: Dict[str, float], top_k: int) -> List[tuple]:
         """상위 k개 factor 추출"""
@@ -323,7 +320,8 @@ class ReviewService:
         top_k: int = 3,
         save_results: bool = False,
         category: str = "",
-        product_id: str = ""
+        product_id: str = "",
+        incremental: bool = False
     ) -> Dict[str, Any]:
         """리뷰 분석 (factor scoring) + Storage 저장
         
@@ -332,32 +330,42 @@ class ReviewService:
             factors: Factor 리스트
             top_k: 상위 factor 개수
             save_results: 결과 저장 여부
-            category: 카테고리 (저장 시 사용)
-            product_id: 제품 ID (저장 시 사용)
+            category: 카테고리 (저장/증분 스코어링 키로 사용)
+            product_id: 제품 ID (저장/증분 스코어링 키로 사용)
+            incremental: 이전 점수 스냅샷을 재사용해 신규 리뷰만 계산할지 여부
             
         Returns:
             분석 결과
         """
         logger.info(f"리뷰 분석: {len(reviews_df)}건, {len(factors)}개 factors")
         
-        # 1. Factor scoring
-        scored_df, factor_counts = compute_review_factor_scores(reviews_df, factors)
+        # 1. Factor scoring (희소 점수 행렬이 원본 - score_* 컬럼은 저장할 때만 만든다)
+        #    같은 리뷰 스냅샷 × factor 정의면 공용 점수 캐시에서 바로 로드, 미스일 때만 (증분) 계산
+        scored_df, score_matrix = cached_score_matrix(
+            reviews_df, factors, category, product_id=product_id if incremental and category else ""
+        )
+        factor_counts = score_matrix.factor_counts()
         
         # 2. 전체 factor 점수 집계
-        factor_scores = self._aggregate_factor_scores(scored_df, factors)
+        factor_scores = self._aggregate_factor_scores(score_matrix)
         
         # 3. Top factors
         top_factors = self._get_top_factors(factor_scores, top_k)
         
-        # 4. Storage에 결과 저장 (옵션)
+        # 4. factor별 evidence 순위 목록 (라벨별 분할) — 세션에 보관해 factor 클릭/최종 분석에서 재정렬 없이 사용
+        evidence_postings = build_evidence_postings(scored_df, score_matrix, factors)
+        
+        # 5. Storage에 결과 저장 (옵션)
         if save_results and category and product_id:
-            self._save_analysis_results(scored_df, category, product_id)
+            self._save_analysis_results(attach_score_columns(scored_df, score_matrix), category, product_id)
         
         return {
             "scored_reviews_df": scored_df,
+            "score_matrix": score_matrix,
             "factor_scores": factor_scores,
             "factor_counts": factor_counts,
             "top_factors": top_factors,
+            "evidence_postings": evidence_postings,
             "review_count": len(scored_df)
         }
     
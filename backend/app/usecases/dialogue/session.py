@@ -12,10 +12,16 @@ from typing import Dict, List, Optional, Tuple, Any
 
 import pandas as pd
 
-from ...adapters.persistence.reg.store import Factor, Question, load_csvs, parse_factors, parse_questions
-from ...domain.rules.review.scoring import compute_review_factor_scores
+from ...adapters.persistence.reg.catalog import get_reg_catalog
+from ...adapters.persistence.reg.question_graph import question_choices
+from ...adapters.persistence.reg.store import Factor, Question, load_reviews_csv
+from ...adapters.persistence.reg.matching import get_factor_similarity_index
+from ...domain.rules.review.scoring import select_top_factors_from_question
 from ...domain.rules.review.normalize import normalize_review, normalize_text
 from...domain.rules.review.retrieval import retrieve_evidence_reviews
+from ...domain.rules.review.sentence_index import SentenceIndex
+from ...domain.rules.review.postings import EvidencePostings, build_evidence_postings
+from ...domain.rules.review.score_matrix import ScoreMatrix
 from ...infra.observability.metrics import (
     dialogue_sessions_total,
     dialogue_turns_total,
@@ -27,6 +33,7 @@ from ...infra.observability.metrics import (
     llm_duration_seconds,
     Timer,
 )
+from ...infra.cache.score_cache import cached_score_matrix
 from ...core.settings import Settings, settings
 from backend.llm.llm_factory import get_llm_client
 
@@ -73,6 +80,17 @@ def _jaccard(a: List[str], b: List[str]) -> float:
     return len(sa & sb) / len(sa | sb)
 
 
+def select_top_factors(question: str, factors: List[Factor], top_k: int = 3) -> List[Tuple[str, float]]:
+    """사용자 질문 → 상위 factor (term 정확 매칭이 없으면 문자 n-gram 유사도 색인으로 오타/활용형 매칭)"""
+    return select_top_factors_from_question(
+        question,
+        factors,
+        top_k=top_k,
+        similarity_threshold=settings.DIALOGUE_FUZZY_MATCH_THRESHOLD,
+        similar_fn=lambda q, k, threshold: get_factor_similarity_index(factors).query(q, top_k=k, threshold=threshold),
+    )
+
+
 class DialogueSession:
     """3~5턴 대화 세션(수렴 로직: top3 Jaccard 기반)"""
 
@@ -89,11 +107,15 @@ class DialogueSession:
         self.stability_hits = 0  # 유사도 기준 안정 횟수
 
         self.asked_questions: set[str] = set()
+        self.asked_mask: int = 0  # question_graph 질문 번호 비트셋 (asked_questions와 함께 갱신)
         self.dialogue_history: List[Dict[str, str]] = []
 
         # 캐시(성능)
         self.scored_df: Optional[pd.DataFrame] = None
         self.factor_counts: Optional[Dict[str, int]] = None
+        self.score_matrix: Optional[ScoreMatrix] = None
+        self.sentence_index: Optional[SentenceIndex] = None  # 리뷰별 문장/term 주석 (evidence 발췌용)
+        self.evidence_postings: Optional[EvidencePostings] = None  # 분석 시점의 factor별 라벨 순위 목록 (있으면 재사용)
         
         # 메트릭: 세션 시작 카운트
         dialogue_sessions_total.labels(category=category).inc()
@@ -101,30 +123,29 @@ class DialogueSession:
         # Load data
         logger.info(f"[DialogueSession 초기화] category={category}, data_dir={data_dir}, custom_reviews={reviews_df is not None}, product_name={product_name}")
         
+        # Factor/Question: 프로세스 공유 카탈로그 (CSV가 바뀌었을 때만 다시 파싱)
+        catalog = get_reg_catalog(self.data_dir)
         if reviews_df is not None:
             # 외부에서 제공한 리뷰 사용 (세션별 수집 리뷰)
             self.reviews_df = reviews_df
-            _, factors_df, questions_df = load_csvs(self.data_dir)
-            logger.debug(f"  - reviews: {len(self.reviews_df)}건 (세션 데이터), factors: {len(factors_df)}건, questions: {len(questions_df)}건")
+            logger.debug(f"  - reviews: {len(self.reviews_df)}건 (세션 데이터), factors: {len(catalog.factors)}건, questions: {len(catalog.questions)}건")
         else:
             # CSV에서 로드 (기본 동작, 테스트용)
-            self.reviews_df, factors_df, questions_df = load_csvs(self.data_dir)
-            logger.debug(f"  - reviews: {len(self.reviews_df)}건 (CSV), factors: {len(factors_df)}건, questions: {len(questions_df)}건")
+            self.reviews_df = load_reviews_csv(self.data_dir)
+            logger.debug(f"  - reviews: {len(self.reviews_df)}건 (CSV), factors: {len(catalog.factors)}건, questions: {len(catalog.questions)}건")
         
-        # 모든 factor 파싱 후 현재 카테고리만 필터링
-        all_factors = parse_factors(factors_df)
-        self.factors = [f for f in all_factors if f.category == self.category]
+        # 현재 카테고리 factor (파싱/카테고리 색인은 카탈로그에서 재사용)
+        all_factors = catalog.factors
+        self.factors = catalog.factors_for(self.category)
         
         # factor_id와 factor_key 모두로 인덱싱 (하위 호환성)
         self.factors_map = {f.factor_key: f for f in self.factors}
         self.factors_by_id = {f.factor_id: f for f in self.factors}
         
-        # 현재 카테고리의 factor_id 목록
-        category_factor_ids = {f.factor_id for f in self.factors}
-        
-        # Parse questions - 현재 카테고리의 factor_id에 해당하는 질문만 필터링
-        all_questions = parse_questions(questions_df)
-        self.questions = [q for q in all_questions if q.factor_id in category_factor_ids]
+        # 현재 카테고리의 factor_id에 해당하는 질문만
+        all_questions = catalog.questions
+        self.questions = catalog.questions_for(self.category)
+        self.question_graph = catalog.question_graph(self.category)  # factor별 질문 색인 + next_factor_hint 간선
         
         logger.info(f"  - 전체 factors: {len(all_factors)}개 → 카테고리 '{self.category}' 필터링: {len(self.factors)}개")
         logger.info(f"  - 전체 questions: {len(all_questions)}개 → 카테고리 '{self.category}' 필터링: {len(self.questions)}개")
@@ -136,6 +157,60 @@ class DialogueSession:
                 self.category_slug = f.category.strip()
                 break
 
+    @classmethod
+    def from_analysis(
+        cls,
+        category: str,
+        data_dir: str | Path,
+        scored_df: pd.DataFrame,
+        factors: List[Factor],
+        score_matrix: Optional[ScoreMatrix] = None,
+        reviews_df: Optional[pd.DataFrame] = None,
+        product_name: Optional[str] = None,
+        sentence_index: Optional[SentenceIndex] = None,
+        evidence_postings: Optional[EvidencePostings] = None,
+    ) -> "DialogueSession":
+        """상품 분석 결과(스코어링 완료본)로 세션 복원 — 분석 단계에서 재스코어링 없이 evidence 추출/LLM만 수행
+
+        Args:
+            category: 카테고리
+            data_dir: 데이터 디렉토리
+            scored_df: 분석 시점의 스코어링 결과 (행 순서 = score_matrix 행, score_matrix가 없으면 score_{factor} 컬럼 필요)
+            factors: scored_df를 만든 Factor 리스트 (그 사이 카탈로그가 리로드되어도 점수와 맞는 정의 사용)
+            score_matrix: scored_df의 점수 행렬
+            reviews_df: 원본(정규화) 리뷰 (없으면 scored_df)
+            product_name: 제품명
+            sentence_index: scored_df의 문장/term 주석
+            evidence_postings: 분석 시점의 factor별 evidence 순위 목록
+
+        Returns:
+            DialogueSession
+        """
+        session = cls(
+            category=category,
+            data_dir=data_dir,
+            reviews_df=reviews_df if reviews_df is not None else scored_df,
+            product_name=product_name,
+        )
+        session.factors = list(factors)
+        session.factors_map = {f.factor_key: f for f in session.factors}
+        session.factors_by_id = {f.factor_id: f for f in session.factors}
+
+        session.scored_df = scored_df
+        session.score_matrix = score_matrix
+        if score_matrix is not None:
+            session.factor_counts = score_matrix.factor_counts()
+        else:
+            session.factor_counts = {
+                f.factor_key: int((scored_df[f"score_{f.factor_key}"] > 0).sum())
+                for f in session.factors
+                if f"score_{f.factor_key}" in scored_df.columns
+            }
+        session.sentence_index = sentence_index
+        session.evidence_postings = evidence_postings
+        logger.info(f"[DialogueSession 복원] 분석 결과 재사용: reviews={len(scored_df)}, factors={len(session.factors)}")
+        return session
+
     # ----------------------------- public -----------------------------
 
     def _update_factor_scores(self, user_message: str) -> List[str]:
@@ -165,6 +240,18 @@ class DialogueSession:
                 self.cumulative_scores[f.factor_key] = self.cumulative_scores.get(f.factor_key, 0.0) + ws
                 matched_factors.append(f.factor_key)
         
+        if not matched_factors:
+            # 오타/활용형으로 term이 그대로 없으면 문자 n-gram 유사도 1위 factor를 context 매칭만큼 반영
+            similar = get_factor_similarity_index(self.factors).query(
+                user_message, top_k=1, threshold=settings.DIALOGUE_FUZZY_MATCH_THRESHOLD
+            )
+            for factor_key, sim in similar:
+                f = self.factors_map[factor_key]
+                ws = 0.3 * float(getattr(f, "weight", 1.0) or 1.0)
+                self.cumulative_scores[factor_key] = self.cumulative_scores.get(factor_key, 0.0) + ws
+                matched_factors.append(factor_key)
+                logger.debug(f"    - {factor_key}: 유사도 매칭 (cosine={sim:.3f})")
+        
         if matched_factors:
             logger.debug(f"  - 매칭된 factors: {matched_factors}")
         
@@ -308,67 +395,6 @@ class DialogueSession:
         logger.debug(f"  - focus_factors: {focus_factors} (turn={self.turn_count})")
         return focus_factors
 
-    def _collect_question_candidates(
-        self, 
-        focus_factors: List[str]
-    ) -> List[Tuple[int, str, str, str, Optional[List[str]]]]:
-        """포커스 요인에 대한 질문 후보 수집
-        
-        Returns:
-            List of (priority, question_text, question_id, answer_type, choices)
-        """
-        candidates: List[Tuple[int, str, str, str, Optional[List[str]]]] = []
-        
-        for factor_key in focus_factors:
-            factor_obj = self.factors_map.get(factor_key)
-            if not factor_obj:
-                logger.debug(f"    - factor_key '{factor_key}' not in factors_map")
-                continue
-            
-            logger.debug(f"    - factor '{factor_key}' (id={factor_obj.factor_id}) 질문 검색 중...")
-            
-            matched_count = 0
-            for question in self.questions:
-                if question.factor_id != factor_obj.factor_id:
-                    continue
-                
-                matched_count += 1
-                
-                if question.question_text in self.asked_questions:
-                    logger.debug(f"      - 질문 '{question.question_text[:30]}...' 이미 물어봄")
-                    continue
-
-                prio = question.question_id
-                choices = None
-                if question.choices and question.answer_type in ["single_choice", "multiple_choice"]:
-                    choices = [c.strip() for c in question.choices.split("|") if c.strip()]
-                
-                candidates.append((prio, question.question_text, str(question.question_id), question.answer_type, choices))
-                logger.debug(f"      ✓ 후보 추가: q_id={question.question_id}, '{question.question_text[:30]}...'")
-            
-            logger.debug(f"    - factor '{factor_key}' 매칭 질문: {matched_count}개")
-        
-        return candidates
-
-    def _select_best_question(
-        self, 
-        candidates: List[Tuple[int, str, str, str, Optional[List[str]]]]
-    ) -> Tuple[str, Optional[str], Optional[str], Optional[List[str]]]:
-        """후보 중 최적 질문 선택 (우선순위 기반)
-        
-        Returns:
-            (question_text, question_id, answer_type, choices)
-        """
-        if not candidates:
-            logger.debug(f"  - 후보 질문 없음, fallback 사용 (asked_questions={len(self.asked_questions)}개)")
-            return self._fallback_question()
-        
-        candidates.sort(key=lambda x: x[0])
-        _, picked_text, picked_id, picked_type, picked_choices = candidates[0]
-        self.asked_questions.add(picked_text)
-        logger.debug(f"  - 선택된 질문: q_id={picked_id}, '{picked_text[:30]}...'")
-        return picked_text, picked_id, picked_type, picked_choices
-
     def _pick_next_question(self, top_factors: List[Tuple[str, float]]) -> Tuple[str, Optional[str], Optional[str], Optional[List[str]]]:
         """다음 질문 선택
         
@@ -380,8 +406,18 @@ class DialogueSession:
             return self._fallback_question()
 
         focus_factors = self._determine_focus_factors(top_factors)
-        candidates = self._collect_question_candidates(focus_factors)
-        return self._select_best_question(candidates)
+        factor_ids = [self.factors_map[k].factor_id for k in focus_factors if k in self.factors_map]
+
+        # 포커스 factor들의 미질문 중 question_id가 가장 작은 질문 (컴파일된 질문 그래프 + asked 비트셋)
+        i = self.question_graph.best_for_factors(factor_ids, self.asked_mask)
+        if i is None:
+            logger.debug(f"  - 후보 질문 없음, fallback 사용 (asked_questions={len(self.asked_questions)}개)")
+            return self._fallback_question()
+
+        question = self.question_graph.questions[i]
+        self._mark_asked(question.question_text)
+        logger.debug(f"  - 선택된 질문: q_id={question.question_id}, '{question.question_text[:30]}...'")
+        return question.question_text, str(question.question_id), question.answer_type, question_choices(question)
 
     def _find_factor_by_name(
         self, 
@@ -421,18 +457,13 @@ class DialogueSession:
         Returns:
             (question_text, question_id, answer_type, choices)
         """
-        for question in self.questions:
-            if question.factor_id == factor_obj.factor_id:
-                if question.question_text not in self.asked_questions:
-                    self.asked_questions.add(question.question_text)
-                    
-                    choices = None
-                    if question.choices and question.answer_type in ["single_choice", "multiple_choice"]:
-                        choices = [c.strip() for c in question.choices.split("|") if c.strip()]
-                    
-                    logger.info(f"  - factor '{factor_obj.factor_key}'의 첫 질문: q_id={question.question_id}, answer_type={question.answer_type}, choices={len(choices) if choices else 0}개")
-                    
-                    return question.question_text, str(question.question_id), question.answer_type or 'no_choice', choices
+        i = self.question_graph.next_for_factor(factor_obj.factor_id, self.asked_mask)
+        if i is not None:
+            question = self.question_graph.questions[i]
+            self._mark_asked(question.question_text)
+            choices = question_choices(question)
+            logger.info(f"  - factor '{factor_obj.factor_key}'의 첫 질문: q_id={question.question_id}, answer_type={question.answer_type}, choices={len(choices) if choices else 0}개")
+            return question.question_text, str(question.question_id), question.answer_type or 'no_choice', choices
         
         logger.warning(f"  - factor '{factor_obj.factor_key}'의 질문이 없음, fallback 사용")
         return self._fallback_question()
@@ -457,6 +488,11 @@ class DialogueSession:
         logger.debug(f"    - factor 찾음: {factor_obj.factor_key} (id={factor_obj.factor_id})")
         return self._find_first_unasked_question(factor_obj)
     
+    def _mark_asked(self, question_text: str) -> None:
+        """물어본 질문 기록 (텍스트 집합 + 질문 그래프 비트셋)"""
+        self.asked_questions.add(question_text)
+        self.asked_mask = self.question_graph.mark_asked(self.asked_mask, question_text=question_text)
+
     def _fallback_question(self) -> Tuple[str, Optional[str], Optional[str], Optional[List[str]]]:
         """카테고리별 기본 질문 반환
         
@@ -469,20 +505,23 @@ class DialogueSession:
         # 아직 묻지 않은 질문 찾기
         for q in defaults:
             if q not in self.asked_questions:
-                self.asked_questions.add(q)
+                self._mark_asked(q)
                 return q, None, None, None
         
         # 모든 기본 질문을 다 했으면 마지막 질문
         final_question = "추가로 고려하시는 부분이 있나요?"
         if final_question not in self.asked_questions:
-            self.asked_questions.add(final_question)
+            self._mark_asked(final_question)
         return final_question, None, None, None
 
     def _compute_review_scores(self):
-        """리뷰 스코어 계산 (캐싱)"""
+        """리뷰 스코어 계산 (세션 내 메모 + 세션 간 공용 점수 캐시)"""
         if self.scored_df is None or self.factor_counts is None:
             with Timer(scoring_duration_seconds, {'category': self.category}):
-                self.scored_df, self.factor_counts = compute_review_factor_scores(self.reviews_df, self.factors)
+                # 점수는 행렬로만 보관 (score_* 컬럼을 만들지 않음)
+                self.scored_df, score_matrix = cached_score_matrix(self.reviews_df, self.factors, self.category)
+                self.factor_counts = score_matrix.factor_counts()
+                self.score_matrix = score_matrix
     
     def _retrieve_evidence(self, top_factors: List[Tuple[str, float]]) -> List[Dict]:
         """Evidence 리뷰 추출
@@ -493,6 +532,12 @@ class DialogueSession:
         Returns:
             Evidence 리뷰 리스트
         """
+        if self.sentence_index is None:
+            self.sentence_index = SentenceIndex(self.scored_df["text"], self.factors)
+        if self.evidence_postings is None and self.score_matrix is not None:
+            # 분석 결과에서 넘겨받지 못했으면 (점수 → BM25) 순위 목록을 세션에서 한 번 생성
+            self.evidence_postings = build_evidence_postings(self.scored_df, self.score_matrix, self.factors)
+        
         with Timer(retrieval_duration_seconds, {'category': self.category}):
             evidence = retrieve_evidence_reviews(
                 self.scored_df,
@@ -505,6 +550,10 @@ class DialogueSession:
                     1: {"NEG": settings.EVIDENCE_RANK1_NEG, "MIX": settings.EVIDENCE_RANK1_MIX, "POS": settings.EVIDENCE_RANK1_POS},
                     2: {"NEG": settings.EVIDENCE_RANK2_NEG, "MIX": settings.EVIDENCE_RANK2_MIX, "POS": settings.EVIDENCE_RANK2_POS},
                 },
+                sentence_index=self.sentence_index,
+                postings=self.evidence_postings,
+                mmr_lambda=settings.EVIDENCE_MMR_LAMBDA if settings.EVIDENCE_MMR_ENABLED else None,
+                score_matrix=self.score_matrix,
             )
         
         # 메트릭: evidence 수 기록
@@ -586,6 +635,11 @@ class DialogueSession:
         Returns:
             프론트엔드용 컨텍스트 딕셔너리
         """
+        context = self._build_base_context(top_factors, evidence, calculation_info)
+        return self._attach_llm_summary(context, llm_summary)
+
+    def _build_base_context(self, top_factors: List[Tuple[str, float]], evidence: List[Dict], calculation_info: Dict) -> Dict:
+        """프론트엔드용 컨텍스트 중 LLM 요약을 뺀 부분 (상위 요인, evidence, 계산 정보)"""
         safety_rules = [
             "가짜리뷰 여부를 단정하지 말 것",
             "근거 리뷰는 짧게 인용할 것",
@@ -612,13 +666,17 @@ class DialogueSession:
                     "label": e.get("label", "NEU"),
                     "factor": e.get("factor") or e.get("factor_key"),
                     "score": float(e.get("score") or 0.0),
+                    "highlights": e.get("highlights", []),  # excerpt 내 키워드 위치
                 }
                 for e in evidence
             ],
             "safety_rules": safety_rules,
             "calculation_info": calculation_info,
         }
-        
+        return context
+
+    def _attach_llm_summary(self, context: Dict, llm_summary: Any) -> Dict:
+        """LLM 요약을 컨텍스트에 추가 (factor_key → 표시명 교체)"""
         # llm_summary가 리스트면 다중 전략, 튜플이면 단일 전략
         if isinstance(llm_summary, list):
             # 다중 전략: llm_summaries 배열로 반환 (각 summary의 factor 교체)
@@ -645,6 +703,15 @@ class DialogueSession:
 
     def _generate_analysis(self, top_factors: List[Tuple[str, float]]) -> Dict:
         """분석 결과 생성 (대화 종료 없이)"""
+        context, evidence = self.prepare_analysis(top_factors)
+        return self.summarize_analysis(context, top_factors, evidence)
+
+    def prepare_analysis(self, top_factors: List[Tuple[str, float]]) -> Tuple[Dict, List[Dict]]:
+        """분석 1단계: 리뷰 스코어 → evidence 추출 → 계산 정보 (LLM 호출 없음, 수십 ms)
+
+        Returns:
+            (llm_summary가 없는 프론트엔드용 컨텍스트, evidence 원본 - summarize_analysis에 전달)
+        """
         logger.info(f"[분석 생성] turn={self.turn_count}, top_factors={len(top_factors)}")
         
         # 1) 리뷰 스코어 계산
@@ -653,14 +720,18 @@ class DialogueSession:
         # 2) Evidence 추출
         evidence = self._retrieve_evidence(top_factors)
 
-        # 3) LLM 요약 생성
-        llm_summary = self._generate_llm_summary(top_factors, evidence)
-
-        # 4) 계산 정보 구성
+        # 3) 계산 정보 구성 + 프론트엔드용 컨텍스트 (요약 제외)
         calculation_info = self._build_calculation_info()
+        return self._build_base_context(top_factors, evidence, calculation_info), evidence
+
+    def summarize_analysis(self, context: Dict, top_factors: List[Tuple[str, float]], evidence: List[Dict]) -> Dict:
+        """분석 2단계: LLM 요약 생성 후 컨텍스트에 붙임 (동기 LLM 호출, 수 초)
 
-        # 5) 프론트엔드용 컨텍스트 반환
-        return self._build_frontend_context(top_factors, evidence, llm_summary, calculation_info)
+        Returns:
+            context에 llm_summary(다중 전략이면 llm_summaries)를 더한 새 컨텍스트
+        """
+        llm_summary = self._generate_llm_summary(top_factors, evidence)
+        return self._attach_llm_summary(dict(context), llm_summary)
 
     def finalize_now(self) -> BotTurn:
         """사용자 요청으로 명시적 대화 종료"""
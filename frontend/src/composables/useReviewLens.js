@@ -249,6 +249,33 @@ export function useReviewLens() {
     analysisMode.value = 'url'
   }
 
+  // 백그라운드 분석 작업 결과 대기 (long-poll) - 상위 요인/evidence가 먼저 오고 LLM 요약은 나중에 완성됨
+  const ANALYSIS_WAIT_TIMEOUT_MS = 3 * 60 * 1000
+  const waitForAnalysis = async (job) => {
+    const deadline = Date.now() + ANALYSIS_WAIT_TIMEOUT_MS
+    let since = job.status
+    while (true) {
+      if (Date.now() > deadline) {
+        throw new Error('분석 작업 대기 시간 초과')
+      }
+      const response = await fetch(
+        `${config.baseURL}${job.poll_url}?wait=20&since=${encodeURIComponent(since)}`
+      )
+      const data = await response.json()
+      if (!response.ok || data.status === 'failed') {
+        throw new Error(data.error || data.detail || '분석 작업 실패')
+      }
+      if (data.status === 'done') {
+        return data.analysis
+      }
+      if (data.status === 'summarizing') {
+        loadingType.value = 'analyze'
+        loadingText.value = '근거 리뷰를 찾았어요. 분석 요약을 작성 중이에요...'
+      }
+      since = data.status
+    }
+  }
+
   const submitRating = async (rating, responseFile, strategy = null) => {
     try {
       const targetMessage = messages.value.find(m => 
@@ -443,6 +470,12 @@ export function useReviewLens() {
         return
       }
       
+      if (data.is_converged && !data.analysis && data.analysis_job) {
+        loadingType.value = 'analyze'
+        loadingText.value = '후회 포인트를 분석 중이에요...'
+        data.analysis = await waitForAnalysis(data.analysis_job)
+      }
+      
       if (data.is_converged && data.analysis) {
         if (data.analysis.top_factors && Array.isArray(data.analysis.top_factors)) {
           data.analysis.top_factors.forEach(factor => {
@@ -722,6 +755,12 @@ export function useReviewLens() {
         return
       }
       
+      if (data.is_converged && !data.analysis && data.analysis_job) {
+        loadingType.value = 'analyze'
+        loadingText.value = '후회 포인트를 분석 중이에요...'
+        data.analysis = await waitForAnalysis(data.analysis_job)
+      }
+      
       if (data.is_converged && data.analysis) {
         if (data.analysis.top_factors && Array.isArray(data.analysis.top_factors)) {
           data.analysis.top_factors.forEach(factor => {
@@ -0,0 +1,42 @@
+"""pytest 공통 설정 - 저장소 루트를 import 경로에 추가 (`backend.app...` 패키지 import) + 번들 데이터 fixture"""
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DATA_DIR = ROOT / "backend" / "data"
+
+
+@pytest.fixture(scope="session")
+def data_dir() -> Path:
+    """번들 데이터 디렉토리 (backend/data)"""
+    return DATA_DIR
+
+
+@pytest.fixture(scope="session")
+def reg_factors():
+    """번들 REG factor 정의 (전체 카테고리)"""
+    from backend.app.adapters.persistence.reg.store import load_csvs, parse_factors
+
+    _, factor_df, _ = load_csvs(DATA_DIR)
+    return parse_factors(factor_df)
+
+
+@pytest.fixture(scope="session")
+def bundled_reviews() -> pd.DataFrame:
+    """번들 리뷰 JSON 전체 + 경계 케이스 행 (결측/빈 텍스트, 단위 표기, 반복 문자)"""
+    rows = []
+    for path in sorted((DATA_DIR / "review").glob("reviews_*.json")):
+        rows.extend(json.loads(path.read_text(encoding="utf-8")))
+    rows += [
+        {"review_id": "edge-none", "rating": None, "text": None},
+        {"review_id": "edge-empty", "rating": 5, "text": ""},
+        {"review_id": "edge-units", "rating": "2", "text": "소음 40dB, 용량 1.5ℓ ㅋㅋㅋㅋㅋ!!!!! 크기 OK"},
+    ]
+    return pd.DataFrame(rows)
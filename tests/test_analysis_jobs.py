@@ -0,0 +1,172 @@
+"""백그라운드 분석 작업 테스트 (대기열 상한, 취소/폐기 기록, 부분 결과 → 전체 결과, long-poll 조회)"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.app.services.analysis_jobs import AnalysisJobManager, AnalysisJobsBusy
+
+PARTIAL = {"top_factors": [{"factor_key": "noise", "score": 3.0}], "evidence": [{"review_id": "r1", "excerpt": "소음이 커요"}]}
+FINAL = {**PARTIAL, "llm_summary": "소음 불만이 많습니다"}
+
+
+async def _until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_create_rejects_when_queue_is_full():
+    jobs = AnalysisJobManager(max_workers=1, max_pending=1)
+    first = jobs.create("s1")
+    jobs.create("s2")
+    with pytest.raises(AnalysisJobsBusy):
+        jobs.create("s3")
+
+    # 시작하지 못한 작업을 폐기하면 자리가 돌아온다
+    jobs.discard(first)
+    assert jobs.create("s3").status == "queued"
+    assert jobs.stats()["inflight"] == 2
+
+
+def test_discard_records_failed_state_once():
+    jobs = AnalysisJobManager(max_workers=1, max_pending=0)
+    job = jobs.create("s1")
+    jobs.discard(job, error="세션 저장 실패")
+
+    assert (job.status, job.error) == ("failed", "세션 저장 실패")
+    assert job.record()["status"] == "failed"
+    assert jobs.stats()["inflight"] == 0
+    jobs.discard(job)  # 두 번째 폐기는 무시 (예약 자리를 두 번 반환하지 않음)
+    assert jobs.stats()["inflight"] == 0
+
+
+def test_run_publishes_partial_result_before_final_summary():
+    async def scenario():
+        jobs = AnalysisJobManager(max_workers=1, max_pending=0)
+        release = threading.Event()
+        updates = []
+
+        async def on_update(job):
+            updates.append(job.record())
+
+        def summarize(partial, state):
+            assert (partial, state) == (PARTIAL, "evidence-state")
+            assert release.wait(5)
+            return FINAL
+
+        job = jobs.create("s1")
+        jobs.start(job, prepare=lambda: (PARTIAL, "evidence-state"), summarize=summarize, on_update=on_update)
+        await _until(lambda: job.status == "summarizing")
+
+        # 요약 전: 상위 요인/evidence만 공개, 세션 기록에는 상위 요인만
+        assert job.analysis == PARTIAL
+        assert updates[-1]["status"] == "summarizing"
+        assert updates[-1]["top_factors"] == PARTIAL["top_factors"]
+        assert "evidence" not in updates[-1]
+
+        release.set()
+        await _until(lambda: job.finished)
+        assert (job.status, job.analysis, job.error) == ("done", FINAL, None)
+        await _until(lambda: len(updates) == 2)
+        assert [u["status"] for u in updates] == ["summarizing", "done"]
+        assert jobs.stats()["inflight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_failed_prepare_records_error():
+    async def scenario():
+        jobs = AnalysisJobManager(max_workers=1, max_pending=0)
+        updates = []
+
+        async def on_update(job):
+            updates.append(job.record())
+
+        def prepare():
+            raise ValueError("evidence 없음")
+
+        job = jobs.create("s1")
+        jobs.start(job, prepare=prepare, summarize=lambda p, s: FINAL, on_update=on_update)
+        await _until(lambda: len(updates) == 1)
+        assert (job.status, job.error, job.analysis) == ("failed", "evidence 없음", None)
+        assert updates[0]["status"] == "failed"
+
+    asyncio.run(scenario())
+
+
+def test_cancel_records_terminal_state():
+    async def scenario():
+        jobs = AnalysisJobManager(max_workers=1, max_pending=1)
+        release = threading.Event()
+        updates = []
+
+        async def on_update(job):
+            updates.append((job.job_id, job.status, job.error))
+
+        running = jobs.create("s1")
+        jobs.start(running, prepare=lambda: release.wait(5) and (PARTIAL, None), summarize=lambda p, s: FINAL, on_update=on_update)
+        waiting = jobs.create("s2")  # 실행 슬롯을 기다리는 작업
+        jobs.start(waiting, prepare=lambda: (PARTIAL, None), summarize=lambda p, s: FINAL, on_update=on_update)
+        await _until(lambda: running.status == "retrieving")
+
+        await jobs.cancel_all(timeout=5)
+        release.set()
+
+        for job in (running, waiting):
+            assert (job.status, job.error) == ("failed", "cancelled")
+            assert (job.job_id, "failed", "cancelled") in updates
+        assert jobs.stats()["inflight"] == 0
+
+    asyncio.run(scenario())
+
+
+# ----------------------------- long-poll -----------------------------
+
+@pytest.fixture
+def review_router(monkeypatch):
+    from backend.app.api.routers import review
+
+    jobs = AnalysisJobManager(max_workers=1, max_pending=1)
+    monkeypatch.setattr(review, "get_analysis_job_manager", lambda: jobs)
+    return review, jobs
+
+
+def test_get_analysis_returns_on_status_change(review_router):
+    review, jobs = review_router
+
+    async def scenario():
+        job = jobs.create("s1")
+        started = time.monotonic()
+        poll = asyncio.create_task(review.get_analysis("s1", wait=5))
+        await asyncio.sleep(0.05)
+        assert not poll.done()
+
+        job._set("retrieving")
+        result = await asyncio.wait_for(poll, 1)
+        assert result["status"] == "retrieving"
+        assert time.monotonic() - started < 1
+
+    asyncio.run(scenario())
+
+
+def test_get_analysis_returns_current_state_on_timeout(review_router):
+    review, jobs = review_router
+
+    async def scenario():
+        jobs.create("s1")
+        started = time.monotonic()
+        result = await review.get_analysis("s1", wait=0.2)
+        assert result["status"] == "queued"
+        assert time.monotonic() - started >= 0.2
+
+        # 클라이언트가 본 상태와 다르거나 이미 끝난 작업이면 기다리지 않음
+        started = time.monotonic()
+        assert (await review.get_analysis("s1", wait=5, since="retrieving"))["status"] == "queued"
+        jobs.discard(jobs.get("s1"))
+        assert (await review.get_analysis("s1", wait=5))["status"] == "failed"
+        assert time.monotonic() - started < 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,64 @@
+"""BM25 term 색인 / posting 동점 정렬 테스트"""
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.adapters.persistence.reg.store import Factor
+from backend.app.domain.rules.review.bm25 import BM25_B, BM25_K1, build_term_index
+from backend.app.domain.rules.review.postings import build_evidence_postings
+from backend.app.domain.rules.review.score_matrix import ScoreMatrix
+
+CORPUS = pd.Series([
+    "소음 소음 시끄러워요",                             # 0: tf 2, 짧음
+    "소음 있어요 근데 저녁에는 괜찮아요 그래도 조금 아쉬움", # 1: tf 1, 김
+    "크기가 커요",                                      # 2: term 없음
+    "소음 커요 밤에",                                   # 3: tf 1, 짧음 + context
+    "",                                                 # 4: 빈 텍스트
+])
+
+
+def _reference_bm25(texts, terms, row):
+    """교과서 BM25 (부분 문자열 출현 수, 공백 토큰 길이)"""
+    lens = [len(t.split()) if t else 0 for t in texts]
+    avgdl = sum(lens) / len(texts)
+    total = 0.0
+    for term in dict.fromkeys(terms):
+        n = sum(term in t for t in texts)
+        tf = texts[row].count(term)
+        if tf == 0:
+            continue
+        idf = math.log(1.0 + (len(texts) - n + 0.5) / (n + 0.5))
+        total += idf * tf * (BM25_K1 + 1.0) / (tf + BM25_K1 * (1.0 - BM25_B + BM25_B * lens[row] / avgdl))
+    return total
+
+
+def test_term_index_scores_fixed_corpus():
+    index = build_term_index(CORPUS, ["소음", "밤에", "없는말"])
+    rows = np.arange(len(CORPUS))
+
+    scores = index.score(["소음", "소음"], rows)  # 중복 term은 한 번만
+    assert np.argsort(-scores, kind="stable").tolist() == [0, 3, 1, 2, 4]
+    assert scores.tolist() == pytest.approx([_reference_bm25(CORPUS.tolist(), ["소음"], r) for r in rows])
+
+    scores = index.score(["소음", "밤에", "없는말"], rows)
+    assert np.argsort(-scores, kind="stable").tolist() == [3, 0, 1, 2, 4]
+    assert scores.tolist() == pytest.approx([_reference_bm25(CORPUS.tolist(), ["소음", "밤에"], r) for r in rows])
+
+    # 일부 행만 질의해도 같은 점수 (행 순서대로)
+    assert index.score(["소음", "밤에"], np.array([3, 1])).tolist() == pytest.approx(scores[[3, 1]].tolist())
+
+
+def test_postings_break_score_ties_by_bm25():
+    factor = Factor(1, "noise", ["소음"], ["밤에"], [], 1.0)
+    df = pd.DataFrame({"review_id": [f"r{i}" for i in range(len(CORPUS))], "text": CORPUS, "_norm_text": CORPUS})
+    # 행 0/1/3은 동점, 행 2는 BM25가 0이어도 점수가 높아 맨 앞
+    dense = np.array([[1.0], [1.0], [1.3], [1.0], [0.0]])
+    matrix = ScoreMatrix.from_dense(dense, np.zeros_like(dense, dtype=bool), ["noise"], [1])
+
+    fp = build_evidence_postings(df, matrix, [factor]).get("noise")
+
+    assert fp.ranked_rows.tolist() == [2, 3, 0, 1]
+    assert fp.rows.tolist() == [3, 0, 1]  # evidence 후보: anchor term이 있는 리뷰만, 같은 순서
+    assert np.all(np.diff(fp.bm25) <= 0)
@@ -0,0 +1,62 @@
+"""DialogueSession.from_analysis 테스트 - 공유 분석으로 복원한 세션이 재스코어링 경로와 같은 결과를 내는지"""
+import pandas as pd
+import pytest
+
+from backend.app.adapters.persistence.reg.catalog import get_reg_catalog
+from backend.app.api.routers.review import _load_review_data
+from backend.app.core.settings import settings
+from backend.app.services.product_analysis import build_product_analysis
+from backend.app.services.review_service import ReviewService
+from backend.app.usecases.dialogue import session as session_module
+from backend.app.usecases.dialogue.session import DialogueSession
+
+
+@pytest.fixture
+def no_score_cache(monkeypatch):
+    """디스크 점수 캐시를 쓰지 않음 (테스트가 캐시 디렉토리에 파일을 남기지 않도록)"""
+    monkeypatch.setattr(settings, "SCORE_CACHE_ENABLED", False)
+
+
+def _analysis(data_dir, product_name):
+    catalog = get_reg_catalog(data_dir)
+    category, category_name = catalog.product(product_name)
+    service = ReviewService(data_dir)
+    raw_df = _load_review_data(category, service)
+    return build_product_analysis(
+        service, "test", product_name, category, category_name, raw_df, catalog.factors_for(category)
+    )
+
+
+@pytest.mark.parametrize("product_name", ["네스프레소 버츄오플러스", "루메나 가습기", "시디즈 아이블 의자"])
+def test_from_analysis_matches_rescoring_session(data_dir, no_score_cache, monkeypatch, product_name):
+    analysis = _analysis(data_dir, product_name)
+    top_factors = list(analysis.top_factors[:3])
+
+    # 기존 경로: 정규화 리뷰로 새 세션을 만들고 다시 스코어링
+    legacy = DialogueSession(analysis.category, data_dir, reviews_df=analysis.normalized_df, product_name=product_name)
+    legacy._compute_review_scores()
+    expected = legacy._retrieve_evidence(top_factors)
+
+    def no_rescoring(*args, **kwargs):
+        raise AssertionError("from_analysis 세션은 다시 스코어링하지 않아야 함")
+
+    monkeypatch.setattr(session_module, "cached_score_matrix", no_rescoring)
+    restored = DialogueSession.from_analysis(
+        category=analysis.category,
+        data_dir=data_dir,
+        scored_df=analysis.scored_df,
+        factors=list(analysis.factors),
+        score_matrix=analysis.score_matrix,
+        reviews_df=analysis.normalized_df,
+        product_name=analysis.product_name,
+        sentence_index=analysis.sentence_index,
+        evidence_postings=analysis.evidence_postings,
+    )
+    restored._compute_review_scores()
+
+    assert restored.factors == legacy.factors
+    assert restored.factor_counts == legacy.factor_counts
+    pd.testing.assert_frame_equal(restored.scored_df, legacy.scored_df)
+    assert restored.score_matrix is analysis.score_matrix
+    evidence = restored._retrieve_evidence(top_factors)
+    assert evidence and evidence == expected
@@ -0,0 +1,72 @@
+"""MMR evidence 선택 테스트"""
+import random
+
+import numpy as np
+import pytest
+
+from backend.app.domain.rules.review.diversity import RedundancyTracker, mmr_select, text_signatures
+from backend.app.domain.rules.review.postings import LABELS, FactorPostings
+from backend.app.domain.rules.review.retrieval import _pick_by_quota
+
+_DUP = "추출할 때 소음이 너무 커서 아침마다 가족이 깨요 정말 시끄러워요"
+
+
+def _random_pool(rng: random.Random, n: int):
+    labels = [rng.choice(LABELS) for _ in range(n)]
+    review_ids = [rng.choice(["", f"r{rng.randrange(n)}", f"r{i}"]) for i in range(n)]
+    texts = [f"{rng.choice(['소음', '크기', '가격'])} 문제 {rng.randrange(5)}" for _ in range(n)]
+    return labels, review_ids, text_signatures(texts)
+
+
+def _postings(labels, review_ids) -> FactorPostings:
+    n = len(labels)
+    labels = np.asarray(labels, dtype=object)
+    return FactorPostings(
+        factor_key="noise",
+        ranked_rows=np.arange(n, dtype=np.int64),
+        rows=np.arange(n, dtype=np.int64),
+        scores=np.linspace(2.0, 1.0, n),
+        bm25=np.zeros(n),
+        review_ids=np.asarray(review_ids, dtype=object),
+        labels=labels,
+        has_context=np.zeros(n, dtype=bool),
+        has_negation=np.zeros(n, dtype=bool),
+        by_label={lab: np.flatnonzero(labels == lab) for lab in LABELS},
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_lambda_one_matches_rank_order_quota_pick(seed):
+    rng = random.Random(seed)
+    n = rng.randrange(1, 30)
+    labels, review_ids, sigs = _random_pool(rng, n)
+    quota = {"NEG": rng.randrange(4), "MIX": rng.randrange(3), "POS": rng.randrange(2)}
+    max_pick = rng.randrange(0, 8)
+    seen = {f"r{rng.randrange(n)}"}
+
+    # 이전 factor에서 뽑은 서명이 있어도 λ = 1이면 순위만 본다
+    tracker = RedundancyTracker()
+    tracker.signatures.append(sigs[0])
+    mmr_seen = set(seen)
+    picked = mmr_select(labels, review_ids, sigs, quota, mmr_seen, max_pick, tracker, lam=1.0)
+
+    candidates = [{"review_id": r, "label": lab, "i": i} for i, (r, lab) in enumerate(zip(review_ids, labels))]
+    quota_seen = set(seen)
+    assert picked == [c["i"] for c in _pick_by_quota(candidates, quota, quota_seen, max_pick)]
+    postings_seen = set(seen)
+    assert picked == _postings(labels, review_ids).pick(quota, postings_seen, max_pick)
+    assert mmr_seen == quota_seen == postings_seen
+
+
+def test_lambda_below_one_skips_near_duplicate_excerpt():
+    texts = [_DUP, _DUP + "!", "물통이 작아서 하루에도 몇 번씩 채워야 해서 번거로워요"]
+    sigs = text_signatures(texts)
+    labels, review_ids, quota = ["NEG"] * 3, ["r0", "r1", "r2"], {"NEG": 2}
+
+    assert mmr_select(labels, review_ids, sigs, quota, set(), 2, RedundancyTracker(), lam=1.0) == [0, 1]
+    assert mmr_select(labels, review_ids, sigs, quota, set(), 2, RedundancyTracker(), lam=0.5) == [0, 2]
+
+    # 앞 factor에서 이미 뽑은 발췌와 거의 같은 후보도 뒤로 밀림
+    tracker = RedundancyTracker()
+    tracker.signatures.append(text_signatures([_DUP + "?"])[0])
+    assert mmr_select(labels, review_ids, sigs, quota, set(), 1, tracker, lam=0.5) == [2]
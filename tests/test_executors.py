@@ -0,0 +1,127 @@
+"""관리형 실행기 테스트 (대기열/실행 중 메트릭, 예외 전달, 종료된 풀 거부, 시작 전 취소)"""
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from backend.app.infra.concurrency.executors import ManagedExecutor, get_executor
+from backend.app.infra.observability.metrics import REGISTRY
+
+request_id = contextvars.ContextVar("request_id", default="")
+
+
+def _metric(name: str, pool: str) -> float:
+    return REGISTRY.get_sample_value(name, {"pool": pool}) or 0.0
+
+
+def _gauges(pool: str):
+    return _metric("executor_queue_depth", pool), _metric("executor_active_tasks", pool)
+
+
+async def _until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_queue_and_active_metrics_follow_tasks():
+    executor = ManagedExecutor("test-metrics", max_workers=1)
+    release = threading.Event()
+
+    async def scenario():
+        waits_before = _metric("executor_wait_seconds_count", executor.name)
+        runs_before = _metric("executor_task_duration_seconds_count", executor.name)
+
+        first = asyncio.ensure_future(executor.run(release.wait, 5))
+        rest = [asyncio.ensure_future(executor.run(lambda i=i: i * 10)) for i in range(2)]
+        await _until(lambda: executor.stats()["active"] == 1)
+
+        assert executor.stats() == {"max_workers": 1, "queued": 2, "active": 1}
+        assert _gauges(executor.name) == (2.0, 1.0)
+
+        release.set()
+        assert await asyncio.gather(first, *rest) == [True, 0, 10]
+        assert executor.stats() == {"max_workers": 1, "queued": 0, "active": 0}
+        assert _gauges(executor.name) == (0.0, 0.0)
+        assert _metric("executor_wait_seconds_count", executor.name) - waits_before == 3
+        assert _metric("executor_task_duration_seconds_count", executor.name) - runs_before == 3
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+
+def test_exceptions_and_context_pass_through():
+    executor = ManagedExecutor("test-context", max_workers=2)
+
+    def fail():
+        raise ValueError("boom")
+
+    async def scenario():
+        request_id.set("req-1")
+        assert await executor.run(request_id.get) == "req-1"
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run(fail)
+        assert _gauges(executor.name) == (0.0, 0.0)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+
+def test_shutdown_rejects_new_tasks_and_cancels_waiting_ones():
+    executor = ManagedExecutor("test-shutdown", max_workers=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait, 5))
+        waiting = asyncio.ensure_future(executor.run(lambda: "never"))
+        await _until(lambda: executor.stats()["active"] == 1)
+
+        executor.shutdown()  # 대기 중 작업은 취소 (cancel_futures)
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        with pytest.raises(RuntimeError):
+            await executor.run(lambda: "rejected")
+        assert executor.stats()["queued"] == 0
+        assert _gauges(executor.name) == (0.0, 1.0)
+
+        release.set()
+        assert await running is True
+        assert _gauges(executor.name) == (0.0, 0.0)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_releases_queue_slot():
+    executor = ManagedExecutor("test-cancel", max_workers=1)
+    release = threading.Event()
+    ran = []
+
+    async def scenario():
+        running = asyncio.ensure_future(executor.run(release.wait, 5))
+        waiting = asyncio.ensure_future(executor.run(ran.append, "waiting"))
+        await _until(lambda: executor.stats()["active"] == 1)
+
+        waiting.cancel()  # 클라이언트 연결 종료 등으로 핸들러가 취소된 경우
+        await _until(lambda: executor.stats()["queued"] == 0)
+        assert _gauges(executor.name) == (0.0, 1.0)
+
+        release.set()
+        await running
+        assert ran == []
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+
+def test_unknown_executor_name_is_rejected():
+    with pytest.raises(ValueError):
+        get_executor("gpu")
@@ -0,0 +1,32 @@
+"""Evidence 라벨 동등성 테스트 - CueLabeler(배치) vs classify_text_label(factor별 검사)"""
+import random
+
+import pandas as pd
+import pytest
+
+from backend.app.domain.rules.review.labeler import NEG_CUES, POS_CUES, SWITCH_CUES, CueLabeler
+from backend.app.domain.rules.review.normalize import normalize_series
+from backend.app.domain.rules.review.retrieval import classify_text_label
+
+
+def _texts(bundled_reviews, factors):
+    """번들 리뷰 + cue/term 조각을 섞은 합성 문장 (창 경계/전환어/부정 표현 조합)"""
+    rnd = random.Random(0)
+    frags = POS_CUES + NEG_CUES + SWITCH_CUES + [
+        t for f in factors for t in f.anchor_terms + f.context_terms + f.negation_terms
+    ] + [" ", ".", "아주 ", "그냥 ", "x" * 25]
+    synthetic = ["".join(rnd.choice(frags) for _ in range(rnd.randint(1, 20))) for _ in range(300)]
+    return bundled_reviews["text"].dropna().tolist() + synthetic + [""]
+
+
+@pytest.mark.parametrize("window", [30, 5])
+def test_cue_labeler_matches_classify_text_label(bundled_reviews, reg_factors, window):
+    for category in sorted({f.category for f in reg_factors}):
+        factors = [f for f in reg_factors if f.category == category]
+        texts = _texts(bundled_reviews, factors)
+        norms = normalize_series(pd.Series(texts)).tolist()
+        labeler = CueLabeler(factors, window=window)
+        for text, norm in zip(texts, norms):
+            for factor in factors:
+                expected = classify_text_label(text, factor, window=window, norm_text=norm)
+                assert labeler.label(text, factor.factor_key, norm_text=norm) == expected, (category, factor.factor_key, norm)
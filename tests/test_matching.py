@@ -0,0 +1,34 @@
+"""질문 → factor 매칭 테스트 (정확 매칭 실패 시 문자 n-gram 유사도 매처 주입)"""
+import pytest
+
+from backend.app.adapters.persistence.reg.catalog import get_reg_catalog
+from backend.app.domain.rules.review.scoring import select_top_factors_from_question
+from backend.app.usecases.dialogue.session import select_top_factors
+
+
+@pytest.fixture(scope="module")
+def coffee_factors(data_dir):
+    return get_reg_catalog(data_dir).factors_for("coffee_machine")
+
+
+@pytest.mark.parametrize("question, factor_key", [
+    ("시끄러웟어요", "noise_loud"),
+    ("너무 시끄러웟", "noise_loud"),
+    ("오작똥이 잦아요", "machine_defect"),
+    ("캡술 값이 부담", "capsule_cost"),
+    ("미지끈해요", "temp_lukewarm"),
+    ("청쇼가 힘들어요", "cleaning_hassle"),
+])
+def test_typo_or_inflection_maps_to_factor(coffee_factors, question, factor_key):
+    assert select_top_factors(question, coffee_factors)[0][0] == factor_key
+
+
+def test_domain_selection_without_matcher_falls_back_to_weight(coffee_factors):
+    by_weight = sorted(coffee_factors, key=lambda f: f.weight, reverse=True)[:3]
+    assert select_top_factors_from_question("시끄러웟어요", coffee_factors) == [(f.factor_key, f.weight) for f in by_weight]
+    # 정확 매칭이 있으면 매처를 부르지 않음
+    def fail(*args):
+        raise AssertionError("정확 매칭이 있는데 유사도 매처를 호출함")
+
+    assert select_top_factors_from_question("소음이 커요", coffee_factors, similar_fn=fail)[0][0] == "noise_loud"
+    assert select_top_factors("소음이 커요", coffee_factors) == select_top_factors_from_question("소음이 커요", coffee_factors)
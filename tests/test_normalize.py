@@ -0,0 +1,98 @@
+"""리뷰 정규화 / 중복 제거 테스트"""
+import re
+
+import pandas as pd
+import pytest
+
+from backend.app.domain.rules.review.normalize import (
+    dedupe_reviews,
+    normalize_review,
+    normalize_review_frame,
+    normalize_series,
+    normalize_text,
+)
+
+_TEMPLATE = "배송이 빠르고 포장도 꼼꼼해서 아주 만족스러운 구매였습니다 재구매 의사 있어요"
+
+
+def test_near_dedupe_returns_cluster_members_without_frame_attrs():
+    df = pd.DataFrame({
+        "review_id": ["a", "b", "c", "d"],
+        "text": [_TEMPLATE, _TEMPLATE + "!", _TEMPLATE.replace("아주", "정말"), "소음이 커서 밤에는 못 쓰겠어요 아쉽습니다"],
+    })
+    out, total, removed = dedupe_reviews(df, mode="near", near_threshold=0.5)
+
+    assert (total, removed) == (4, 2)
+    assert out["review_id"].tolist() == ["a", "d"]
+    assert out["_dup_ids"].tolist() == [["b", "c"], []]
+    assert out["_dup_count"].tolist() == [3, 1]
+    assert out.attrs == {}
+
+
+def _legacy_normalize_text(text):
+    """배치 정규화 도입 전 normalize_text (비교 기준)"""
+    if text is None:
+        return ""
+    s = str(text).lower()
+    s = s.replace("℃", "도").replace("ℓ", "l").replace("㎖", "ml").replace("㏈", "db").replace("dＢ", "db").replace("dB", "db")
+    s = re.sub(r"[^\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F\w\d\s\.,!\?\-\(\)\[\]:;'\"%&@/\\]+", " ", s)
+    s = re.sub(r"(ㅋ|ㅎ|!|\?){3,}", lambda m: m.group(1) * 2, s)
+    return re.sub(r"\s+", " ", s).strip()
+
+
+def test_normalize_series_matches_legacy_normalize_text(bundled_reviews):
+    texts = bundled_reviews["text"].tolist() + [
+        "소음 40dB 40dＢ 40㏈, 25℃, 1.5ℓ 500㎖",
+        "ㅋㅋㅋㅋㅋ ㅎㅎㅎ!!!!???? 좋아요 😀👍 ★★★",
+        "  탭\t줄바꿈\n  ＡＢＣ　전각 공백 ",
+        "좋아요", "좋아요", 123, 4.5, float("nan"),
+    ]
+    series = pd.Series(texts, index=pd.RangeIndex(100, 100 + len(texts)))
+    expected = series.fillna("").map(_legacy_normalize_text)
+
+    assert [normalize_text(t) for t in series.fillna("")] == expected.tolist()
+    result = normalize_series(series)
+    assert result.index.equals(series.index)
+    assert result.tolist() == expected.tolist()
+
+
+def _legacy_normalize_review(review, vendor):
+    """VENDOR_COLUMN_MAPPINGS 도입 전 normalize_review (비교 기준)"""
+    normalized = {"review_id": "", "text": "", "rating": 0, "date": "", "author": "", "verified": False}
+    if vendor == "smartstore":
+        normalized["review_id"] = review.get("review_id", review.get("id", ""))
+        normalized["text"] = review.get("text", review.get("review_text", ""))
+        normalized["rating"] = review.get("rating", 0)
+        normalized["date"] = review.get("created_at", review.get("created_date", ""))
+        normalized["author"] = review.get("author", review.get("reviewer_name", ""))
+    return normalized
+
+
+def _missing_as_none(df):
+    return df.astype(object).where(df.notna(), None)
+
+
+def _legacy_csv_frame():
+    """레거시 CSV 형식 (review_text, created_date, reviewer_name, id)"""
+    return pd.DataFrame({
+        "id": ["c1", "c2"],
+        "review_text": ["소음이 커요", None],
+        "rating": [2, 5],
+        "created_date": ["2026-01-01", "2026-01-02"],
+        "reviewer_name": ["kim", "lee"],
+        "extra": [1, 2],
+    })
+
+
+@pytest.mark.parametrize("vendor", ["smartstore", "coupang", "unknown"])
+@pytest.mark.parametrize("source", ["json", "legacy_csv"])
+def test_vendor_column_mapping_matches_legacy_normalize_review(bundled_reviews, vendor, source):
+    raw = bundled_reviews if source == "json" else _legacy_csv_frame()
+    expected = pd.DataFrame([_legacy_normalize_review(row, vendor) for _, row in raw.iterrows()])
+    result = normalize_review_frame(raw, vendor)
+
+    # iterrows는 혼합 타입 행에서 None을 NaN으로 바꾸므로 결측값 표현만 맞춰 비교
+    assert result.dtypes.to_dict() == expected.dtypes.to_dict()
+    pd.testing.assert_frame_equal(_missing_as_none(result), _missing_as_none(expected))
+    for record in raw.to_dict("records"):
+        assert normalize_review(record, vendor) == _legacy_normalize_review(record, vendor)
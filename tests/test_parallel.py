@@ -0,0 +1,59 @@
+"""멀티프로세스 청크 스코어링 테스트"""
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from backend.app.domain.rules.review import parallel, scoring
+from backend.app.domain.rules.review.parallel import ParallelScoring, score_in_chunks
+from backend.app.domain.rules.review.scoring import compute_score_matrix, rating_multiplier, score_normalized_texts
+
+CONFIG = ParallelScoring(n_workers=2, chunk_size=40, min_reviews=1)
+
+
+def _crash_worker(norm_texts, rating_mult, factors):
+    os._exit(1)
+
+
+def _assert_same(a, b):
+    for k in ("indptr", "indices", "data", "neg_bits"):
+        assert np.array_equal(getattr(a, k), getattr(b, k)), k
+    assert (a.n_reviews, a.factor_keys, a.factor_ids) == (b.n_reviews, b.factor_keys, b.factor_ids)
+
+
+@pytest.fixture
+def scored(bundled_reviews, reg_factors):
+    df, serial = compute_score_matrix(bundled_reviews, reg_factors)
+    yield df, serial
+    parallel.shutdown_pool()
+
+
+def test_score_in_chunks_matches_serial(scored, reg_factors):
+    df, serial = scored
+    assert len(df) > CONFIG.chunk_size * 2
+
+    chunked = score_in_chunks(score_normalized_texts, df["_norm_text"], rating_multiplier(df), reg_factors, CONFIG)
+    _assert_same(chunked, serial)
+    _assert_same(compute_score_matrix(df, reg_factors, parallel=CONFIG)[1], serial)
+
+
+def test_broken_pool_is_discarded(scored, reg_factors):
+    df, _ = scored
+    with pytest.raises(BrokenProcessPool):
+        score_in_chunks(_crash_worker, df["_norm_text"], rating_multiplier(df), reg_factors, CONFIG)
+    assert parallel._pool is None
+
+
+def test_other_errors_fall_back_without_killing_pool(scored, reg_factors, monkeypatch):
+    df, serial = scored
+    compute_score_matrix(df, reg_factors, parallel=CONFIG)
+    pool = parallel._pool
+    assert pool is not None
+
+    def fail(*args, **kwargs):
+        raise ValueError("pickle 실패")
+
+    monkeypatch.setattr(scoring, "score_in_chunks", fail)
+    _assert_same(compute_score_matrix(df, reg_factors, parallel=CONFIG)[1], serial)
+    assert parallel._pool is pool
@@ -0,0 +1,35 @@
+"""factor별 evidence 순위 목록 테스트"""
+import pandas as pd
+
+from backend.app.adapters.persistence.reg.store import Factor
+from backend.app.domain.rules.review.postings import build_evidence_postings
+from backend.app.domain.rules.review.scoring import compute_score_matrix
+
+FACTORS = [
+    Factor(1, "noise", ["소음", "시끄"], ["밤"], ["안 시끄"], 1.5),
+    Factor(2, "size", ["크기", "부피"], ["자리"], [], 1.0),
+]
+
+
+def _scored(n: int = 6):
+    texts = ["소음이 너무 시끄러워요", "크기가 커서 자리 차지", "밤에 소음이 커요", "부피가 작아 만족"]
+    df = pd.DataFrame({
+        "review_id": [f"r{i}" for i in range(n)],
+        "text": [texts[i % len(texts)] for i in range(n)],
+        "rating": [(i % 5) + 1 for i in range(n)],
+    })
+    return compute_score_matrix(df, FACTORS)
+
+
+def test_postings_match_only_the_same_review_order():
+    df, matrix = _scored()
+    postings = build_evidence_postings(df, matrix, FACTORS)
+
+    assert postings.matches(df)
+    assert postings.matches(df.copy())
+    # 행 수가 같아도 순서가 다르거나 다른 리뷰면 행 위치가 다른 리뷰를 가리킴
+    assert not postings.matches(df.iloc[::-1].reset_index(drop=True))
+    replaced = df.copy()
+    replaced.loc[0, "review_id"] = "other"
+    assert not postings.matches(replaced)
+    assert not postings.matches(df.iloc[:-1])
@@ -0,0 +1,26 @@
+"""상품 분석 스냅샷 키 테스트"""
+import json
+import os
+
+from backend.app.adapters.persistence.reg.store import Factor
+from backend.app.infra.loaders.json_review_loader import JSONReviewLoader
+from backend.app.services.product_analysis import product_snapshot_key
+
+FACTORS = [Factor(1, "noise", ["소음"], [], [], 1.0)]
+
+
+def test_snapshot_key_follows_review_file_signature(tmp_path):
+    loader = JSONReviewLoader(tmp_path)
+    path = loader.review_dir / "reviews_shop_coffee_machine_nespresso_20260101_000000.json"
+    path.write_text(json.dumps([{"review_id": "1", "text": "소음이 커요", "rating": 2}]), encoding="utf-8")
+
+    source = loader.source_signature("coffee_machine")
+    assert source == ((str(path), path.stat().st_mtime_ns, path.stat().st_size),)
+    assert loader.source_signature("desk") is None
+
+    key = product_snapshot_key("네스프레소", FACTORS, "smartstore", source=source)
+    assert key == product_snapshot_key("네스프레소", FACTORS, "smartstore", source=loader.source_signature("coffee_machine"))
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert product_snapshot_key("네스프레소", FACTORS, "smartstore", source=loader.source_signature("coffee_machine")) != key
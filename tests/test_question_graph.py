@@ -0,0 +1,132 @@
+"""질문 그래프 테스트 - 컴파일된 그래프 + asked 비트셋 선택이 기존 선형 탐색/pandas 필터와 같은 질문을 고르는지"""
+import random
+
+import pandas as pd
+import pytest
+
+from backend.app.adapters.persistence.reg.catalog import get_reg_catalog
+from backend.app.adapters.persistence.reg.question_graph import question_choices
+from backend.app.api.routers import review
+from backend.app.usecases.dialogue.session import DialogueSession
+
+
+@pytest.fixture(scope="module")
+def catalog(data_dir):
+    return get_reg_catalog(data_dir)
+
+
+def _categories(catalog):
+    return sorted(c for c in catalog.factors_by_category if catalog.questions_for(c))
+
+
+# ----------------------------- 기존 구현 (비교 기준) -----------------------------
+
+def _legacy_collect_question_candidates(questions, factors_map, focus_factors, asked_texts):
+    """DialogueSession._collect_question_candidates + _select_best_question (질문 그래프 도입 전)"""
+    candidates = []
+    for factor_key in focus_factors:
+        factor_obj = factors_map.get(factor_key)
+        if not factor_obj:
+            continue
+        for question in questions:
+            if question.factor_id != factor_obj.factor_id or question.question_text in asked_texts:
+                continue
+            choices = None
+            if question.choices and question.answer_type in ["single_choice", "multiple_choice"]:
+                choices = [c.strip() for c in question.choices.split("|") if c.strip()]
+            candidates.append((question.question_id, question.question_text, str(question.question_id), question.answer_type, choices))
+    if not candidates:
+        return None
+    candidates.sort(key=lambda x: x[0])
+    return candidates[0][1:]
+
+
+def _legacy_find_first_unasked_question(questions, factor_obj, asked_texts):
+    """DialogueSession._find_first_unasked_question (질문 그래프 도입 전)"""
+    for question in questions:
+        if question.factor_id == factor_obj.factor_id and question.question_text not in asked_texts:
+            return question.question_text, str(question.question_id), question.answer_type or "no_choice", question_choices(question)
+    return None
+
+
+def _legacy_filter_unasked(questions_df, asked_ids, asked_texts):
+    """라우터의 pandas mask 필터 (질문 그래프 도입 전)"""
+    return questions_df[(~questions_df["question_id"].isin(asked_ids)) & (~questions_df["question_text"].isin(asked_texts))]
+
+
+def _first(df):
+    return None if df.empty else (df.iloc[0]["question_id"], df.iloc[0]["question_text"])
+
+
+# ----------------------------- 세션 -----------------------------
+
+@pytest.mark.parametrize("seed", range(3))
+def test_session_picks_match_legacy_linear_scan(catalog, data_dir, seed):
+    rng = random.Random(seed)
+    for category in _categories(catalog):
+        session = DialogueSession(category, data_dir, reviews_df=pd.DataFrame())
+        keys = list(session.factors_map) + ["unknown_factor"]
+        asked_texts = set()
+
+        for turn in range(len(session.questions) + 3):
+            rng.shuffle(keys)
+            session.turn_count = rng.choice([1, 10])  # focus 2개 / 1개
+            focus = session._determine_focus_factors([(k, 1.0) for k in keys])
+
+            expected = _legacy_collect_question_candidates(session.questions, session.factors_map, focus, asked_texts)
+            picked = session._pick_next_question([(k, 1.0) for k in keys])
+            if expected is None:
+                assert picked[1] is None  # 카테고리 기본 질문
+            else:
+                assert picked == expected
+            asked_texts.add(picked[0])
+            assert session.asked_questions == asked_texts
+
+            if rng.random() < 0.3:
+                factor_obj = session.factors_map[rng.choice(sorted(session.factors_map))]
+                expected = _legacy_find_first_unasked_question(session.questions, factor_obj, asked_texts)
+                picked = session._find_first_unasked_question(factor_obj)
+                if expected is None:
+                    assert picked[1] is None
+                else:
+                    assert picked == expected
+                asked_texts.add(picked[0])
+
+
+# ----------------------------- 라우터 -----------------------------
+
+@pytest.mark.parametrize("seed", range(3))
+def test_router_lookups_match_legacy_pandas_filters(catalog, seed):
+    rng = random.Random(seed)
+    for category in _categories(catalog):
+        graph = catalog.question_graph(category)
+        factor_ids = {str(f.factor_id) for f in catalog.factors_for(category)}
+        questions_df = catalog.questions_df[catalog.questions_df["factor_id"].isin(factor_ids)]
+        questions = list(graph.questions)
+        session_data = {"question_history": []}
+
+        for _ in range(len(questions) + 2):
+            history = session_data["question_history"]
+            asked_ids = {q["question_id"] for q in history if q.get("question_id")}
+            asked_texts = {q["question_text"] for q in history if q.get("question_text")}
+            asked = review._asked_questions_mask(session_data, graph)
+
+            q = rng.choice(questions)
+            current = review._get_current_factor_next_question(graph, q.factor_key, q.factor_id, asked)
+            expected = _first(_legacy_filter_unasked(
+                questions_df[questions_df["factor_id"] == str(q.factor_id)], asked_ids, asked_texts
+            ))
+            assert (current and (current["question_id"], current["question_text"])) == (expected or None)
+
+            prev = rng.choice(questions)
+            hint = prev.next_factor_hint or rng.choice(questions).factor_key
+            nxt = review._get_next_factor_question(graph, {"question_id": str(prev.question_id)}, hint, asked)
+            expected = _first(_legacy_filter_unasked(questions_df[questions_df["factor_key"] == hint], asked_ids, asked_texts))
+            assert (nxt and (nxt["question_id"], nxt["question_text"])) == (expected or None)
+
+            # 답변 기록: 그래프 질문(ID + 텍스트) 또는 기본 질문(텍스트만)
+            asked_q = current or nxt
+            if asked_q and rng.random() < 0.8:
+                history.append({"question_id": asked_q["question_id"], "question_text": asked_q["question_text"]})
+            else:
+                history.append({"question_id": None, "question_text": rng.choice(questions).question_text})
@@ -0,0 +1,25 @@
+"""REG 카탈로그 상품 조회 테스트"""
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+
+from backend.app.api.routers import review
+
+
+def test_product_info_matches_factor_csv_without_rereading(data_dir, monkeypatch):
+    df = pd.read_csv(data_dir / "factor" / "reg_factor_v4.csv")
+    expected = {
+        name: (rows.iloc[0]["category"], rows.iloc[0]["category_name"])
+        for name, rows in df.groupby("product_name", sort=False)
+    }
+    monkeypatch.setattr(review, "get_data_dir", lambda: data_dir)
+    review._load_product_info(next(iter(expected)))  # 카탈로그 로드
+
+    def fail(*args, **kwargs):
+        raise AssertionError("CSV를 다시 읽음")
+
+    monkeypatch.setattr(pd, "read_csv", fail)
+    assert {name: review._load_product_info(name) for name in expected} == expected
+    with pytest.raises(HTTPException) as exc:
+        review._load_product_info("없는 상품")
+    assert exc.value.status_code == 404
@@ -0,0 +1,91 @@
+"""evidence 후보 선택 테스트 - 컬럼 연산 후보 풀이 기존 iterrows 경로와 같은 evidence를 고르는지"""
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+
+from backend.app.domain.rules.review.retrieval import (
+    _default_quota_for_rank,
+    _pick_by_quota,
+    _safe_float,
+    _safe_int,
+    classify_text_label,
+    extract_relevant_sentences,
+    retrieve_evidence_reviews,
+)
+from backend.app.domain.rules.review.scoring import attach_score_columns, compute_score_matrix
+
+
+def _legacy_retrieve(df, factors_map, top_factors, per_factor_limit=(5, 8), max_total_evidence=15, quota_by_rank=None):
+    """retrieve_evidence_reviews (컬럼 연산 도입 전: nlargest + iterrows, 후보마다 라벨/발췌문 계산)"""
+    evidence: List[Dict] = []
+    seen_ids: set = set()
+    _, max_n = per_factor_limit
+    quota_by_rank = quota_by_rank or {}
+
+    for rank, (factor_key, _) in enumerate(top_factors):
+        if len(evidence) >= max_total_evidence:
+            break
+        col = f"score_{factor_key}"
+        if col not in df.columns or factor_key not in factors_map:
+            continue
+        f = factors_map[factor_key]
+        quota = quota_by_rank.get(rank) or _default_quota_for_rank(rank)
+        max_pick_here = min(max_n, sum(quota.values()), max_total_evidence - len(evidence))
+
+        subset = df.nlargest(max_pick_here * 10, col)
+        candidates: List[Dict] = []
+        for _, row in subset.iterrows():
+            rid = str(row["review_id"])
+            score = _safe_float(row.get(col), 0.0)
+            if not rid or score <= 0:
+                continue
+            norm = row.get("_norm_text") or ""
+            if not any(t in norm for t in f.anchor_terms):
+                continue
+            reasons = [f"{factor_key}+anchor"]
+            if any(t in norm for t in f.context_terms):
+                reasons.append(f"{factor_key}+context")
+            if any(t in norm for t in f.negation_terms):
+                reasons.append(f"{factor_key}+negation")
+            text = row.get("text") or ""
+            candidates.append({
+                "review_id": rid,
+                "rating": _safe_int(row.get("rating"), 0),
+                "excerpt": extract_relevant_sentences(text, f, max_len=160, norm_text=row.get("_norm_text")),
+                "reason": reasons,
+                "factor": factor_key,
+                "score": score,
+                "label": classify_text_label(text, f, window=30, norm_text=row.get("_norm_text")),
+            })
+        candidates.sort(key=lambda x: float(x.get("score") or 0.0), reverse=True)
+        evidence.extend(_pick_by_quota(candidates, quota, seen_ids, max_pick_here))
+    return evidence
+
+
+def _dense_scores(df: pd.DataFrame) -> pd.DataFrame:
+    """sparse 점수 컬럼을 dense로 (기존 경로의 nlargest 비교 기준)"""
+    cols = [c for c in df.columns if c.startswith("score_")]
+    return df.assign(**{c: df[c].sparse.to_dense() for c in cols})
+
+
+@pytest.mark.parametrize("quota_by_rank, per_factor_limit, max_total", [
+    (None, (5, 8), 15),
+    ({0: {"NEG": 1, "POS": 3}, 1: {"MIX": 2}}, (2, 3), 7),
+    ({0: {"NEU": 4}}, (5, 20), 40),
+])
+def test_vectorized_pool_matches_legacy_iterrows(bundled_reviews, reg_factors, quota_by_rank, per_factor_limit, max_total):
+    compared = 0
+    for category in sorted({f.category for f in reg_factors}):
+        factors = [f for f in reg_factors if f.category == category]
+        norm_df, matrix = compute_score_matrix(bundled_reviews, factors)
+        df = _dense_scores(attach_score_columns(norm_df, matrix, compute_top_per_review=False))
+        factors_map = {f.factor_key: f for f in factors}
+        top = sorted(matrix.factor_counts().items(), key=lambda x: -x[1]) + [("unknown_factor", 0.0)]
+
+        kwargs = dict(per_factor_limit=per_factor_limit, max_total_evidence=max_total, quota_by_rank=quota_by_rank)
+        expected = _legacy_retrieve(df, factors_map, top, **kwargs)
+        assert retrieve_evidence_reviews(df, factors_map, top, **kwargs) == expected
+        assert retrieve_evidence_reviews(norm_df, factors_map, top, score_matrix=matrix, **kwargs) == expected
+        compared += len(expected)
+    assert compared > 0
@@ -0,0 +1,57 @@
+"""점수 캐시 / 증분 스코어링(같은 캐시 재사용) 테스트"""
+import numpy as np
+import pandas as pd
+
+from backend.app.adapters.persistence.reg.store import Factor
+from backend.app.domain.rules.review import incremental
+from backend.app.domain.rules.review.scoring import compute_score_matrix
+from backend.app.infra.cache.score_cache import ScoreCache, cached_score_matrix
+
+FACTORS = [
+    Factor(1, "noise", ["소음", "시끄"], ["밤"], ["안 시끄"], 1.5),
+    Factor(2, "size", ["크기", "부피"], ["자리"], [], 1.0),
+]
+
+
+def _reviews(n: int) -> pd.DataFrame:
+    texts = ["소음이 너무 시끄러워요", "크기가 커서 자리 차지", "안 시끄럽고 좋아요", "부피가 작아 만족"]
+    return pd.DataFrame({
+        "review_id": [f"r{i}" for i in range(n)],
+        "text": [f"{texts[i % len(texts)]} {i}" for i in range(n)],
+        "rating": [(i % 5) + 1 for i in range(n)],
+    })
+
+
+def _assert_same(a, b):
+    for k in ("indptr", "indices", "data", "neg_bits"):
+        assert np.array_equal(getattr(a, k), getattr(b, k)), k
+    assert a.factor_keys == b.factor_keys
+
+
+def test_cache_hit_returns_same_matrix(tmp_path):
+    cache = ScoreCache(tmp_path)
+    df = _reviews(8)
+    _, first = cached_score_matrix(df, FACTORS, cache=cache)
+    _, second = cached_score_matrix(df, FACTORS, cache=cache)
+    _assert_same(first, second)
+    assert len(list(tmp_path.glob("v*_*.npz"))) == 1
+
+
+def test_incremental_reuses_latest_cache_entry(tmp_path, monkeypatch):
+    cache = ScoreCache(tmp_path)
+    cached_score_matrix(_reviews(8), FACTORS, "c", cache=cache, product_id="p1")
+    assert cache.latest_snapshot("c", "p1").matrix.n_reviews == 8
+
+    scored = []
+    original = incremental.score_texts
+    monkeypatch.setattr(
+        incremental, "score_texts", lambda texts, *a, **kw: scored.append(len(texts)) or original(texts, *a, **kw)
+    )
+
+    grown = _reviews(12)
+    _, matrix = cached_score_matrix(grown, FACTORS, "c", cache=cache, product_id="p1")
+    assert scored == [4]  # 새로 들어온 리뷰만 계산
+    _assert_same(matrix, compute_score_matrix(grown, FACTORS)[1])
+    # 증분 결과도 같은 캐시 디렉토리에 한 번만 저장되고 포인터가 갱신된다
+    assert len(list(tmp_path.glob("v*_*.npz"))) == 2
+    assert cache.latest_snapshot("c", "p1").matrix.n_reviews == 12
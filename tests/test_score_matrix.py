@@ -0,0 +1,54 @@
+"""희소 점수 행렬 테스트 (dense 왕복, 행 선택/이어붙이기, 컬럼 없이 evidence 추출)"""
+import numpy as np
+import pytest
+
+from backend.app.domain.rules.review.retrieval import retrieve_evidence_reviews
+from backend.app.domain.rules.review.score_matrix import ScoreMatrix
+from backend.app.domain.rules.review.scoring import attach_score_columns, compute_score_matrix
+
+KEYS, IDS = ["noise", "size", "price"], [1, 2, 3]
+
+
+def _random_dense(seed: int, n: int):
+    rng = np.random.default_rng(seed)
+    dense = np.where(rng.random((n, len(KEYS))) < 0.4, rng.choice([1.0, 1.3, 2.6], (n, len(KEYS))), 0.0)
+    neg = (dense > 0) & (rng.random(dense.shape) < 0.5)
+    return dense, neg
+
+
+def _assert_matrix(matrix, dense, neg):
+    assert matrix.n_reviews == len(dense)
+    assert np.array_equal(matrix.to_dense(), dense)
+    assert np.array_equal(matrix.neg_mask(), neg)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_dense_take_rows_vstack_round_trip(seed):
+    dense, neg = _random_dense(seed, 23)
+    matrix = ScoreMatrix.from_dense(dense, neg, KEYS, IDS)
+    _assert_matrix(matrix, dense, neg)
+
+    rows = np.random.default_rng(seed).permutation(len(dense))[:15]
+    _assert_matrix(matrix.take_rows(rows), dense[rows], neg[rows])
+
+    parts = [matrix.take_rows(np.arange(lo, min(lo + 7, len(dense)))) for lo in range(0, len(dense), 7)]
+    stacked = ScoreMatrix.vstack(parts)
+    _assert_matrix(stacked, dense, neg)
+    for k in ("indptr", "indices", "data", "neg_bits"):
+        assert np.array_equal(getattr(stacked, k), getattr(matrix, k)), k
+
+    empty = ScoreMatrix.from_dense(np.zeros((0, len(KEYS))), np.zeros((0, len(KEYS)), dtype=bool), KEYS, IDS)
+    _assert_matrix(ScoreMatrix.vstack([empty, matrix]), dense, neg)
+
+
+def test_evidence_from_matrix_matches_score_columns(bundled_reviews, reg_factors):
+    factors = [f for f in reg_factors if f.category == "coffee_machine"]
+    df, matrix = compute_score_matrix(bundled_reviews, factors)
+    assert not any(c.startswith("score_") for c in df.columns)
+
+    factors_map = {f.factor_key: f for f in factors}
+    top = sorted(matrix.factor_counts().items(), key=lambda x: -x[1])[:3]
+    for mmr_lambda in (None, 0.7):
+        from_matrix = retrieve_evidence_reviews(df, factors_map, top, score_matrix=matrix, mmr_lambda=mmr_lambda)
+        from_columns = retrieve_evidence_reviews(attach_score_columns(df, matrix), factors_map, top, mmr_lambda=mmr_lambda)
+        assert from_matrix and from_matrix == from_columns
@@ -0,0 +1,69 @@
+"""Factor 스코어링 동등성 테스트 - 배치 구현 vs 기존(리뷰 × factor 순회) 구현"""
+import numpy as np
+
+from backend.app.domain.rules.review.normalize import normalize_text
+from backend.app.domain.rules.review.score_matrix import ScoreMatrix
+from backend.app.domain.rules.review.scoring import (
+    _rating_multiplier_series,
+    attach_score_columns,
+    compute_review_factor_scores,
+    compute_score_matrix,
+    score_text_against_factor,
+)
+
+
+def _reference_scores(df, factors):
+    """기존 구현: 리뷰마다 factor별 anchor/context/negation 부분 문자열 검사"""
+    norm = df["text"].fillna("").map(normalize_text)
+    mult = _rating_multiplier_series(df).to_numpy()
+    scores = np.zeros((len(df), len(factors)))
+    neg = np.zeros((len(df), len(factors)), dtype=bool)
+    for j, factor in enumerate(factors):
+        for i, text in enumerate(norm):
+            s, _, has_neg = score_text_against_factor(text, factor)
+            scores[i, j] = s * factor.weight * mult[i]
+            neg[i, j] = has_neg
+    return scores, neg
+
+
+def test_aho_corasick_scores_match_substring_scan(bundled_reviews, reg_factors):
+    expected, expected_neg = _reference_scores(bundled_reviews, reg_factors)
+    scored, factor_counts = compute_review_factor_scores(bundled_reviews, reg_factors, compute_top_per_review=False)
+
+    for j, f in enumerate(reg_factors):
+        np.testing.assert_array_equal(scored[f"score_f{f.factor_id}"].to_numpy(dtype=float), expected[:, j])
+    # factor_key 기준 컬럼/집계는 카테고리 간 같은 key면 뒤 factor가 덮어씀 (기존 동작)
+    last = {f.factor_key: j for j, f in enumerate(reg_factors)}
+    for key, j in last.items():
+        np.testing.assert_array_equal(scored[f"score_{key}"].to_numpy(dtype=float), expected[:, j])
+        np.testing.assert_array_equal(scored[f"has_neg_{key}"].to_numpy(dtype=bool), expected_neg[:, j])
+        assert factor_counts[key] == int((expected[:, j] > 0).sum())
+    assert expected.any() and expected_neg.any()  # fixture가 실제로 매칭/부정 표현을 포함
+
+
+def _reference_top3(dense, factor_keys):
+    """기존 구현: 리뷰마다 (factor, 점수)를 안정 정렬해 상위 3개 (동점은 factor 순서 유지)"""
+    top_tags, top_scores = [], []
+    for row in dense:
+        scored = list(zip(factor_keys, [float(v) if v else 0.0 for v in row]))
+        scored.sort(key=lambda x: x[1], reverse=True)
+        top_tags.append([k for k, v in scored[:3] if v > 0])
+        top_scores.append(scored[:3])
+    return top_tags, top_scores
+
+
+def test_top_k_per_review_keeps_stable_tie_break(bundled_reviews, reg_factors):
+    df, matrix = compute_score_matrix(bundled_reviews, reg_factors)
+    scored = attach_score_columns(df, matrix)
+    top_tags, top_scores = _reference_top3(matrix.to_dense(), matrix.factor_keys)
+    assert scored["top_factors"].tolist() == top_tags
+    assert scored["top_factor_scores"].tolist() == top_scores
+
+    # 동점이 많은 행렬 (청크 경계 포함)
+    rng = np.random.default_rng(0)
+    dense = rng.choice([0.0, 1.0, 1.3, 2.6], size=(64, 7))
+    keys = [f"k{j}" for j in range(7)]
+    m = ScoreMatrix.from_dense(dense, dense > 1, keys, list(range(7)))
+    idx, vals = m.top_k_per_review(k=3, chunk_size=5)
+    _, expected = _reference_top3(dense, keys)
+    assert [list(zip(np.array(keys)[i].tolist(), v.tolist())) for i, v in zip(idx, vals)] == expected
@@ -0,0 +1,55 @@
+"""문장 주석(SentenceIndex) 테스트 - 주석에서 만든 발췌문이 문장 분리/정규화 경로와 같은지"""
+import pandas as pd
+import pytest
+
+from backend.app.domain.rules.review.normalize import normalize_text
+from backend.app.domain.rules.review.retrieval import extract_relevant_sentences
+from backend.app.domain.rules.review.sentence_index import SentenceIndex, build_excerpt
+
+EXTRA_TEXTS = [
+    "소음이 커요.  밤에는 시끄러워요!\n\n크기는 1.5배 커요? 가격은 괜찮음",
+    "안 시끄럽고 조용해요。 소음 40dB！ 추천",
+    "SIZE가 큼!!!! 소음㏈ 측정... 배송 빠름",
+    "...",
+    "",
+]
+
+
+@pytest.fixture(scope="module")
+def texts(bundled_reviews):
+    values = bundled_reviews["text"].tolist() + EXTRA_TEXTS
+    return pd.Series(values, index=pd.RangeIndex(10, 10 + len(values)))
+
+
+@pytest.mark.parametrize("max_len", [160, 25])
+def test_annotation_excerpts_match_sentence_scan(texts, reg_factors, max_len):
+    for category in sorted({f.category for f in reg_factors}):
+        factors = [f for f in reg_factors if f.category == category]
+        index = SentenceIndex(texts, factors)
+        for label, text in texts.items():
+            text = text if isinstance(text, str) else ""
+            norm = normalize_text(text)
+            for f in factors:
+                expected = extract_relevant_sentences(text, f, max_len)
+                assert extract_relevant_sentences(text, f, max_len, norm_text=norm) == expected
+                got = extract_relevant_sentences(text, f, max_len, annotation=index.annotation(label))
+                assert got == expected, (category, label, f.factor_key)
+        assert len(index) == len(texts)  # 리뷰당 한 번만 주석
+
+
+def test_excerpt_highlights_point_at_terms(texts, reg_factors):
+    factors = [f for f in reg_factors if f.category == "coffee_machine"]
+    index = SentenceIndex(texts, factors)
+    checked = 0
+    for label in texts.index:
+        ann = index.annotation(label)
+        for f in factors:
+            terms = list(f.anchor_terms) + list(f.context_terms)
+            excerpt, highlights = build_excerpt(ann, terms, max_len=80)
+            lowered = excerpt.lower()
+            for h in highlights:
+                assert h["end"] <= 80
+                assert lowered[h["start"]:h["end"]] == h["term"]
+                checked += 1
+            assert highlights == sorted(highlights, key=lambda h: (h["start"], h["end"]))
+    assert checked > 0
@@ -0,0 +1,127 @@
+"""세션 코덱 / 공유 세션 백엔드(SQLite, Redis) 테스트"""
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+
+from backend.app.infra.persistence.session_backend import RedisSessionBackend, SQLiteSessionBackend
+from backend.app.infra.persistence.session_codec import decode_session_state, encode_session_state
+from backend.app.services.product_analysis import ProductAnalysis, get_product_analysis_cache
+
+
+def _analysis(key: str = "snapshot-key-1") -> ProductAnalysis:
+    return ProductAnalysis(
+        key=key,
+        category="electronics_coffee_machine",
+        category_name="커피머신",
+        product_name="테스트 커피머신",
+        normalized_df=pd.DataFrame({"text": ["a"]}),
+        scored_df=pd.DataFrame({"text": ["a"]}),
+        score_matrix=None,
+        factors=(),
+        top_factors=(("noise", 1.0),),
+        evidence_postings=None,
+        sentence_index=None,
+        suggested_factors=(),
+    )
+
+
+def _session_state(analysis: ProductAnalysis, turns: int = 1) -> dict:
+    return {
+        "analysis": analysis,
+        "category": analysis.category,
+        "product_name": analysis.product_name,
+        "dialogue_history": [{"role": "user", "message": f"소음이 걱정돼요 {i}"} for i in range(turns)],
+        "question_history": [{"question_id": "q1", "answer": "네", "factor_key": "noise"}],
+        "asked_questions_state": {"graph": object()},  # TRANSIENT - 저장하지 않음
+    }
+
+
+# ----------------------------- 코덱 -----------------------------
+
+@pytest.mark.parametrize("turns", [1, 50])  # 작은 상태(JSON 그대로) / 큰 상태(zlib 압축)
+def test_codec_round_trip_keeps_dialogue_and_stores_analysis_ref(turns):
+    analysis = _analysis()
+    blob = encode_session_state(_session_state(analysis, turns))
+    assert blob[:1] == (b"z" if turns > 1 else b"j")
+
+    state = decode_session_state(blob)
+
+    assert state["analysis_ref"] == analysis.session_ref()
+    assert "analysis" not in state
+    assert "asked_questions_state" not in state
+    assert state["dialogue_history"] == _session_state(analysis, turns)["dialogue_history"]
+    assert state["question_history"][0]["factor_key"] == "noise"
+
+
+def test_codec_rejects_unknown_format():
+    assert decode_session_state(b"x{}") is None
+    assert decode_session_state(b'j{"_v": 999}') is None
+
+
+def test_load_session_resolves_analysis_ref_from_shared_cache(tmp_path, monkeypatch):
+    from backend.app.api.routers import review
+
+    analysis = _analysis("snapshot-key-resolve")
+    cache = get_product_analysis_cache()
+    cache.get_or_build(analysis.key, lambda: analysis)
+
+    backend = SQLiteSessionBackend(tmp_path / "sessions.db")
+    monkeypatch.setattr(review, "get_session_backend", lambda: backend)
+    backend.save("session-test-1", _session_state(analysis))
+
+    state = asyncio.run(review._load_session("session-test-1", service=None))
+
+    assert state["analysis"] is analysis
+    assert "analysis_ref" not in state
+    backend.close()
+
+
+# ----------------------------- SQLite -----------------------------
+
+def test_sqlite_session_saved_by_one_worker_loads_in_another(tmp_path):
+    path = tmp_path / "sessions.db"
+    worker_a = SQLiteSessionBackend(path)
+    worker_b = SQLiteSessionBackend(path)
+
+    worker_a.save("session-1", _session_state(_analysis()))
+    state = worker_b.load("session-1")
+    assert state["analysis_ref"]["key"] == "snapshot-key-1"
+
+    state["question_history"].append({"question_id": "q2", "answer": "아니오", "factor_key": "noise"})
+    worker_b.save("session-1", state)
+    assert len(worker_a.load("session-1")["question_history"]) == 2
+
+    worker_a.delete("session-1")
+    assert worker_b.load("session-1") is None
+    worker_a.close()
+    worker_b.close()
+
+
+def test_sqlite_session_expires_after_ttl(tmp_path):
+    backend = SQLiteSessionBackend(tmp_path / "sessions.db", ttl_seconds=0.05)
+    backend.save("session-1", {"category": "x"})
+    assert backend.load("session-1") == {"category": "x"}
+    time.sleep(0.1)
+    assert backend.load("session-1") is None
+    backend.close()
+
+
+# ----------------------------- Redis (fakeredis) -----------------------------
+
+def test_redis_session_shared_between_clients():
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    worker_a = RedisSessionBackend(fakeredis.FakeRedis(server=server), ttl_seconds=60)
+    worker_b = RedisSessionBackend(fakeredis.FakeRedis(server=server), ttl_seconds=60)
+
+    worker_a.save("session-1", _session_state(_analysis()))
+    state = worker_b.load("session-1")
+
+    assert state["analysis_ref"]["product_name"] == "테스트 커피머신"
+    assert "asked_questions_state" not in state
+    assert 0 < worker_b.client.ttl(worker_b.prefix + "session-1") <= 60
+
+    worker_b.delete("session-1")
+    assert worker_a.load("session-1") is None
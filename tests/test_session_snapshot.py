@@ -0,0 +1,112 @@
+"""세션 스냅샷 로그 테스트 (append-only 저장, lazy 색인/복원, 압축, 끊긴 꼬리 레코드, 단일 writer 잠금)"""
+import pytest
+
+from backend.app.infra.cache.session_store import SessionStore
+from backend.app.infra.persistence import session_snapshot
+from backend.app.infra.persistence.session_backend import InMemorySessionBackend
+from backend.app.infra.persistence.session_snapshot import SessionSnapshotLog, SnapshotLogLocked
+
+
+def _state(i: int) -> dict:
+    return {"category": "coffee_machine", "dialogue_history": [{"role": "user", "message": f"답변 {i}"}]}
+
+
+def _write(path, **kwargs) -> None:
+    log = SessionSnapshotLog(path, **kwargs)
+    log.append("s1", _state(1))
+    log.append("s2", _state(2))
+    log.append("s1", _state(3))   # s1 덮어쓰기
+    log.append("s3", _state(4))
+    log.delete("s3")
+    log.close()
+
+
+def test_reopened_log_restores_latest_state_lazily(tmp_path):
+    path = tmp_path / "sessions.log"
+    _write(path)
+
+    log = SessionSnapshotLog(path)
+    assert log._index is None  # 열 때는 아무것도 읽지 않음
+    assert log.load("s1") == _state(3)
+    assert log._index is not None
+    assert log.load("s2") == _state(2)
+    assert log.load("s3") is None and log.load("missing") is None
+    assert len(log) == 2
+    log.close()
+
+
+def test_memory_backend_restores_session_from_snapshot_on_first_access(tmp_path):
+    path = tmp_path / "sessions.log"
+    _write(path)
+
+    backend = InMemorySessionBackend(SessionStore("test_snapshot_restore"), snapshot=SessionSnapshotLog(path))
+    assert backend.store.get("s1") is None
+    assert backend.load("s1") == _state(3)
+    assert backend.store.get("s1") == _state(3)  # 이후 조회는 메모리에서
+    backend.close()
+
+
+def test_compaction_keeps_only_latest_records(tmp_path):
+    def fill(path, compact_min_bytes):
+        log = SessionSnapshotLog(path, compact_min_bytes=compact_min_bytes)
+        for i in range(50):
+            log.append("s1", _state(i))
+        log.append("s2", _state(100))
+        log.close()
+
+    fill(tmp_path / "full.log", compact_min_bytes=1 << 30)
+    path = tmp_path / "sessions.log"
+    fill(path, compact_min_bytes=1)
+
+    assert path.stat().st_size * 5 < (tmp_path / "full.log").stat().st_size
+    log = SessionSnapshotLog(path)
+    assert log.load("s1") == _state(49)
+    assert log.load("s2") == _state(100)
+    assert len(log) == 2
+    log.close()
+
+
+def test_truncated_last_record_is_cut_and_log_stays_writable(tmp_path):
+    path = tmp_path / "sessions.log"
+    _write(path)
+    log = SessionSnapshotLog(path)
+    log.append("s1", _state(5))
+    log.close()
+    good_size = path.stat().st_size
+    with open(path, "r+b") as f:  # 마지막 레코드(s1 = 5)를 쓰다가 끊긴 상태
+        f.truncate(good_size - 3)
+
+    log = SessionSnapshotLog(path)
+    assert log.load("s1") == _state(3)  # 끊긴 레코드 이전 상태
+    assert log.load("s2") == _state(2)
+    assert path.stat().st_size < good_size - 3  # 끊긴 꼬리는 잘라냄
+    log.append("s1", _state(6))
+    log.close()
+
+    log = SessionSnapshotLog(path)
+    assert log.load("s1") == _state(6)
+    log.close()
+
+
+@pytest.mark.skipif(session_snapshot.fcntl is None, reason="flock 미지원 플랫폼")
+def test_second_writer_is_rejected_until_first_closes(tmp_path):
+    path = tmp_path / "sessions.log"
+    first = SessionSnapshotLog(path)
+    with pytest.raises(SnapshotLogLocked):
+        SessionSnapshotLog(path)
+    first.close()
+    SessionSnapshotLog(path).close()
+
+
+@pytest.mark.skipif(session_snapshot.fcntl is None, reason="flock 미지원 플랫폼")
+def test_memory_backend_falls_back_without_snapshot_when_log_is_locked(tmp_path, monkeypatch):
+    from backend.app.infra.persistence import session_backend
+
+    path = tmp_path / "sessions.log"
+    monkeypatch.setattr(session_backend.settings, "SESSION_SNAPSHOT_PATH", str(path))
+    owner = session_backend.create_session_backend("memory", store_name="test_snapshot_owner")
+    other = session_backend.create_session_backend("memory", store_name="test_snapshot_other")
+
+    assert owner.snapshot is not None
+    assert other.snapshot is None and other.blocking_io is False
+    owner.close()
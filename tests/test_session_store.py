@@ -0,0 +1,120 @@
+"""세션 저장소 테스트 (LRU 순서, 유휴 TTL, 메모리 상한 내보내기, 메트릭)"""
+import types
+
+import numpy as np
+import pytest
+
+from backend.app.infra.cache import session_store
+from backend.app.infra.cache.session_store import SessionStore, estimate_size
+from backend.app.infra.observability.metrics import REGISTRY
+
+
+def _evictions(store: SessionStore, reason: str) -> float:
+    return REGISTRY.get_sample_value("session_store_evictions_total", {"store": store.name, "reason": reason}) or 0.0
+
+
+def _gauges(store: SessionStore):
+    labels = {"store": store.name}
+    return REGISTRY.get_sample_value("session_store_entries", labels), REGISTRY.get_sample_value("session_store_bytes", labels)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """session_store가 보는 time.monotonic을 수동 시계로"""
+    now = [1000.0]
+    monkeypatch.setattr(session_store, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def _blob(n: int = 1000) -> np.ndarray:
+    return np.zeros(n)
+
+
+def test_lru_evicts_least_recently_used():
+    store = SessionStore("test-lru", max_entries=3)
+    before = _evictions(store, "lru")
+    for key in "abc":
+        store[key] = {"key": key}
+
+    assert store["a"] == {"key": "a"}  # 조회는 최근 사용으로 갱신
+    assert "b" in store                # 존재 확인은 순서를 바꾸지 않음
+    store["d"] = {"key": "d"}
+
+    assert list(store) == ["c", "a", "d"]
+    assert store.get("b") is None
+    store["c"] = {"key": "c2"}  # 덮어쓰기도 최근 사용
+    store["e"] = {"key": "e"}
+    assert list(store) == ["d", "c", "e"]
+    assert _evictions(store, "lru") - before == 2
+    assert _gauges(store) == (3, store.stats()["bytes"])
+
+
+def test_idle_ttl_expires_on_access_and_sweep(clock):
+    store = SessionStore("test-ttl", ttl_seconds=10)
+    before = _evictions(store, "ttl")
+    store["a"] = _blob()
+    clock[0] += 5
+    store["b"] = _blob()
+    store["c"] = _blob()
+    clock[0] += 4
+    assert store.get("a") is not None  # 9초 유휴 → 유지, 접근 시각 갱신
+
+    clock[0] += 7  # a 7초, b/c 11초 유휴
+    assert "b" not in store
+    with pytest.raises(KeyError):
+        store["b"]
+    assert store.sweep() == 1  # c (b는 조회 때 이미 정리)
+    assert list(store) == ["a"]
+    assert store.stats()["bytes"] == estimate_size(_blob())
+    assert _evictions(store, "ttl") - before == 2
+
+    clock[0] += 11
+    store["d"] = _blob()  # 저장할 때도 만료 세션 정리
+    assert list(store) == ["d"]
+
+
+def test_byte_budget_evicts_oldest_and_keeps_newest():
+    size = estimate_size(_blob())
+    store = SessionStore("test-bytes", max_bytes=int(size * 2.5))
+    before = _evictions(store, "bytes")
+    for key in "abc":
+        store[key] = _blob()
+    assert list(store) == ["b", "c"]
+
+    store.get("b")
+    store["d"] = _blob()
+    assert list(store) == ["b", "d"]
+    assert store.stats()["bytes"] == 2 * size
+
+    # 상한보다 큰 세션 하나는 남긴다 (방금 저장한 세션은 내보내지 않음)
+    store["big"] = _blob(4000)
+    assert list(store) == ["big"]
+    assert store.stats()["bytes"] == estimate_size(_blob(4000))
+    assert _evictions(store, "bytes") - before == 4
+    assert _gauges(store) == (1, store.stats()["bytes"])
+
+
+def test_refresh_size_applies_budget_to_grown_session():
+    size = estimate_size({"df": _blob()})
+    store = SessionStore("test-refresh", max_bytes=size * 3)
+    for key in "abc":
+        store[key] = {"df": _blob()}
+
+    store["b"]["index"] = _blob(500)  # 세션 데이터가 제자리에서 불어남
+    store.refresh_size("b")
+
+    assert list(store) == ["c", "b"]
+    assert store.stats()["bytes"] == estimate_size(store["c"]) + estimate_size(store["b"])
+
+
+def test_pop_and_delete_release_bytes():
+    store = SessionStore("test-pop")
+    store["a"] = _blob()
+    store["b"] = _blob()
+    assert store.pop("a") is not None
+    assert store.pop("a", "missing") == "missing"
+    del store["b"]
+    with pytest.raises(KeyError):
+        del store["b"]
+    assert store.stats()["bytes"] == 0
+    assert _gauges(store) == (0, 0)